@@ -0,0 +1,129 @@
+#! /usr/bin/env python3
+
+"""
+call_overhead.py - Measure the Python overhead SzEngineCore adds to each call in to the Senzing library.
+
+SzEngineCore is given a stand-in for the Senzing library whose C functions return immediately, so the timings are
+entirely SDK overhead: decorators, argument conversion, return code checks, response conversion and freeing. For each
+method three timings are reported:
+
+- native: calling the stand-in C function directly, the floor.
+- sdk_method: the SzEngineCore method as shipped, a single sdk_method wrapper.
+- stacked: the same method body wrapped by check_is_destroyed and catch_sdk_exceptions, as previously.
+
+The response handling section compares response_as_str() with the FreeCResources context manager it replaced.
+Doesn't require the Senzing library.
+
+Usage:
+
+    python benchmarks/call_overhead.py [--iterations 200000]
+"""
+
+import argparse
+import json
+import timeit
+from ctypes import POINTER, c_char, cast, create_string_buffer
+from functools import partial
+from typing import Any, Callable, Dict, Tuple
+
+from senzing import SzEngineFlags
+
+from senzing_core import SzEngineCore, szengine
+from senzing_core._helpers import (
+    FreeCResources,
+    as_python_str,
+    catch_sdk_exceptions,
+    check_is_destroyed,
+    response_as_str,
+)
+
+RESPONSE = json.dumps({"RESOLVED_ENTITY": {"ENTITY_ID": 1, "ENTITY_NAME": "Robert Smith"}}).encode()
+
+# Method name: (C function name, args)
+CASES: Dict[str, Tuple[str, Tuple[Any, ...]]] = {
+    "add_record": ("Sz_addRecord", ("CUSTOMERS", "1001", '{"NAME_FULL": "BOB SMITH"}')),
+    "get_entity_by_entity_id": ("Sz_getEntityByEntityID_V2_helper", (1,)),
+    "get_entity_by_record_id": ("Sz_getEntityByRecordID_V2_helper", ("CUSTOMERS", "1001")),
+    "get_record": ("Sz_getRecord_V2_helper", ("CUSTOMERS", "1001")),
+    "search_by_attributes": ("Sz_searchByAttributes_V3_helper", ('{"NAME_FULL": "BOB SMITH"}',)),
+    "why_entities": ("Sz_whyEntities_V2_helper", (1, 2)),
+    "find_path_by_entity_id": ("Sz_findPathByEntityID_V2_helper", (1, 2, 3)),
+}
+
+
+class FakeLibrary:
+    """Stand-in for the Senzing library, C functions return a shared successful result immediately."""
+
+    def __init__(self) -> None:
+        self.buffer = create_string_buffer(RESPONSE)
+        self.result = szengine.SzResponseReturnCodeResult(cast(self.buffer, POINTER(c_char)), 0)
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        # Cache the function as an attribute, as CDLL does, so later lookups don't come through __getattr__
+        function = self.helper if name.endswith("_helper") else self.no_op
+        setattr(self, name, function)
+        return function
+
+    def helper(self, *_: Any) -> Any:
+        """Stand-in for the C functions returning a response and return code."""
+        return self.result
+
+    @staticmethod
+    def no_op(*_: Any) -> int:
+        """Stand-in for the C functions returning a return code and SzHelper_free()."""
+        return 0
+
+
+def per_call_ns(func: Callable[[], Any], iterations: int) -> float:
+    """Return the best of 5 timings of func, in nanoseconds per call."""
+    return min(timeit.repeat(func, number=iterations, repeat=5)) / iterations * 1e9
+
+
+def method_overhead(sz_engine: SzEngineCore, fake_library: FakeLibrary, iterations: int) -> None:
+    """Report the overhead of each SzEngineCore method in CASES."""
+    print(f"{'method':<26}{'native (ns)':>13}{'sdk_method (ns)':>17}{'stacked (ns)':>14}{'saved (ns)':>12}")
+    for method_name, (function_name, args) in CASES.items():
+        native_function = getattr(fake_library, function_name)
+        method = getattr(sz_engine, method_name)
+        stacked = partial(check_is_destroyed(catch_sdk_exceptions(method.__wrapped__)), sz_engine)
+
+        native = per_call_ns(lambda: native_function(*args), iterations)  # pylint: disable=cell-var-from-loop
+        current = per_call_ns(lambda: method(*args), iterations)  # pylint: disable=cell-var-from-loop
+        previous = per_call_ns(lambda: stacked(*args), iterations)  # pylint: disable=cell-var-from-loop
+        print(f"{method_name:<26}{native:>13.0f}{current:>17.0f}{previous:>14.0f}{previous - current:>12.0f}")
+
+
+def response_overhead(sz_engine: SzEngineCore, fake_library: FakeLibrary, iterations: int) -> None:
+    """Report the cost of response_as_str() against the FreeCResources context manager."""
+    check_result = sz_engine._check_result  # pylint: disable=protected-access
+    result = fake_library.result
+
+    def with_free_c_resources() -> str:
+        with FreeCResources(fake_library, result.response):  # type: ignore[arg-type]
+            check_result(result.return_code)
+            return as_python_str(result.response)
+
+    previous = per_call_ns(with_free_c_resources, iterations)
+    current = per_call_ns(lambda: response_as_str(fake_library.no_op, check_result, result), iterations)
+    print()
+    print(f"{'response handling':<26}{'response_as_str (ns)':>22}{'FreeCResources (ns)':>21}")
+    print(f"{'':<26}{current:>22.0f}{previous:>21.0f}")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", default=200_000, type=int, help="calls per timing")
+    args = parser.parse_args()
+
+    fake_library = FakeLibrary()
+    szengine.get_sz_library = lambda _: fake_library  # type: ignore[assignment,return-value]
+    sz_engine = SzEngineCore()
+    assert sz_engine.get_entity_by_entity_id(1, SzEngineFlags.SZ_ENTITY_DEFAULT_FLAGS) == RESPONSE.decode()
+
+    method_overhead(sz_engine, fake_library, args.iterations)
+    response_overhead(sz_engine, fake_library, args.iterations)
+
+
+if __name__ == "__main__":
+    main()
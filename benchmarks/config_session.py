@@ -0,0 +1,77 @@
+#! /usr/bin/env python3
+
+"""
+config_session.py - Compare registering many data sources one call at a time, in a session and in bulk.
+
+Outside a session each register_data_source() loads the whole configuration, changes it, exports it and closes it.
+Within SzConfigCore.session() the configuration stays loaded and is exported once, when the session ends.
+SzConfigCore.register_data_sources() does the same in a single call. Requires the Senzing library to be loadable and
+SENZING_ENGINE_CONFIGURATION_JSON, or the default settings, to be usable.
+
+Usage:
+
+    python benchmarks/config_session.py [--data-sources 500]
+"""
+
+import argparse
+import json
+import os
+import time
+
+from senzing_core import SzConfigCore
+
+DEFAULT_SETTINGS = {
+    "PIPELINE": {
+        "CONFIGPATH": "/etc/opt/senzing",
+        "RESOURCEPATH": "/opt/senzing/er/resources",
+        "SUPPORTPATH": "/opt/senzing/data",
+    },
+    "SQL": {"CONNECTION": "sqlite3://na:na@/tmp/sqlite/G2C.db"},
+}
+
+
+def new_sz_config() -> SzConfigCore:
+    """Return an SzConfigCore holding the default template."""
+    result = SzConfigCore()
+    result._initialize(  # pylint: disable=protected-access
+        "config_session benchmark",
+        os.environ.get("SENZING_ENGINE_CONFIGURATION_JSON", json.dumps(DEFAULT_SETTINGS)),
+    )
+    result.import_template()
+    return result
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--data-sources", default=500, type=int, help="number of data sources to register")
+    args = parser.parse_args()
+    data_source_codes = [f"DATA_SOURCE_{i}" for i in range(args.data_sources)]
+
+    sz_config = new_sz_config()
+    start = time.perf_counter()
+    for data_source_code in data_source_codes:
+        sz_config.register_data_source(data_source_code)
+    per_call = time.perf_counter() - start
+    per_call_config_definition = sz_config.export()
+
+    sz_config = new_sz_config()
+    start = time.perf_counter()
+    with sz_config.session():
+        for data_source_code in data_source_codes:
+            sz_config.register_data_source(data_source_code)
+    session = time.perf_counter() - start
+    assert json.loads(sz_config.export()) == json.loads(per_call_config_definition)
+
+    sz_config = new_sz_config()
+    start = time.perf_counter()
+    sz_config.register_data_sources(data_source_codes)
+    bulk = time.perf_counter() - start
+    assert json.loads(sz_config.export()) == json.loads(per_call_config_definition)
+
+    print(f"{'data sources':<14}{'per call (s)':>14}{'session (s)':>13}{'bulk (s)':>10}")
+    print(f"{args.data_sources:<14}{per_call:>14.3f}{session:>13.3f}{bulk:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
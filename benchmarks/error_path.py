@@ -0,0 +1,104 @@
+#! /usr/bin/env python3
+
+"""
+error_path.py - Measure the throughput of SDK methods called with bad input.
+
+During a bad-input storm, e.g. a malformed feed, every call raises an SzSdkError describing the method and the
+arguments it accepts. That description is now computed once, when the method is decorated. For comparison the
+"per error" timings use the previous catch_sdk_exceptions, which built the description on each error. SzEngineCore is
+given the stand-in Senzing library from call_overhead.py, doesn't require the Senzing library.
+
+Usage:
+
+    python benchmarks/error_path.py [--iterations 100000]
+"""
+
+import argparse
+import timeit
+from contextlib import suppress
+from ctypes import ArgumentError
+from functools import partial, wraps
+from typing import Any, Callable, Dict, Tuple
+
+from call_overhead import FakeLibrary
+from senzing import SzSdkError
+
+from senzing_core import SzEngineCore, szengine
+
+# Method name: bad args
+CASES: Dict[str, Tuple[Any, ...]] = {
+    "add_record": ("CUSTOMERS", "1001", "{}", "not flags"),
+    "find_network_by_entity_id": ("not a list", 1, 0, 0),
+    "find_network_by_record_id": ([("CUSTOMERS", 1001)], 1, 0, 0),
+    "find_path_by_entity_id": (1, 2, 1, "not a list"),
+}
+
+
+def per_error_catch_sdk_exceptions(func_to_decorate: Callable[..., Any]) -> Callable[..., Any]:
+    """catch_sdk_exceptions as it was, building the method signature on every error."""
+
+    @wraps(func_to_decorate)
+    def wrapped_func(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return func_to_decorate(*args, **kwargs)
+        except (ArgumentError, TypeError, ValueError) as err:
+            annotations_dict = dict(func_to_decorate.__annotations__)
+            with suppress(KeyError):
+                del annotations_dict["return"]
+                del annotations_dict["kwargs"]
+
+            func_signature = ", ".join(
+                [
+                    f"{name}: {type if isinstance(type, str) else type.__name__}"
+                    for name, type in annotations_dict.items()
+                ]
+            )
+
+            method_and_signature = f"{func_to_decorate.__module__}.{func_to_decorate.__name__}({func_signature})"
+            append_err_msg = f" - expected: {method_and_signature}"
+
+            arg_0 = err.args[0]
+            if " missing " in err.args[0] and " required positional argument" in err.args[0]:
+                arg_0 = " ".join(err.args[0].split()[1:])
+            new_arg_0 = f"calling {method_and_signature}" if not err.args else f"{arg_0}{append_err_msg}"
+            err.args = (new_arg_0,) + err.args[1:]
+
+            raise SzSdkError(err) from err
+
+    return wrapped_func
+
+
+def errors_per_second(func: Callable[..., Any], args: Tuple[Any, ...], iterations: int) -> float:
+    """Return the best of 5 timings of calls to func, that raise SzSdkError, in calls per second."""
+
+    def call() -> None:
+        try:
+            func(*args)
+        except SzSdkError:
+            pass
+
+    return iterations / min(timeit.repeat(call, number=iterations, repeat=5))
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", default=100_000, type=int, help="calls per timing")
+    args = parser.parse_args()
+
+    fake_library = FakeLibrary()
+    szengine.get_sz_library = lambda _: fake_library  # type: ignore[assignment,return-value]
+    sz_engine = SzEngineCore()
+
+    print(f"{'method':<28}{'precomputed (errors/s)':>24}{'per error (errors/s)':>22}{'speedup':>10}")
+    for method_name, bad_args in CASES.items():
+        method = getattr(sz_engine, method_name)
+        per_error = partial(per_error_catch_sdk_exceptions(method.__wrapped__), sz_engine)
+
+        after = errors_per_second(method, bad_args, args.iterations)
+        before = errors_per_second(per_error, bad_args, args.iterations)
+        print(f"{method_name:<28}{after:>24,.0f}{before:>22,.0f}{after / before:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
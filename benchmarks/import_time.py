@@ -0,0 +1,91 @@
+#! /usr/bin/env python3
+
+"""
+import_time.py - Measure the time taken to import senzing_core in a fresh interpreter.
+
+Each sample runs a new Python process so module caches don't skew the result. The senzing package senzing_core
+depends on is imported before timing starts, so only senzing_core's own import is measured. Three measurements are
+reported:
+
+- import: ``import senzing_core``, which no longer loads or initializes the Senzing library or imports the
+  monitoring and process pool add-ons.
+- import + add-ons: ``import senzing_core`` followed by importing the add-ons loaded on first use.
+- import + version check: ``import senzing_core`` followed by the Senzing binary version check that used to run at
+  import and now runs on the first SzAbstractFactoryCore creation. Skipped if the Senzing library can't be loaded.
+
+Usage:
+
+    python benchmarks/import_time.py [--samples 20]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import List, Optional
+
+IMPORT_ONLY = """
+import time
+import senzing
+start = time.perf_counter_ns()
+import senzing_core
+print(time.perf_counter_ns() - start)
+"""
+
+IMPORT_AND_ADD_ONS = """
+import time
+import senzing
+start = time.perf_counter_ns()
+import senzing_core
+for name in senzing_core.__all__:
+    getattr(senzing_core, name)
+print(time.perf_counter_ns() - start)
+"""
+
+IMPORT_AND_VERSION_CHECK = """
+import time
+import senzing
+start = time.perf_counter_ns()
+import senzing_core
+from senzing_core.szabstractfactory import _check_senzing_binary_version
+_check_senzing_binary_version()
+print(time.perf_counter_ns() - start)
+"""
+
+
+def sample(code: str, samples: int) -> Optional[List[float]]:
+    """Run code in a new interpreter samples times, return the elapsed milliseconds or None if it failed."""
+    result = []
+    for _ in range(samples):
+        completed = subprocess.run([sys.executable, "-c", code], capture_output=True, check=False, text=True)
+        if completed.returncode != 0:
+            print(completed.stderr.strip().splitlines()[-1], file=sys.stderr)
+            return None
+        result.append(int(completed.stdout.strip()) / 1_000_000)
+    return result
+
+
+def report(name: str, timings: Optional[List[float]]) -> None:
+    """Print the median, min and max of timings."""
+    if timings is None:
+        print(f"{name:<26} skipped")
+        return
+    print(
+        f"{name:<26} median {statistics.median(timings):8.2f} ms"
+        f"  min {min(timings):8.2f} ms  max {max(timings):8.2f} ms"
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--samples", default=20, type=int, help="number of interpreters to start per measurement")
+    args = parser.parse_args()
+
+    report("import", sample(IMPORT_ONLY, args.samples))
+    report("import + add-ons", sample(IMPORT_AND_ADD_ONS, args.samples))
+    report("import + version check", sample(IMPORT_AND_VERSION_CHECK, args.samples))
+
+
+if __name__ == "__main__":
+    main()
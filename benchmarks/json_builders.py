@@ -0,0 +1,157 @@
+#! /usr/bin/env python3
+
+"""
+json_builders.py - Compare the single-pass entity, record and data source JSON builders with the multi-pass builders
+they replaced.
+
+The builders now validate and collect the input in one pass and encode it with a single call to orjson, or json when
+orjson isn't installed. The previous builders are reproduced below as they were. For an array("q") of entity ids the
+previous builder is timed including the conversion to a list it required. Doesn't require the Senzing library.
+
+Usage:
+
+    python benchmarks/json_builders.py [--sizes 10 1000 10000]
+"""
+
+import argparse
+import json
+import timeit
+from array import array
+from typing import Any, Callable, List, Tuple, Union
+
+from senzing_core._helpers import (
+    JSON_LIB,
+    build_data_sources_json,
+    build_entities_json,
+    build_records_json,
+    escape_json_str,
+)
+
+# -----------------------------------------------------------------------------
+# Previous builders
+# -----------------------------------------------------------------------------
+
+
+def previous_build_data_sources_json(dsrc_codes: List[str]) -> str:
+    """build_data_sources_json() as it was."""
+    if not isinstance(dsrc_codes, list):
+        raise TypeError(f"value {dsrc_codes} has type {type(dsrc_codes).__name__}, should be a list")
+
+    if not all(isinstance(d, str) for d in dsrc_codes):
+        element_types_str = ", ".join({type(t).__name__ for t in dsrc_codes if not isinstance(t, str)})
+        raise TypeError(f"elements in {dsrc_codes} should be str(s), there are {element_types_str}")
+
+    dsrcs_str = ", ".join([f"{escape_json_str(code)}" for code in dsrc_codes])
+
+    return f'{{"DATA_SOURCES": [{dsrcs_str}]}}'
+
+
+def previous_build_entities_json(entity_ids: Union[List[int], None]) -> str:
+    """build_entities_json() as it was."""
+    if not entity_ids or (isinstance(entity_ids, list) and len(entity_ids) == 0):
+        return ""
+
+    if not isinstance(entity_ids, list):
+        raise TypeError(f"value {entity_ids} has type {type(entity_ids).__name__}, should be a list of int(s)")
+
+    if not all(isinstance(e, int) for e in entity_ids):
+        element_types_str = ", ".join({type(t).__name__ for t in entity_ids if not isinstance(t, int)})
+        raise TypeError(f"elements in {entity_ids} should be int(s), there are {element_types_str}")
+
+    eids_str = ", ".join([f'{{"ENTITY_ID": {id}}}' for id in entity_ids])
+
+    return f'{{"ENTITIES": [{eids_str}]}}'
+
+
+def previous_build_records_json(record_keys: Union[List[Tuple[str, str]], None]) -> str:
+    """build_records_json() as it was."""
+    if not record_keys or (isinstance(record_keys, list) and len(record_keys) == 0):
+        return ""
+
+    record_keys_with_elements = [record_key for record_key in record_keys if record_key]
+    wrong_types = set()
+
+    if not all(isinstance(e, tuple) for e in record_keys_with_elements):
+        element_types_str = ", ".join({type(t).__name__ for t in record_keys_with_elements if not isinstance(t, tuple)})
+        raise TypeError(f"elements in {record_keys} should be tuple(s), there are {element_types_str}")
+
+    if not all({len(e) == 2 for e in record_keys_with_elements}):
+        element_len_str = ", ".join({str(len(t)) for t in record_keys_with_elements})
+        raise TypeError(f"tuple(s) length in {record_keys} should be 2, there are lengths(s) of {element_len_str}")
+
+    if rk_wrong_types := [
+        record_key
+        for record_key in record_keys_with_elements
+        if not isinstance(record_key[0], str) or not isinstance(record_key[1], str)
+    ]:
+        wrong_types = {(type(w[0]).__name__, type(w[1]).__name__) for w in rk_wrong_types}
+
+    if wrong_types:
+        wrong_types_str = ", ".join({f"({wt[0]}, {wt[1]})" for wt in wrong_types})
+        raise TypeError(f"tuple(s) types in {record_keys} should be (str, str), there are {wrong_types_str}")
+
+    records = ", ".join(
+        [
+            f'{{"DATA_SOURCE": {escape_json_str(data_source)}, "RECORD_ID": {escape_json_str(record_id)}}}'
+            for data_source, record_id in record_keys_with_elements
+        ]
+    )
+
+    return f'{{"RECORDS": [{records}]}}'
+
+
+# -----------------------------------------------------------------------------
+# Benchmark
+# -----------------------------------------------------------------------------
+
+
+def per_call_us(func: Callable[[Any], str], value: Any) -> float:
+    """Return the best of 5 timings of func(value), in microseconds per call."""
+    number = max(1, 100_000 // max(1, len(value)))
+    return min(timeit.repeat(lambda: func(value), number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default=[10, 1_000, 10_000], nargs="+", type=int, help="number of elements")
+    args = parser.parse_args()
+
+    print(f"JSON library: {JSON_LIB}")
+    print(f"{'builder':<26}{'elements':>10}{'current (us)':>14}{'previous (us)':>15}{'speedup':>10}")
+    for size in args.sizes:
+        cases: Tuple[Tuple[str, Callable[[Any], str], Callable[[Any], str], Any], ...] = (
+            (
+                "build_data_sources_json",
+                build_data_sources_json,
+                previous_build_data_sources_json,
+                [f"DATA_SOURCE_{i}" for i in range(size)],
+            ),
+            (
+                "build_entities_json",
+                build_entities_json,
+                previous_build_entities_json,
+                list(range(100_001, 100_001 + size)),
+            ),
+            (
+                "build_entities_json array",
+                build_entities_json,
+                lambda entity_ids: previous_build_entities_json(entity_ids.tolist()),
+                array("q", range(100_001, 100_001 + size)),
+            ),
+            (
+                "build_records_json",
+                build_records_json,
+                previous_build_records_json,
+                [("CUSTOMERS", f"{i:06}") for i in range(size)],
+            ),
+        )
+        for name, current_builder, previous_builder, value in cases:
+            assert json.loads(current_builder(value)) == json.loads(previous_builder(value))
+            current = per_call_us(current_builder, value)
+            previous = per_call_us(previous_builder, value)
+            print(f"{name:<26}{size:>10}{current:>14.1f}{previous:>15.1f}{previous / current:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
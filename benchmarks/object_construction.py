@@ -0,0 +1,67 @@
+#! /usr/bin/env python3
+
+"""
+object_construction.py - Measure the cost of constructing SDK objects.
+
+SDK objects share a process-wide handle to the Senzing library and each module declares its C function signatures
+once per process. For comparison the "per object" timings load the library and declare the signatures on every
+construction, as each SDK object's __init__ previously did. Requires the Senzing library to be loadable.
+
+Usage:
+
+    python benchmarks/object_construction.py [--iterations 10000]
+"""
+
+import argparse
+import timeit
+from typing import Any, Callable
+
+from senzing_core import (
+    SzConfigCore,
+    SzConfigManagerCore,
+    SzDiagnosticCore,
+    SzEngineCore,
+    SzProductCore,
+    szconfig,
+    szconfigmanager,
+    szdiagnostic,
+    szengine,
+    szproduct,
+)
+from senzing_core._helpers import load_sz_library
+
+CASES = (
+    (SzConfigCore, szconfig),
+    (SzConfigManagerCore, szconfigmanager),
+    (SzDiagnosticCore, szdiagnostic),
+    (SzEngineCore, szengine),
+    (SzProductCore, szproduct),
+)
+
+
+def per_object(sz_class: Callable[[], Any], module: Any) -> Callable[[], None]:
+    """Return a function that constructs sz_class the way it was before the shared library handle."""
+
+    def construct() -> None:
+        library_handle = load_sz_library()
+        module._declare_function_signatures(library_handle)  # pylint: disable=protected-access
+        sz_class()
+
+    return construct
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", default=10_000, type=int, help="objects constructed per measurement")
+    args = parser.parse_args()
+
+    print(f"{'class':<22}{'per object (us)':>18}{'shared (us)':>14}{'speedup':>10}")
+    for sz_class, module in CASES:
+        before = timeit.timeit(per_object(sz_class, module), number=args.iterations) / args.iterations
+        after = timeit.timeit(sz_class, number=args.iterations) / args.iterations
+        print(f"{sz_class.__name__:<22}{before * 1e6:>18.2f}{after * 1e6:>14.2f}{before / after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,20 @@
-try:
-    import json
+# NOTE - The Senzing binary version is checked when the first SzAbstractFactoryCore is created, not at import, so
+# NOTE - importing senzing_core doesn't load and initialize the Senzing library.
+from typing import TYPE_CHECKING, Any
 
-    from ._helpers import is_senzing_binary_version_supported
+try:
     from .szabstractfactory import (
         SzAbstractFactoryCore,
         SzAbstractFactoryParametersCore,
     )
     from .szconfig import SzConfigCore
     from .szconfigmanager import SzConfigManagerCore
+    from .szconfigwatcher import SzConfigWatcher
     from .szdiagnostic import SzDiagnosticCore
     from .szengine import SzEngineCore
+    from .szenginecoalescer import SzEngineCoalescer
+    from .szenginescheduler import SzEngineScheduler, SzPriority
     from .szproduct import SzProductCore
-
-    sz_product = SzProductCore()
-    sz_product._initialize("sdk_init_check", "{}")
-    version: str = json.loads(sz_product.get_version()).get("VERSION", "0.0.0")
-    is_senzing_binary_version_supported(version)
 except (ImportError, SyntaxError) as err:
     import sys
 
@@ -25,16 +24,61 @@ except (ImportError, SyntaxError) as err:
         SYS_VERSION = f"{sys.version_info.major}.{sys.version_info.minor}"
         raise SzSdkError(f"Current Python version {SYS_VERSION} doesn't meet the minimum requirement of 3.9") from err
     raise err
-finally:
-    if "sz_product" in locals():
-        sz_product._destroy()
+
+if TYPE_CHECKING:
+    from .szengineprocesspool import SzEngineProcessPool, SzEngineTimeoutError
+    from .szmemory import SzMemoryMonitor
+    from .szprometheus import SzPrometheusExporter
+    from .szresponsesizes import SzResponseSizeTracker
+    from .szslowcalllog import SzSlowCallLog
+    from .szstatssampler import SzStatsSampler
+
+# NOTE - The monitoring and process pool add-ons are imported on first use so importing senzing_core doesn't pay for
+# NOTE - them, or for multiprocessing and http.server, when they aren't used.
+# Name: module, for the add-ons imported on first use
+_LAZY_IMPORTS = {
+    "SzEngineProcessPool": ".szengineprocesspool",
+    "SzEngineTimeoutError": ".szengineprocesspool",
+    "SzMemoryMonitor": ".szmemory",
+    "SzPrometheusExporter": ".szprometheus",
+    "SzResponseSizeTracker": ".szresponsesizes",
+    "SzSlowCallLog": ".szslowcalllog",
+    "SzStatsSampler": ".szstatssampler",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module  # pylint: disable=import-outside-toplevel
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> Any:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     "SzAbstractFactoryCore",
     "SzAbstractFactoryParametersCore",
     "SzConfigCore",
     "SzConfigManagerCore",
+    "SzConfigWatcher",
     "SzDiagnosticCore",
+    "SzEngineCoalescer",
     "SzEngineCore",
+    "SzEngineProcessPool",
+    "SzEngineScheduler",
+    "SzEngineTimeoutError",
+    "SzMemoryMonitor",
+    "SzPriority",
     "SzProductCore",
+    "SzPrometheusExporter",
+    "SzResponseSizeTracker",
+    "SzSlowCallLog",
+    "SzStatsSampler",
 ]
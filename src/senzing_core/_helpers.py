@@ -7,10 +7,12 @@ SDK Helpers
 # NOTE - import is necessary - or string annotation ("_Pointer[c_char]") .
 from __future__ import annotations
 
+import operator
 import platform
 import threading
+import time
 from collections.abc import Callable
-from contextlib import suppress
+from contextlib import contextmanager
 from ctypes import (
     CDLL,
     POINTER,
@@ -27,11 +29,24 @@ from ctypes import (
 from ctypes.util import find_library
 from functools import wraps
 from types import TracebackType
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 from typing import cast as typing_cast
 
 from senzing import ENGINE_EXCEPTION_MAP, SzError, SzSdkError
 
+from . import _observers
+
 try:
     import orjson  # type: ignore[import-not-found, unused-ignore]
 
@@ -40,6 +55,9 @@ try:
     def _json_dumps(_obj: Any, *args: Any, **kwargs: Any) -> str:
         return orjson.dumps(_obj, *args, **kwargs).decode("utf-8")  # type: ignore[no-any-return, unused-ignore]
 
+    def _json_loads(_obj: Union[bytes, str]) -> Any:
+        return orjson.loads(_obj)
+
 except ImportError:
     import json
 
@@ -49,6 +67,9 @@ except ImportError:
     def _json_dumps(_obj: Any, *args: Any, **kwargs: Any) -> str:
         return json.dumps(_obj, ensure_ascii=False, separators=(",", ":"), *args, **kwargs)
 
+    def _json_loads(_obj: Union[bytes, str]) -> Any:
+        return json.loads(_obj)
+
 finally:
     if JSON_LIB == "orjson":
         JSON_INDENT = {"option": orjson.OPT_INDENT_2}
@@ -62,13 +83,11 @@ _F = TypeVar("_F", bound=Callable[..., Any])
 _SelfFreeCResources = TypeVar("_SelfFreeCResources", bound="FreeCResources")
 _WrappedFunc = TypeVar("_WrappedFunc", bound=Callable[..., Any])
 
+# NOTE - struct format characters of integer types, as reported by memoryview.format for array("q"), NumPy int64, etc
+INTEGER_BUFFER_FORMATS = frozenset("bBhHiIlLqQnN")
 PYTHON_VERSION_MINIMUM = "3.9"
 SENZING_VERSION_MINIMUM = "4.0.0"
 SENZING_VERSION_MAXIMUM = "5.0.0"
-START_DSRC_JSON = '{"DATA_SOURCES": ['
-START_ENTITIES_JSON = '{"ENTITIES": ['
-START_RECORDS_JSON = '{"RECORDS": ['
-END_JSON = "]}"
 
 # -----------------------------------------------------------------------------
 # Classes
@@ -98,11 +117,92 @@ class FreeCResources:
         self.handle.SzHelper_free(self.resource)
 
 
+class ReaderWriterGate:
+    """
+    Let many SDK calls, the readers, run at once while a writer, e.g. reinitializing the engine, waits for those in
+    progress to finish and holds back new ones until it's done. A waiting writer takes priority over new readers.
+
+    :meta private:
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+
+    def acquire_reader(self) -> None:
+        """Wait for any writer to finish, then count a reader in."""
+        with self._condition:
+            while self._writer:
+                self._condition.wait()
+            self._readers += 1
+
+    def release_reader(self) -> None:
+        """Count a reader out, waking a writer waiting for the last one."""
+        with self._condition:
+            self._readers -= 1
+            if self._writer and not self._readers:
+                self._condition.notify_all()
+
+    @contextmanager
+    def writer(self) -> Iterator[None]:
+        """Hold back new readers and wait for those in progress, then run the with block exclusively."""
+        with self._condition:
+            while self._writer:
+                self._condition.wait()
+            self._writer = True
+            while self._readers:
+                self._condition.wait()
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writer = False
+                self._condition.notify_all()
+
+
 # -----------------------------------------------------------------------------
 # Decorators
 # -----------------------------------------------------------------------------
 
 
+def method_signature(func: Callable[..., Any]) -> str:
+    """
+    Describe an SDK method and the arguments and types it accepts, appended to the message of errors raised calling
+    it. Computed once, when the method is decorated.
+
+    :meta private:
+    """
+    func_signature = ", ".join(
+        [
+            f"{name}: {type if isinstance(type, str) else type.__name__}"
+            for name, type in func.__annotations__.items()
+            if name not in ("return", "kwargs")
+        ]
+    )
+
+    return f"{func.__module__}.{func.__name__}({func_signature})"
+
+
+def sdk_exception(method_and_signature: str, err: Exception) -> SzSdkError:
+    """
+    Convert a Python exception raised calling an SDK method in to an SzSdkError, appending method_and_signature from
+    method_signature() to identify the SDK method called and the arguments and types it accepts.
+
+    :meta private:
+    """
+    if not err.args:
+        err.args = (f"calling {method_and_signature}",)
+        return SzSdkError(err)
+
+    arg_0 = str(err.args[0])
+    if " missing " in arg_0 and " required positional argument" in arg_0:
+        arg_0 = " ".join(arg_0.split()[1:])
+    err.args = (f"{arg_0} - expected: {method_and_signature}",) + err.args[1:]
+
+    return SzSdkError(err)
+
+
 def catch_sdk_exceptions(func_to_decorate: _F) -> _F:
     """
     The Python SDK methods convert Python types to ctypes and utilize helper functions. If incorrect types/values are
@@ -114,35 +214,14 @@ def catch_sdk_exceptions(func_to_decorate: _F) -> _F:
     :meta private:
     """
 
+    method_and_signature = method_signature(func_to_decorate)
+
     @wraps(func_to_decorate)
     def wrapped_func(*args: Any, **kwargs: Any) -> _F:
         try:
             return typing_cast(_F, func_to_decorate(*args, **kwargs))
         except (ArgumentError, TypeError, ValueError) as err:
-            # Get wrapped function annotation, remove unwanted keys
-            annotations_dict = func_to_decorate.__annotations__
-            with suppress(KeyError):
-                del annotations_dict["return"]
-                del annotations_dict["kwargs"]
-
-            # Get the wrapped function signature names and types and build a string to append to the error message
-            func_signature = ", ".join(
-                [
-                    f"{name}: {type if isinstance(type, str) else type.__name__}"
-                    for name, type in annotations_dict.items()
-                ]
-            )
-
-            method_and_signature = f"{func_to_decorate.__module__}.{func_to_decorate.__name__}({func_signature})"
-            append_err_msg = f" - expected: {method_and_signature}"
-
-            arg_0 = err.args[0]
-            if " missing " in err.args[0] and " required positional argument" in err.args[0]:
-                arg_0 = " ".join(err.args[0].split()[1:])
-            new_arg_0 = f"calling {method_and_signature}" if not err.args else f"{arg_0}{append_err_msg}"
-            err.args = (new_arg_0,) + err.args[1:]
-
-            raise SzSdkError(err) from err
+            raise sdk_exception(method_and_signature, err) from err
 
     return typing_cast(_F, wrapped_func)
 
@@ -164,6 +243,136 @@ def check_is_destroyed(func: _WrappedFunc) -> _WrappedFunc:
     return typing_cast(_WrappedFunc, wrapped_check_destroyed)
 
 
+def sdk_method(func: _WrappedFunc) -> _WrappedFunc:
+    """
+    check_is_destroyed and catch_sdk_exceptions combined in to a single wrapper, halving the Python call overhead the
+    decorators add to every SDK method call.
+
+    :meta private:
+    """
+
+    method_and_signature = method_signature(func)
+
+    @wraps(func)
+    def wrapped_sdk_method(self, *args, **kwargs):  # type: ignore
+        if self._is_destroyed:  # pylint: disable=protected-access
+            raise SzSdkError("engine object has been destroyed and can no longer be used, create a new one")
+        observer = _observers.call_observer
+        if observer is not None:
+            return observed_call(observer, method_and_signature, func, self, args, kwargs)
+        try:
+            return func(self, *args, **kwargs)
+        except (ArgumentError, TypeError, ValueError) as err:
+            raise sdk_exception(method_and_signature, err) from err
+
+    return typing_cast(_WrappedFunc, wrapped_sdk_method)
+
+
+def gated_sdk_method(func: _WrappedFunc) -> _WrappedFunc:
+    """
+    sdk_method that also holds a reader on the instance's _call_gate, a ReaderWriterGate, for the duration of the
+    call if one is set. With no gate set the only added cost is reading the attribute. Call observers are notified
+    once the reader is released, so an observer making SDK calls can't deadlock with a waiting writer.
+
+    :meta private:
+    """
+
+    method_and_signature = method_signature(func)
+
+    @wraps(func)
+    def wrapped_gated_sdk_method(self, *args, **kwargs):  # type: ignore
+        if self._is_destroyed:  # pylint: disable=protected-access
+            raise SzSdkError("engine object has been destroyed and can no longer be used, create a new one")
+        gate = self._call_gate  # pylint: disable=protected-access
+        observer = _observers.call_observer
+        if observer is not None:
+            return observed_call(observer, method_and_signature, func, self, args, kwargs, gate)
+        if gate is not None:
+            gate.acquire_reader()
+        try:
+            return func(self, *args, **kwargs)
+        except (ArgumentError, TypeError, ValueError) as err:
+            raise sdk_exception(method_and_signature, err) from err
+        finally:
+            if gate is not None:
+                gate.release_reader()
+
+    return typing_cast(_WrappedFunc, wrapped_gated_sdk_method)
+
+
+# -----------------------------------------------------------------------------
+# Helpers for observing SDK method calls
+# -----------------------------------------------------------------------------
+
+
+def observed_call(
+    observer: _observers.CallObserver,
+    method_and_signature: str,
+    func: Callable[..., Any],
+    self: Any,
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+    gate: Optional[ReaderWriterGate] = None,
+) -> Any:
+    """
+    Time a call to an SDK method and report it to observer, converting Python exceptions as sdk_method does. If gate
+    is given a reader is held on it for the call, released before observer is called.
+
+    :meta private:
+    """
+    phase_times = _observers.phase_times
+    if phase_times is not None:
+        phase_times.reset()
+    if gate is not None:
+        gate.acquire_reader()
+    start = time.perf_counter_ns()
+    try:
+        try:
+            result = func(self, *args, **kwargs)
+        finally:
+            if gate is not None:
+                gate.release_reader()
+    except (ArgumentError, TypeError, ValueError) as err:
+        exception_start = time.perf_counter_ns()
+        sdk_err = sdk_exception(method_and_signature, err)
+        if phase_times is not None:
+            phase_times.exception_ns += time.perf_counter_ns() - exception_start
+        observer(func, args, kwargs, time.perf_counter_ns() - start, None, sdk_err)
+        raise sdk_err from err
+    except Exception as err:
+        observer(func, args, kwargs, time.perf_counter_ns() - start, None, err)
+        raise
+    observer(func, args, kwargs, time.perf_counter_ns() - start, result, None)
+    return result
+
+
+# -----------------------------------------------------------------------------
+# Helpers for timing the phases of SDK method calls
+# -----------------------------------------------------------------------------
+
+
+def enable_phase_timing() -> None:
+    """
+    Time the phases of SDK method calls. The Senzing library's functions are replaced, on the process-wide handle, by
+    wrappers adding the time spent in them to PhaseTimes.native_ns. Functions declared later are wrapped when they're
+    declared.
+
+    :meta private:
+    """
+    with _SzLibraryRegistry.lock:
+        _observers.start_phase_timing(_SzLibraryRegistry.handle)
+
+
+def disable_phase_timing() -> None:
+    """
+    Stop timing the phases of SDK method calls, restoring the Senzing library's functions.
+
+    :meta private:
+    """
+    with _SzLibraryRegistry.lock:
+        _observers.stop_phase_timing(_SzLibraryRegistry.handle)
+
+
 # -----------------------------------------------------------------------------
 # Helpers for loading Senzing C library
 # -----------------------------------------------------------------------------
@@ -199,6 +408,37 @@ def load_sz_library(lib: str = "", os: str = "") -> CDLL:
         raise SzSdkError("failed to load the Senzing library") from err
 
 
+class _SzLibraryRegistry:
+    """Process-wide handle to the Senzing library and the function signature declarations made on it"""
+
+    # pylint: disable=R0903
+
+    declared: Set[Callable[[CDLL], None]] = set()
+    handle: Optional[CDLL] = None
+    lock = threading.Lock()
+
+
+def get_sz_library(declare_function_signatures: Callable[[CDLL], None]) -> CDLL:
+    """
+    Return the process-wide handle to the Senzing library, loading it on first use. declare_function_signatures sets
+    the argtypes and restype of a module's C functions and is called once per process rather than for each SDK object.
+
+    :meta private:
+    """
+    handle = _SzLibraryRegistry.handle
+    if handle is not None and declare_function_signatures in _SzLibraryRegistry.declared:
+        return handle
+
+    with _SzLibraryRegistry.lock:
+        if _SzLibraryRegistry.handle is None:
+            _SzLibraryRegistry.handle = load_sz_library()
+        if declare_function_signatures not in _SzLibraryRegistry.declared:
+            declare_function_signatures(_SzLibraryRegistry.handle)
+            _SzLibraryRegistry.declared.add(declare_function_signatures)
+            _observers.time_native_functions(_SzLibraryRegistry.handle)
+        return _SzLibraryRegistry.handle
+
+
 # -----------------------------------------------------------------------------
 # Helpers for checking if the Senzing SDK binary version is supported
 # -----------------------------------------------------------------------------
@@ -284,11 +524,16 @@ def check_result_rc(
     :meta private:
     """
     if result_return_code != 0:
-        raise engine_exception(
+        phase_times = _observers.phase_times
+        start = time.perf_counter_ns()
+        err = engine_exception(
             lib_get_last_exception,
             lib_clear_last_exception,
             lib_get_last_exception_code,
         )
+        if phase_times is not None:
+            phase_times.exception_ns += time.perf_counter_ns() - start
+        raise err
 
 
 # -----------------------------------------------------------------------------
@@ -325,56 +570,105 @@ def build_dsrc_code_json(dsrc_code: str) -> str:
     return f'{{"DSRC_CODE": {escape_json_str(dsrc_code)}}}'
 
 
-def build_data_sources_json(dsrc_codes: list[str]) -> str:
+def _not_iterable_error(value: Any, expected: str) -> TypeError:
+    """Return the TypeError raised when a builder is given a value it can't iterate over."""
+    return TypeError(f"value {value} has type {type(value).__name__}, should be {expected}")
+
+
+def build_data_sources_json(dsrc_codes: Iterable[str]) -> str:
     """
-    Build JSON string of data source codes.
+    Build JSON string of data source codes. dsrc_codes can be any iterable, including a generator, and is only
+    iterated over once.
 
     Input: ["REFERENCE", "CUSTOMERS"]
 
-    Output: {"DATA_SOURCES": ["REFERENCE", "CUSTOMERS"]}'
+    Output: {"DATA_SOURCES":["REFERENCE","CUSTOMERS"]}
 
     :meta private:
     """
-    if not isinstance(dsrc_codes, list):
-        raise TypeError(f"value {dsrc_codes} has type {type(dsrc_codes).__name__}, should be a list")
+    if isinstance(dsrc_codes, (str, bytes, dict)):
+        raise _not_iterable_error(dsrc_codes, "a list")
 
-    if not all(isinstance(d, str) for d in dsrc_codes):
-        element_types_str = ", ".join({type(t).__name__ for t in dsrc_codes if not isinstance(t, str)})
-        raise TypeError(f"elements in {dsrc_codes} should be str(s), there are {element_types_str}")
+    try:
+        iterator = iter(dsrc_codes)
+    except TypeError:
+        raise _not_iterable_error(dsrc_codes, "a list") from None
 
-    dsrcs_str = ", ".join([f"{escape_json_str(code)}" for code in dsrc_codes])
+    codes = []
+    for code in iterator:
+        if not isinstance(code, str):
+            raise TypeError(f"elements in {dsrc_codes} should be str(s), there is a {type(code).__name__}")
+        codes.append(code)
 
-    return f"{START_DSRC_JSON}{dsrcs_str}{END_JSON}"
+    return _json_dumps({"DATA_SOURCES": codes})
 
 
-def build_entities_json(entity_ids: Union[List[int], None]) -> str:
+def _integer_buffer(value: Any) -> Optional[memoryview]:
+    """Return a memoryview of value if it's a 1 dimensional buffer of integers, otherwise None."""
+    try:
+        view = memoryview(value)
+    except TypeError:
+        return None
+
+    if view.ndim == 1 and view.format.lstrip("@") in INTEGER_BUFFER_FORMATS:
+        return view
+
+    view.release()
+    return None
+
+
+def build_entities_json(entity_ids: Union[Iterable[int], None]) -> str:
     """
-    Build JSON string of entity ids.
+    Build JSON string of entity ids. entity_ids can be any iterable, including a generator, and is only iterated over
+    once. Elements can be int or any integer type usable as an index, e.g. numpy.int64.
+
+    A 1 dimensional buffer of integers, e.g. array("q"), a memoryview or a NumPy integer array, is converted in one
+    step without checking each element.
 
     Input: [1, 100002]
 
-    Output: {"ENTITIES": [{"ENTITY_ID": 1}, {"ENTITY_ID": 100002}]}
+    Output: {"ENTITIES":[{"ENTITY_ID":1},{"ENTITY_ID":100002}]}
 
     :meta private:
     """
-    if not entity_ids or (isinstance(entity_ids, list) and len(entity_ids) == 0):
+    if entity_ids is None:
         return ""
 
-    if not isinstance(entity_ids, list):
-        raise TypeError(f"value {entity_ids} has type {type(entity_ids).__name__}, should be a list of int(s)")
-
-    if not all(isinstance(e, int) for e in entity_ids):
-        element_types_str = ", ".join({type(t).__name__ for t in entity_ids if not isinstance(t, int)})
-        raise TypeError(f"elements in {entity_ids} should be int(s), there are {element_types_str}")
+    if isinstance(entity_ids, (str, bytes, bytearray, dict)):
+        raise _not_iterable_error(entity_ids, "a list of int(s)")
 
-    eids_str = ", ".join([f'{{"ENTITY_ID": {id}}}' for id in entity_ids])
+    view = _integer_buffer(entity_ids)
+    if view is not None:
+        with view:
+            ids = view.tolist()
+    else:
+        try:
+            iterator = iter(entity_ids)
+        except TypeError:
+            raise _not_iterable_error(entity_ids, "a list of int(s)") from None
+
+        ids = []
+        for entity_id in iterator:
+            if not isinstance(entity_id, int):
+                try:
+                    entity_id = operator.index(entity_id)
+                except TypeError:
+                    raise TypeError(
+                        f"elements in {entity_ids} should be int(s), there is a {type(entity_id).__name__}"
+                    ) from None
+            ids.append(entity_id)
+
+    if not ids:
+        return ""
 
-    return f"{START_ENTITIES_JSON}{eids_str}{END_JSON}"
+    # NOTE - Encoding the ids as a JSON array and expanding it in to objects is much faster than encoding an object each
+    return '{"ENTITIES":[{"ENTITY_ID":' + _json_dumps(ids)[1:-1].replace(",", '},{"ENTITY_ID":') + "}]}"
 
 
-def build_records_json(record_keys: Union[List[tuple[str, str]], None]) -> str:
+def build_records_json(record_keys: Union[Iterable[Tuple[str, str]], None]) -> str:
     """
-    Build JSON string of data source and record ids.
+    Build JSON string of data source and record ids. record_keys can be any iterable, including a generator, and is
+    only iterated over once. Empty record keys are skipped.
 
     Input: [("CUSTOMERS", "1001"), ("WATCHLIST", "1007")]
 
@@ -382,39 +676,41 @@ def build_records_json(record_keys: Union[List[tuple[str, str]], None]) -> str:
 
     :meta private:
     """
-    if not record_keys or (isinstance(record_keys, list) and len(record_keys) == 0):
+    if record_keys is None:
         return ""
 
-    record_keys_with_elements = [record_key for record_key in record_keys if record_key]
-    wrong_types = set()
-
-    if not all(isinstance(e, tuple) for e in record_keys_with_elements):
-        element_types_str = ", ".join({type(t).__name__ for t in record_keys_with_elements if not isinstance(t, tuple)})
-        raise TypeError(f"elements in {record_keys} should be tuple(s), there are {element_types_str}")
-
-    if not all({len(e) == 2 for e in record_keys_with_elements}):
-        element_len_str = ", ".join({str(len(t)) for t in record_keys_with_elements})
-        raise TypeError(f"tuple(s) length in {record_keys} should be 2, there are lengths(s) of {element_len_str}")
+    if isinstance(record_keys, (str, bytes, dict)):
+        raise _not_iterable_error(record_keys, "a list of tuple(s)")
 
-    if rk_wrong_types := [
-        record_key
-        for record_key in record_keys_with_elements
-        if not isinstance(record_key[0], str) or not isinstance(record_key[1], str)
-    ]:
-        wrong_types = {(type(w[0]).__name__, type(w[1]).__name__) for w in rk_wrong_types}
+    try:
+        iterator = iter(record_keys)
+    except TypeError:
+        raise _not_iterable_error(record_keys, "a list of tuple(s)") from None
+
+    records = []
+    for record_key in iterator:
+        if not record_key:
+            continue
+
+        if not isinstance(record_key, tuple):
+            raise TypeError(f"elements in {record_keys} should be tuple(s), there is a {type(record_key).__name__}")
+
+        if len(record_key) != 2:
+            raise TypeError(f"tuple(s) length in {record_keys} should be 2, there is a length of {len(record_key)}")
+
+        data_source, record_id = record_key
+        if not isinstance(data_source, str) or not isinstance(record_id, str):
+            raise TypeError(
+                f"tuple(s) types in {record_keys} should be (str, str), there is a"
+                f" ({type(data_source).__name__}, {type(record_id).__name__})"
+            )
 
-    if wrong_types:
-        wrong_types_str = ", ".join({f"({wt[0]}, {wt[1]})" for wt in wrong_types})
-        raise TypeError(f"tuple(s) types in {record_keys} should be (str, str), there are {wrong_types_str}")
+        records.append({"DATA_SOURCE": data_source, "RECORD_ID": record_id})
 
-    records = ", ".join(
-        [
-            f'{{"DATA_SOURCE": {escape_json_str(data_source)}, "RECORD_ID": {escape_json_str(record_id)}}}'
-            for data_source, record_id in record_keys_with_elements
-        ]
-    )
+    if not records:
+        return ""
 
-    return f"{START_RECORDS_JSON}{records}{END_JSON}"
+    return _json_dumps({"RECORDS": records})
 
 
 # -----------------------------------------------------------------------------
@@ -459,12 +755,12 @@ def as_c_char_p(candidate_value: str) -> Any:
 
     :meta private:
     """
-    if candidate_value is None:
-        return b""
-
     if isinstance(candidate_value, str):
         return candidate_value.encode()
 
+    if candidate_value is None:
+        return b""
+
     return candidate_value
 
 
@@ -478,6 +774,52 @@ def as_python_str(candidate_value: Any) -> str:
     return result_raw.decode() if result_raw else ""
 
 
+def response_as_str(
+    lib_free: Callable[[Any], Any],
+    check_result: Callable[[int], None],
+    result: Any,
+) -> str:
+    """
+    From a result structure returned by a C function, check the return code and return the response as a python str.
+    The response is always freed. Equivalent to, but cheaper than, using FreeCResources.
+
+    :meta private:
+    """
+    phase_times = _observers.phase_times
+    if phase_times is not None:
+        return _timed_response_as_str(phase_times, lib_free, check_result, result)
+
+    try:
+        if result.return_code != 0:
+            check_result(result.return_code)
+        # NOTE - Reading the response field in place as a c_char_p avoids the much slower ctypes.cast()
+        response = c_char_p.from_buffer(result, type(result).response.offset).value
+        return response.decode() if response else ""
+    finally:
+        lib_free(result.response)
+
+
+def _timed_response_as_str(
+    phase_times: _observers.PhaseTimes,
+    lib_free: Callable[[Any], Any],
+    check_result: Callable[[int], None],
+    result: Any,
+) -> str:
+    """response_as_str() adding the time to decode and free the response to phase_times.response_ns"""
+    start = 0
+    try:
+        if result.return_code != 0:
+            check_result(result.return_code)
+        start = time.perf_counter_ns()
+        response = c_char_p.from_buffer(result, type(result).response.offset).value
+        return response.decode() if response else ""
+    finally:
+        # NOTE - If check_result() raised, its time is counted as exception_ns and only freeing is counted here
+        start = start or time.perf_counter_ns()
+        lib_free(result.response)
+        phase_times.response_ns += time.perf_counter_ns() - start
+
+
 # -----------------------------------------------------------------------------
 # Helpers to create Senzing specific exceptions
 # -----------------------------------------------------------------------------
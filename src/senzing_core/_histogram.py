@@ -0,0 +1,120 @@
+"""
+Latency histogram used by the SDK metrics
+
+:meta private:
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Optional
+
+# NOTE - Log-linear buckets in the style of HdrHistogram. Each power of 2 range is split in to 32 sub-buckets so a
+# NOTE - recorded value is within ~3% of the value reported for its bucket, using a small, fixed amount of memory.
+_SUB_BUCKET_BITS = 5
+_SUB_BUCKET_COUNT = 1 << _SUB_BUCKET_BITS
+_LINEAR_LIMIT = _SUB_BUCKET_COUNT << 1
+
+NS_PER_MS = 1_000_000
+
+# -----------------------------------------------------------------------------
+# Helpers
+# -----------------------------------------------------------------------------
+
+
+def bucket_index(value: int) -> int:
+    """
+    Return the index of the bucket a value is counted in.
+
+    :meta private:
+    """
+    if value < _LINEAR_LIMIT:
+        return max(value, 0)
+
+    shift = value.bit_length() - _SUB_BUCKET_BITS - 1
+    return ((shift + 1) << _SUB_BUCKET_BITS) + (value >> shift) - _SUB_BUCKET_COUNT
+
+
+def bucket_upper_bound(index: int) -> int:
+    """
+    Return the largest value counted in the bucket at index.
+
+    :meta private:
+    """
+    if index < _LINEAR_LIMIT:
+        return index
+
+    shift = (index >> _SUB_BUCKET_BITS) - 1
+    top = _SUB_BUCKET_COUNT + (index & (_SUB_BUCKET_COUNT - 1))
+    return ((top + 1) << shift) - 1
+
+
+# -----------------------------------------------------------------------------
+# LatencyHistogram class
+# -----------------------------------------------------------------------------
+
+
+class LatencyHistogram:
+    """
+    Count of latencies, in nanoseconds, by log-linear bucket. Not thread safe, callers either hold a lock or keep a
+    histogram per thread and merge them when read.
+
+    :meta private:
+    """
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max = 0
+
+    def record(self, value_ns: int) -> None:
+        """Record a latency in nanoseconds."""
+        index = bucket_index(value_ns)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value_ns
+        if self.min is None or value_ns < self.min:
+            self.min = value_ns
+        self.max = max(self.max, value_ns)
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """
+        Add the counts from another histogram to this one. other may be recording on another thread, its counts are
+        copied before iterating so a bucket added meanwhile doesn't raise.
+        """
+        for index, count in tuple(other.counts.items()):
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        self.max = max(self.max, other.max)
+
+    def percentile(self, percent: float) -> int:
+        """Return the latency in nanoseconds at or below which percent of the recorded latencies fall."""
+        if self.count == 0:
+            return 0
+
+        target = max(1, round(self.count * percent / 100))
+        running = 0
+        for index in sorted(self.counts):
+            running += self.counts[index]
+            if running >= target:
+                return min(bucket_upper_bound(index), self.max)
+
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        """Return the count and the min, mean, p50, p95, p99 and max latencies in milliseconds."""
+        return {
+            "count": self.count,
+            "min_ms": (self.min or 0) / NS_PER_MS,
+            "mean_ms": (self.total / self.count / NS_PER_MS) if self.count else 0.0,
+            "p50_ms": self.percentile(50) / NS_PER_MS,
+            "p95_ms": self.percentile(95) / NS_PER_MS,
+            "p99_ms": self.percentile(99) / NS_PER_MS,
+            "max_ms": self.max / NS_PER_MS,
+        }
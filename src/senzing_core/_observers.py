@@ -0,0 +1,266 @@
+"""
+Observing SDK method calls, timing their phases and tracking native handles
+
+:meta private:
+"""
+
+from __future__ import annotations
+
+import inspect
+import reprlib
+import threading
+import time
+from collections.abc import Callable
+from ctypes import CDLL
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Protocol, Tuple
+
+CallObserver = Callable[[Callable[..., Any], Tuple[Any, ...], Dict[str, Any], int, Any, Optional[BaseException]], None]
+
+# -----------------------------------------------------------------------------
+# Observing SDK method calls
+# -----------------------------------------------------------------------------
+
+# NOTE - Observers are called after each sdk_method and gated_sdk_method call. call_observer is None while there are
+# NOTE - none so unobserved calls only pay for reading it, the single observer if there is one or a fan-out to all.
+# NOTE - Read as _observers.call_observer, importing it by name would keep the value at the time of the import.
+call_observer: Optional[CallObserver] = None  # pylint: disable=C0103
+_call_observers: List[CallObserver] = []
+_call_observers_lock = threading.Lock()
+
+
+def add_call_observer(observer: CallObserver) -> None:
+    """
+    Call observer(func, args, kwargs, elapsed_ns, result, error) after each SDK method call. func is the undecorated
+    method, its __qualname__ is e.g. "SzEngineCore.add_record", args exclude self and error is None or the exception
+    the call raised.
+    """
+    global call_observer  # pylint: disable=global-statement
+    with _call_observers_lock:
+        _call_observers.append(observer)
+        call_observer = _fan_out(tuple(_call_observers))
+
+
+def remove_call_observer(observer: CallObserver) -> None:
+    """Stop calling an observer added with add_call_observer(), if it was added."""
+    global call_observer  # pylint: disable=global-statement
+    with _call_observers_lock:
+        if observer in _call_observers:
+            _call_observers.remove(observer)
+        call_observer = _fan_out(tuple(_call_observers))
+
+
+def _fan_out(observers: Tuple[CallObserver, ...]) -> Optional[CallObserver]:
+    if not observers:
+        return None
+
+    if len(observers) == 1:
+        return observers[0]
+
+    def fan_out(
+        func: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        elapsed_ns: int,
+        result: Any,
+        error: Optional[BaseException],
+    ) -> None:
+        for observer in observers:
+            observer(func, args, kwargs, elapsed_ns, result, error)
+
+    return fan_out
+
+
+# -----------------------------------------------------------------------------
+# Arguments of observed calls
+# -----------------------------------------------------------------------------
+
+
+def call_argument(func: Callable[..., Any], args: Tuple[Any, ...], kwargs: Dict[str, Any], name: str) -> Any:
+    """
+    Return the value an observed call passed for a parameter, its default if not passed or None if func doesn't have
+    the parameter.
+    """
+    position, default = _parameter(func, name)
+    if position is None:
+        return None
+    if position < len(args):
+        return args[position]
+    return kwargs.get(name, default)
+
+
+def summarize_call_arguments(
+    func: Callable[..., Any], args: Tuple[Any, ...], kwargs: Dict[str, Any], max_length: int
+) -> Dict[str, Any]:
+    """
+    Return the arguments of an observed call, including defaults, by parameter name. Strings are truncated to
+    max_length characters and other objects to a repr of about max_length characters.
+    """
+    try:
+        bound = _signature(func).bind(None, *args, **kwargs)
+    except TypeError:
+        return {"args": _summarize(args, max_length), "kwargs": _summarize(kwargs, max_length)}
+    bound.apply_defaults()
+    arguments = list(bound.arguments.items())[1:]
+    return {name: _summarize(value, max_length) for name, value in arguments}
+
+
+@lru_cache(maxsize=None)
+def _parameter(func: Callable[..., Any], name: str) -> Tuple[Optional[int], Any]:
+    """Return the position, excluding self, and default of a parameter of func or (None, None) if it has none."""
+    parameters = list(_signature(func).parameters.values())[1:]
+    for position, parameter in enumerate(parameters):
+        if parameter.name == name:
+            return position, None if parameter.default is inspect.Parameter.empty else parameter.default
+    return None, None
+
+
+@lru_cache(maxsize=None)
+def _signature(func: Callable[..., Any]) -> inspect.Signature:
+    return inspect.signature(func)
+
+
+def _summarize(value: Any, max_length: int) -> Any:
+    if value is None or isinstance(value, (bool, float)):
+        return value
+    if isinstance(value, int):
+        # NOTE - int() as flags may be an SzEngineFlags
+        return int(value)
+    if isinstance(value, str):
+        if len(value) <= max_length:
+            return value
+        return f"{value[:max_length]}...(+{len(value) - max_length} chars)"
+    # NOTE - reprlib only formats the first items of containers, e.g. of a long list of entity IDs
+    text = _bounded_repr(max_length).repr(value)
+    return text if len(text) <= max_length else f"{text[:max_length]}..."
+
+
+@lru_cache(maxsize=None)
+def _bounded_repr(max_length: int) -> reprlib.Repr:
+    bounded_repr = reprlib.Repr()
+    bounded_repr.maxlong = bounded_repr.maxother = bounded_repr.maxstring = max_length
+    return bounded_repr
+
+
+# -----------------------------------------------------------------------------
+# Timing the phases of SDK method calls
+# -----------------------------------------------------------------------------
+
+
+class PhaseTimes(threading.local):  # pylint: disable=R0903
+    """
+    Nanoseconds the current thread's SDK method call has spent in the Senzing library (native), checking, decoding
+    and freeing responses (response) and building exceptions (exception). Reset by observed_call().
+    """
+
+    # NOTE - Class attributes are the defaults for threads that haven't reset yet
+    exception_ns = 0
+    native_ns = 0
+    response_ns = 0
+
+    def reset(self) -> None:
+        """Zero the current thread's times."""
+        self.exception_ns = 0
+        self.native_ns = 0
+        self.response_ns = 0
+
+
+# NOTE - Set while phase timing is enabled, read as _observers.phase_times by the SDK helpers and by observers for
+# NOTE - the times of the call they're observing
+phase_times: Optional[PhaseTimes] = None  # pylint: disable=C0103
+
+# NOTE - Functions used to check results, free responses and build exceptions are timed as those phases, not native
+_UNTIMED_NATIVE_FUNCTIONS = ("SzHelper_free", "LastException")
+
+# Name: original function, for the library functions replaced by timed wrappers
+_timed_native_functions: Dict[str, Any] = {}
+
+
+def get_phase_times() -> Optional[PhaseTimes]:
+    """Return the per-thread phase times if phase timing is enabled, otherwise None."""
+    return phase_times
+
+
+def start_phase_timing(handle: Optional[CDLL]) -> None:
+    """Start timing phases, replacing the declared functions of handle, if loaded, with wrappers timing them."""
+    global phase_times  # pylint: disable=global-statement
+    if phase_times is None:
+        phase_times = PhaseTimes()
+    if handle is not None:
+        time_native_functions(handle)
+
+
+def stop_phase_timing(handle: Optional[CDLL]) -> None:
+    """Stop timing phases, restoring the functions of handle replaced by start_phase_timing()."""
+    global phase_times  # pylint: disable=global-statement
+    for name, function in _timed_native_functions.items():
+        setattr(handle, name, function)
+    _timed_native_functions.clear()
+    phase_times = None
+
+
+def time_native_functions(handle: CDLL) -> None:
+    """Replace the declared functions of handle, not already replaced, with wrappers timing them if timing phases."""
+    times = phase_times
+    if times is None:
+        return
+    # NOTE - CDLL caches each function as an attribute on first use, so the declared functions are in its __dict__
+    for name, function in list(vars(handle).items()):
+        if (
+            not isinstance(function, handle._FuncPtr)  # pylint: disable=protected-access
+            or name in _timed_native_functions
+            or any(untimed in name for untimed in _UNTIMED_NATIVE_FUNCTIONS)
+        ):
+            continue
+        _timed_native_functions[name] = function
+        setattr(handle, name, _timed_native_function(function, times))
+
+
+def _timed_native_function(function: Callable[..., Any], times: PhaseTimes) -> Callable[..., Any]:
+    def timed_native_function(*args: Any) -> Any:
+        start = time.perf_counter_ns()
+        try:
+            return function(*args)
+        finally:
+            times.native_ns += time.perf_counter_ns() - start
+
+    return timed_native_function
+
+
+# -----------------------------------------------------------------------------
+# Tracking native handles
+# -----------------------------------------------------------------------------
+
+
+class HandleTracker(Protocol):
+    """Notified when the SDK opens and closes native handles, e.g. export and in-memory configuration handles."""
+
+    def opened(self, kind: str, handle: int, owner: Any) -> None:
+        """A handle of kind was opened by owner, the SDK object holding it."""
+
+    def closed(self, kind: str, handle: int) -> None:
+        """A handle of kind was closed."""
+
+
+# NOTE - Set while handle tracking is enabled, None otherwise so opening and closing handles only pay for reading it
+_handle_tracker: Optional[HandleTracker] = None  # pylint: disable=C0103
+
+
+def set_handle_tracker(tracker: Optional[HandleTracker]) -> None:
+    """Notify tracker when handles are opened and closed, None to stop notifying."""
+    global _handle_tracker  # pylint: disable=global-statement
+    _handle_tracker = tracker
+
+
+def handle_opened(kind: str, handle: int, owner: Any) -> None:
+    """Notify the handle tracker, if there is one, that owner opened a handle."""
+    tracker = _handle_tracker
+    if tracker is not None:
+        tracker.opened(kind, handle, owner)
+
+
+def handle_closed(kind: str, handle: int) -> None:
+    """Notify the handle tracker, if there is one, that a handle was closed."""
+    tracker = _handle_tracker
+    if tracker is not None:
+        tracker.closed(kind, handle)
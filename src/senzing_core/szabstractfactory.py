@@ -12,9 +12,21 @@ from __future__ import annotations
 import functools
 import json
 import weakref
+from concurrent.futures import Future
 from contextlib import suppress
-from threading import Lock
-from typing import Any, Callable, Dict, TypedDict, TypeVar, Union, cast
+from threading import Lock, Thread
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    TypedDict,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from senzing import (
     SzAbstractFactory,
@@ -26,6 +38,7 @@ from senzing import (
     SzSdkError,
 )
 
+from ._helpers import as_str, is_senzing_binary_version_supported
 from .szconfigmanager import SzConfigManagerCore
 from .szdiagnostic import SzDiagnosticCore
 from .szengine import SzEngineCore
@@ -70,6 +83,23 @@ def _method_lock(func: _WrappedFunc) -> _WrappedFunc:
     return cast(_WrappedFunc, wrapped_method_lock)
 
 
+# -----------------------------------------------------------------------------
+# Helpers
+# -----------------------------------------------------------------------------
+
+
+def _check_senzing_binary_version() -> None:
+    """Check the version of the Senzing binaries is supported by this version of the SDK"""
+    sz_product = SzProductCore()
+    try:
+        sz_product._initialize("sdk_init_check", "{}")  # pylint: disable=protected-access
+        version: str = json.loads(sz_product.get_version()).get("VERSION", "0.0.0")
+    finally:
+        sz_product._destroy()  # pylint: disable=protected-access
+
+    is_senzing_binary_version_supported(version)
+
+
 # -----------------------------------------------------------------------------
 # SzAbstractFactoryParametersCore class
 # -----------------------------------------------------------------------------
@@ -95,6 +125,7 @@ class SzAbstractFactoryCore(SzAbstractFactory):
     _constructor_lock = Lock()
     _engine_instances = weakref.WeakValueDictionary()  # type: ignore[var-annotated]
     _factory_instances = weakref.WeakValueDictionary()  # type: ignore[var-annotated]
+    _is_version_checked = False
 
     def __new__(
         cls,
@@ -105,6 +136,11 @@ class SzAbstractFactoryCore(SzAbstractFactory):
     ) -> SzAbstractFactoryCore:
 
         with cls._constructor_lock:
+            # Once per process, deferred from import so importing senzing_core doesn't initialize the Senzing library
+            if not SzAbstractFactoryCore._is_version_checked:
+                _check_senzing_binary_version()
+                SzAbstractFactoryCore._is_version_checked = True
+
             args_hash = cls._create_args_hash(instance_name, settings, config_id, verbose_logging)
             instance = super().__new__(cls)
             instance._args_hash = args_hash  # type: ignore[attr-defined]
@@ -143,6 +179,7 @@ class SzAbstractFactoryCore(SzAbstractFactory):
         self._method_lock = Lock()
         self._settings = settings
         self._verbose_logging = verbose_logging
+        self._warm_up_future: Optional[Future[None]] = None
 
     @property
     def instance_name(self) -> str:
@@ -170,17 +207,36 @@ class SzAbstractFactoryCore(SzAbstractFactory):
         """Return the verbose logging setting the abstract factory was instantiated with."""
         return self._verbose_logging
 
+    @property
+    def warm_up_future(self) -> Optional[Future[None]]:
+        """Return the future completed when the engine warm-up started by create_engine(warm_up=True) finishes. None
+        if a warm-up hasn't been requested. The future result is None, or the exception that stopped the warm-up."""
+        return self._warm_up_future
+
     # -------------------------------------------------------------------------
     # SzAbstractFactory methods
     # -------------------------------------------------------------------------
 
     @_check_is_destroyed
     @_method_lock
-    def create_configmanager(self) -> SzConfigManager:
+    def create_configmanager(self, config_cache_max_bytes: int = 0) -> SzConfigManager:
+        """
+        Create an SzConfigManager object.
+
+        Args:
+            config_cache_max_bytes (int, optional): If greater than 0, cache configurations fetched by
+                create_config_from_config_id() up to this many bytes, see SzConfigManagerCore.enable_config_cache().
+                Defaults to 0, no cache.
+
+        Returns:
+            SzConfigManager: An SzConfigManager object.
+        """
         result = SzConfigManagerCore()
         result._initialize(  # pylint: disable=protected-access
             instance_name=self._instance_name, settings=self._settings, verbose_logging=self._verbose_logging
         )
+        if config_cache_max_bytes > 0:
+            result.enable_config_cache(config_cache_max_bytes)
         SzAbstractFactoryCore._engine_instances[id(result)] = result
         return result
 
@@ -199,7 +255,24 @@ class SzAbstractFactoryCore(SzAbstractFactory):
 
     @_check_is_destroyed
     @_method_lock
-    def create_engine(self) -> SzEngine:
+    def create_engine(
+        self,
+        warm_up: bool = False,
+        warm_up_searches: Optional[Iterable[Union[str, Dict[Any, Any]]]] = None,
+    ) -> SzEngine:
+        """
+        Create an SzEngine object.
+
+        Args:
+            warm_up (bool, optional): Run SzEngine.prime_engine() and warm_up_searches on a background thread. Use
+                warm_up_future to know when the engine is warm. A warm-up runs once per abstract factory. Defaults to
+                False.
+            warm_up_searches (Optional[Iterable[Union[str, Dict[Any, Any]]]], optional): Representative attributes
+                for SzEngine.search_by_attributes() to run after priming. Defaults to None.
+
+        Returns:
+            SzEngine: An SzEngine object.
+        """
         result = SzEngineCore()
         result._initialize(  # pylint: disable=protected-access
             instance_name=self._instance_name,
@@ -208,6 +281,16 @@ class SzAbstractFactoryCore(SzAbstractFactory):
             verbose_logging=self._verbose_logging,
         )
         SzAbstractFactoryCore._engine_instances[id(result)] = result
+
+        if warm_up and self._warm_up_future is None:
+            self._warm_up_future = Future()
+            Thread(
+                target=self._warm_up,
+                args=(result, self._warm_up_future, list(warm_up_searches or [])),
+                name="SzEngineWarmUp",
+                daemon=True,
+            ).start()
+
         return result
 
     @_check_is_destroyed
@@ -288,6 +371,26 @@ class SzAbstractFactoryCore(SzAbstractFactory):
     # Utility methods
     # -------------------------------------------------------------------------
 
+    @staticmethod
+    def _warm_up(
+        sz_engine: SzEngineCore,
+        future: Future[None],
+        warm_up_searches: List[Union[str, Dict[Any, Any]]],
+    ) -> None:
+        """Prime the engine and run the warm-up searches, then complete future"""
+        if not future.set_running_or_notify_cancel():
+            return
+
+        try:
+            sz_engine.prime_engine()
+            for attributes in warm_up_searches:
+                sz_engine.search_by_attributes(as_str(attributes))
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            future.set_exception(err)
+            return
+
+        future.set_result(None)
+
     @staticmethod
     def _create_args_hash(
         instance_name: str, settings: Union[str, Dict[Any, Any]], config_id: int, verbose_logging: int
@@ -16,23 +16,39 @@ Example:
 
 # pylint: disable=R0903
 
-from ctypes import POINTER, Structure, c_char, c_char_p, c_longlong, c_uint, c_void_p
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from ctypes import (
+    CDLL,
+    POINTER,
+    Structure,
+    c_char,
+    c_char_p,
+    c_longlong,
+    c_uint,
+    c_void_p,
+)
 from functools import partial
-from typing import Any, Dict, Union
+from typing import Any, Dict, Iterable, Iterator, Optional, Union
 
-from senzing import SzConfig
+from senzing import SzConfig, SzSdkError
 
 from ._helpers import (
-    FreeCResources,
+    _json_loads,
     as_c_char_p,
     as_c_uintptr_t,
-    as_python_str,
     as_str,
     build_dsrc_code_json,
     catch_sdk_exceptions,
     check_result_rc,
-    load_sz_library,
+    get_sz_library,
+    response_as_str,
 )
+from ._observers import handle_closed, handle_opened
 
 # Metadata
 
@@ -83,6 +99,67 @@ class SzConfigRegisterDataSourceResult(SzResponseAsCharPointerResult):
     """In SzLang_helpers.h SzConfig_registerDataSource_result"""
 
 
+# -----------------------------------------------------------------------------
+# Declarations of C function input parameters and results
+# -----------------------------------------------------------------------------
+
+
+def _declare_function_signatures(library_handle: CDLL) -> None:
+    """
+    Initialize C function input parameters and results used by SzConfigCore, called once per process.
+    Must be synchronized with er/sdk/c/libSzConfig.h
+    """
+    library_handle.SzConfig_close_helper.argtypes = [POINTER(c_uint)]
+    library_handle.SzConfig_close_helper.restype = c_longlong
+    library_handle.SzConfig_create_helper.argtypes = []
+    library_handle.SzConfig_create_helper.restype = SzConfigCreateResult
+    library_handle.SzConfig_destroy.argtypes = []
+    library_handle.SzConfig_destroy.restype = c_longlong
+    library_handle.SzConfig_export_helper.argtypes = [POINTER(c_uint)]
+    library_handle.SzConfig_export_helper.restype = SzConfigExportResult
+    library_handle.SzConfig_getDataSourceRegistry_helper.argtypes = [POINTER(c_uint)]
+    library_handle.SzConfig_getDataSourceRegistry_helper.restype = SzConfigGetDataSourceRegistryResult
+    library_handle.SzConfig_init.argtypes = [c_char_p, c_char_p, c_longlong]
+    library_handle.SzConfig_init.restype = c_longlong
+    library_handle.SzConfig_load_helper.argtypes = [c_char_p]
+    library_handle.SzConfig_load_helper.restype = SzConfigLoadResult
+    library_handle.SzConfig_registerDataSource_helper.argtypes = [
+        POINTER(c_uint),
+        c_char_p,
+    ]
+    library_handle.SzConfig_registerDataSource_helper.restype = SzConfigRegisterDataSourceResult
+    library_handle.SzConfig_unregisterDataSource_helper.argtypes = [
+        POINTER(c_uint),
+        c_char_p,
+    ]
+    library_handle.SzConfig_unregisterDataSource_helper.restype = c_longlong
+    library_handle.SzHelper_free.argtypes = [c_void_p]
+
+
+# -----------------------------------------------------------------------------
+# Helpers
+# -----------------------------------------------------------------------------
+
+
+def _check_data_source_codes(data_source_codes: Iterable[str]) -> None:
+    """Raise SzSdkError for a single code, e.g. "CUSTOMERS", which would otherwise be iterated a character at a time."""
+    if isinstance(data_source_codes, (str, bytes)):
+        raise SzSdkError(
+            f"data_source_codes {data_source_codes!r} has type {type(data_source_codes).__name__}, should be an iterable"
+            " of str(s), e.g. a list"
+        )
+
+
+def _resource_path(settings: Union[str, Dict[Any, Any]]) -> Optional[str]:
+    """Return the PIPELINE.RESOURCEPATH of settings, or None if it can't be found."""
+    try:
+        settings_dict = _json_loads(settings) if isinstance(settings, str) else settings
+        resource_path = settings_dict["PIPELINE"]["RESOURCEPATH"]
+    except (KeyError, TypeError, ValueError):
+        return None
+    return resource_path if isinstance(resource_path, str) else None
+
+
 # -----------------------------------------------------------------------------
 # SzConfigCore class
 # -----------------------------------------------------------------------------
@@ -108,13 +185,21 @@ class SzConfigCore(SzConfig):
 
     """
 
+    # Exported default templates, keyed by the PIPELINE.RESOURCEPATH of the settings they were created with
+    _template_cache: Dict[str, str] = {}
+
+    # SHA-256 digests of configurations that passed verify_config_definition(), most recently verified last
+    _verified_config_hashes: OrderedDict[bytes, None] = OrderedDict()
+    _verified_config_hashes_lock = threading.Lock()
+    _verified_config_hashes_max = 0
+
     # -------------------------------------------------------------------------
     # Dunder/magic methods
     # -------------------------------------------------------------------------
 
     def __init__(self, **kwargs: Any) -> None:
         _ = kwargs
-        self._library_handle = load_sz_library()
+        self._library_handle = get_sz_library(_declare_function_signatures)
 
         # Partial function to use this modules self._library_handle for exception handling
         self._check_result = partial(
@@ -124,34 +209,11 @@ class SzConfigCore(SzConfig):
             self._library_handle.SzConfig_getLastExceptionCode,
         )
 
-        # Initialize C function input parameters and results.
-        # Synchronized with er/sdk/c/libSzConfig.h
-        self._library_handle.SzConfig_close_helper.argtypes = [POINTER(c_uint)]
-        self._library_handle.SzConfig_close_helper.restype = c_longlong
-        self._library_handle.SzConfig_create_helper.argtypes = []
-        self._library_handle.SzConfig_create_helper.restype = SzConfigCreateResult
-        self._library_handle.SzConfig_destroy.argtypes = []
-        self._library_handle.SzConfig_destroy.restype = c_longlong
-        self._library_handle.SzConfig_export_helper.argtypes = [POINTER(c_uint)]
-        self._library_handle.SzConfig_export_helper.restype = SzConfigExportResult
-        self._library_handle.SzConfig_getDataSourceRegistry_helper.argtypes = [POINTER(c_uint)]
-        self._library_handle.SzConfig_getDataSourceRegistry_helper.restype = SzConfigGetDataSourceRegistryResult
-        self._library_handle.SzConfig_init.argtypes = [c_char_p, c_char_p, c_longlong]
-        self._library_handle.SzConfig_init.restype = c_longlong
-        self._library_handle.SzConfig_load_helper.argtypes = [c_char_p]
-        self._library_handle.SzConfig_load_helper.restype = SzConfigLoadResult
-        self._library_handle.SzConfig_registerDataSource_helper.argtypes = [
-            POINTER(c_uint),
-            c_char_p,
-        ]
-        self._library_handle.SzConfig_registerDataSource_helper.restype = SzConfigRegisterDataSourceResult
-        self._library_handle.SzConfig_unregisterDataSource_helper.argtypes = [
-            POINTER(c_uint),
-            c_char_p,
-        ]
-        self._library_handle.SzConfig_unregisterDataSource_helper.restype = c_longlong
-        self._library_handle.SzHelper_free.argtypes = [c_void_p]
+        # Partial function to check the return code, convert and free responses from C functions
+        self._response_as_str = partial(response_as_str, self._library_handle.SzHelper_free, self._check_result)
 
+        self._resource_path: Optional[str] = None
+        self._session_handle: Optional[int] = None
         self.config_definition = ""
 
     # -------------------------------------------------------------------------
@@ -160,26 +222,15 @@ class SzConfigCore(SzConfig):
 
     @catch_sdk_exceptions
     def get_data_source_registry(self) -> str:
-        # Create an in-memory representation of the Senzing configuration JSON.
-        load_result = self._library_handle.SzConfig_load_helper(as_c_char_p(self.config_definition))
-        self._check_result(load_result.return_code)
-        config_handle = load_result.response
-
-        # Get the list of datasources.
-        get_data_source_registry_result = self._library_handle.SzConfig_getDataSourceRegistry_helper(
-            as_c_uintptr_t(config_handle)
-        )
-        with FreeCResources(self._library_handle, get_data_source_registry_result.response):
-            self._check_result(get_data_source_registry_result.return_code)
-            result = as_python_str(get_data_source_registry_result.response)
-
-        # Delete the in-memory representation of the Senzing configuration JSON.
-        close_result = self._library_handle.SzConfig_close_helper(as_c_uintptr_t(config_handle))
-        self._check_result(close_result)
-
-        return result
+        with self._config_handle(is_modified=False) as config_handle:
+            get_data_source_registry_result = self._library_handle.SzConfig_getDataSourceRegistry_helper(
+                as_c_uintptr_t(config_handle)
+            )
+            return self._response_as_str(get_data_source_registry_result)
 
     def export(self) -> str:
+        if self._session_handle is not None:
+            return self._export(self._session_handle)
         return self.config_definition
 
     @catch_sdk_exceptions
@@ -187,68 +238,238 @@ class SzConfigCore(SzConfig):
         self,
         data_source_code: str,
     ) -> str:
-        # Create an in-memory representation of the Senzing configuration JSON.
-        load_result = self._library_handle.SzConfig_load_helper(as_c_char_p(self.config_definition))
-        self._check_result(load_result.return_code)
-        config_handle = load_result.response
+        with self._config_handle(is_modified=True) as config_handle:
+            register_data_source_result = self._library_handle.SzConfig_registerDataSource_helper(
+                as_c_uintptr_t(config_handle),
+                as_c_char_p(build_dsrc_code_json(data_source_code)),
+            )
+            return self._response_as_str(register_data_source_result)
 
-        # Register data source to in-memory representation of the Senzing configuration JSON.
-        register_data_source_result = self._library_handle.SzConfig_registerDataSource_helper(
-            as_c_uintptr_t(config_handle),
-            as_c_char_p(build_dsrc_code_json(data_source_code)),
-        )
-        with FreeCResources(self._library_handle, register_data_source_result.response):
-            self._check_result(register_data_source_result.return_code)
-            result = as_python_str(register_data_source_result.response)
+    @catch_sdk_exceptions
+    def unregister_data_source(
+        self,
+        data_source_code: str,
+    ) -> str:
+        with self._config_handle(is_modified=True) as config_handle:
+            unregister_data_source_result = self._library_handle.SzConfig_unregisterDataSource_helper(
+                as_c_uintptr_t(config_handle),
+                as_c_char_p(build_dsrc_code_json(data_source_code)),
+            )
+            self._check_result(unregister_data_source_result)
 
-        # Export in-memory representation to a JSON document.
-        save_result = self._library_handle.SzConfig_export_helper(as_c_uintptr_t(config_handle))
-        with FreeCResources(self._library_handle, save_result.response):
-            self._check_result(save_result.return_code)
-            self.config_definition = as_python_str(save_result.response)
+        return ""
 
-        # Delete the in-memory representation of the Senzing configuration JSON.
-        close_result = self._library_handle.SzConfig_close_helper(as_c_uintptr_t(config_handle))
-        self._check_result(close_result)
+    # -------------------------------------------------------------------------
+    # Bulk methods
+    # -------------------------------------------------------------------------
+
+    @catch_sdk_exceptions
+    def register_data_sources(self, data_source_codes: Iterable[str]) -> Dict[str, str]:
+        """
+        Register many data sources in one load and export of the Senzing configuration. Codes already registered,
+        found with a single read of the data source registry, are skipped. If any registration fails, outside a
+        session none of the changes are kept. Within a session() those made before the failure stay in the session's
+        configuration, to be exported unless the exception ends the session.
+
+        Args:
+            data_source_codes (Iterable[str]): Data source codes to register.
+
+        Raises:
+            SzSdkError: data_source_codes is a str or bytes rather than an iterable of codes.
+
+        Returns:
+            Dict[str, str]: For each code, the register_data_source() response, e.g. {"DSRC_ID": 1001}. For skipped
+            codes the response is built from the registry.
+        """
+        _check_data_source_codes(data_source_codes)
+        result: Dict[str, str] = {}
+        with self._config_handle(is_modified=True) as config_handle:
+            registered = self._registered_data_sources(config_handle)
+            for data_source_code in data_source_codes:
+                dsrc_code_json = build_dsrc_code_json(data_source_code)
+                if data_source_code in result:
+                    continue
+                if data_source_code.upper() in registered:
+                    result[data_source_code] = f'{{"DSRC_ID":{registered[data_source_code.upper()]}}}'
+                    continue
+                register_data_source_result = self._library_handle.SzConfig_registerDataSource_helper(
+                    as_c_uintptr_t(config_handle),
+                    as_c_char_p(dsrc_code_json),
+                )
+                result[data_source_code] = self._response_as_str(register_data_source_result)
+                registered[data_source_code.upper()] = _json_loads(result[data_source_code])["DSRC_ID"]
 
         return result
 
     @catch_sdk_exceptions
-    def unregister_data_source(
-        self,
-        data_source_code: str,
-    ) -> str:
-        # Create an in-memory representation of the Senzing configuration JSON.
-        load_result = self._library_handle.SzConfig_load_helper(as_c_char_p(self.config_definition))
-        self._check_result(load_result.return_code)
-        config_handle = load_result.response
+    def unregister_data_sources(self, data_source_codes: Iterable[str]) -> Dict[str, bool]:
+        """
+        Unregister many data sources in one load and export of the Senzing configuration. Codes not registered,
+        found with a single read of the data source registry, are skipped. If any unregistration fails, outside a
+        session none of the changes are kept. Within a session() those made before the failure stay in the session's
+        configuration, to be exported unless the exception ends the session.
 
-        # Unregister data source from in-memory representation of the Senzing configuration JSON.
-        unregister_data_source_result = self._library_handle.SzConfig_unregisterDataSource_helper(
-            as_c_uintptr_t(config_handle),
-            as_c_char_p(build_dsrc_code_json(data_source_code)),
-        )
-        self._check_result(unregister_data_source_result)
+        Args:
+            data_source_codes (Iterable[str]): Data source codes to unregister.
 
-        # Export in-memory representation to a JSON document.
-        save_result = self._library_handle.SzConfig_export_helper(as_c_uintptr_t(config_handle))
-        with FreeCResources(self._library_handle, save_result.response):
-            self._check_result(save_result.return_code)
-            self.config_definition = as_python_str(save_result.response)
+        Raises:
+            SzSdkError: data_source_codes is a str or bytes rather than an iterable of codes.
 
-        # Delete the in-memory representation of the Senzing configuration JSON.
-        close_result = self._library_handle.SzConfig_close_helper(as_c_uintptr_t(config_handle))
-        self._check_result(close_result)
+        Returns:
+            Dict[str, bool]: For each code, True if it was unregistered, False if it wasn't registered.
+        """
+        _check_data_source_codes(data_source_codes)
+        result: Dict[str, bool] = {}
+        with self._config_handle(is_modified=True) as config_handle:
+            registered = self._registered_data_sources(config_handle)
+            for data_source_code in data_source_codes:
+                dsrc_code_json = build_dsrc_code_json(data_source_code)
+                if data_source_code in result:
+                    continue
+                if data_source_code.upper() not in registered:
+                    result[data_source_code] = False
+                    continue
+                unregister_data_source_result = self._library_handle.SzConfig_unregisterDataSource_helper(
+                    as_c_uintptr_t(config_handle),
+                    as_c_char_p(dsrc_code_json),
+                )
+                self._check_result(unregister_data_source_result)
+                del registered[data_source_code.upper()]
+                result[data_source_code] = True
 
-        return ""
+        return result
+
+    # -------------------------------------------------------------------------
+    # Session methods
+    # -------------------------------------------------------------------------
+
+    @contextmanager
+    def session(self) -> Iterator[SzConfigCore]:
+        """
+        Keep the in-memory representation of the Senzing configuration open across many changes. Within the session
+        register_data_source(), unregister_data_source() and get_data_source_registry() use the open configuration
+        instead of loading, exporting and closing it on every call. The configuration is exported once, when the
+        session ends without an exception. If an exception is raised the changes made in the session are discarded.
+
+        A session isn't thread safe and sessions can't be nested.
+
+        Example:
+
+        .. code-block:: python
+
+            with sz_config.session():
+                for data_source_code in data_source_codes:
+                    sz_config.register_data_source(data_source_code)
+            config_definition = sz_config.export()
+
+        Raises:
+            SzSdkError: A session is already open.
+
+        Yields:
+            SzConfigCore: This SzConfigCore.
+        """
+        if self._session_handle is not None:
+            raise SzSdkError("a session is already open on this SzConfig")
+
+        self._session_handle = self._load(self.config_definition)
+        try:
+            yield self
+            self.config_definition = self._export(self._session_handle)
+        finally:
+            config_handle, self._session_handle = self._session_handle, None
+            self._close(config_handle)
 
     # -------------------------------------------------------------------------
     # Non-public SzConfigCore methods
     # -------------------------------------------------------------------------
 
+    def _close(self, config_handle: int) -> None:
+        """Delete the in-memory representation of the Senzing configuration JSON."""
+        close_result = self._library_handle.SzConfig_close_helper(as_c_uintptr_t(config_handle))
+        self._check_result(close_result)
+        handle_closed("config", config_handle)
+
+    @contextmanager
+    def _config_handle(self, is_modified: bool) -> Iterator[int]:
+        """
+        Yield the session's in-memory configuration if a session is open. Otherwise load config_definition and close it
+        afterwards, exporting it back to config_definition first if is_modified.
+        """
+        if self._session_handle is not None:
+            yield self._session_handle
+            return
+
+        config_handle = self._load(self.config_definition)
+        try:
+            yield config_handle
+            if is_modified:
+                self.config_definition = self._export(config_handle)
+        finally:
+            self._close(config_handle)
+
+    def _check_no_session(self, method_name: str) -> None:
+        if self._session_handle is not None:
+            raise SzSdkError(f"{method_name} can't be called while a session is open on this SzConfig")
+
     def _destroy(self) -> None:
         _ = self._library_handle.SzConfig_destroy()
 
+    def _export(self, config_handle: int) -> str:
+        """Export an in-memory representation of the Senzing configuration to a JSON document."""
+        save_result = self._library_handle.SzConfig_export_helper(as_c_uintptr_t(config_handle))
+        return self._response_as_str(save_result)
+
+    def _load(self, config_definition: str) -> int:
+        """Create an in-memory representation of a Senzing configuration JSON document, return its handle."""
+        load_result = self._library_handle.SzConfig_load_helper(as_c_char_p(config_definition))
+        self._check_result(load_result.return_code)
+        handle_opened("config", load_result.response, self)
+        return load_result.response  # type: ignore[no-any-return]
+
+    def _registered_data_sources(self, config_handle: int) -> Dict[str, int]:
+        """Return the DSRC_ID of each registered data source, keyed by DSRC_CODE."""
+        get_data_source_registry_result = self._library_handle.SzConfig_getDataSourceRegistry_helper(
+            as_c_uintptr_t(config_handle)
+        )
+        registry = _json_loads(self._response_as_str(get_data_source_registry_result))
+        # Senzing stores data source codes in upper case
+        return {data_source["DSRC_CODE"].upper(): data_source["DSRC_ID"] for data_source in registry["DATA_SOURCES"]}
+
+    @classmethod
+    def clear_template_cache(cls) -> None:
+        """
+        Discard the default templates cached by import_template(), e.g. after the Senzing resources are upgraded in
+        place. Subsequent calls to import_template() create and export the template again.
+        """
+        cls._template_cache.clear()
+
+    @classmethod
+    def disable_verified_config_cache(cls) -> None:
+        """Stop caching the hashes of verified configurations and discard those cached."""
+        with cls._verified_config_hashes_lock:
+            cls._verified_config_hashes_max = 0
+            cls._verified_config_hashes.clear()
+
+    @classmethod
+    def enable_verified_config_cache(cls, max_entries: int) -> None:
+        """
+        Cache, per process, the SHA-256 hashes of configurations that pass verify_config_definition(). Verifying a
+        configuration already in the cache, e.g. in SzConfigManagerCore.create_config_from_string(), doesn't load it
+        again. The least recently verified hashes are discarded to keep at most max_entries.
+
+        Args:
+            max_entries (int): The maximum number of hashes to cache.
+
+        Raises:
+            SzSdkError: max_entries is less than 1.
+        """
+        if max_entries <= 0:
+            raise SzSdkError(f"max_entries should be greater than 0, not {max_entries}")
+        with cls._verified_config_hashes_lock:
+            cls._verified_config_hashes_max = max_entries
+            while len(cls._verified_config_hashes) > max_entries:
+                cls._verified_config_hashes.popitem(last=False)
+
     def import_config_definition(self, config_definition: str) -> None:
         """
         Set the internal JSON document.
@@ -256,6 +477,7 @@ class SzConfigCore(SzConfig):
         Args:
             config_definition (str): A Senzing configuration JSON document.
         """
+        self._check_no_session("import_config_definition")
         self.config_definition = config_definition
 
     @catch_sdk_exceptions
@@ -267,19 +489,25 @@ class SzConfigCore(SzConfig):
         The default template is the Senzing configuration JSON document file,
         g2config.json, located in the PIPELINE.RESOURCEPATH path.
         """
+        self._check_no_session("import_template")
+        template = SzConfigCore._template_cache.get(self._resource_path) if self._resource_path is not None else None
+        if template is not None:
+            self.config_definition = template
+            return
+
         create_result = self._library_handle.SzConfig_create_helper()
         self._check_result(create_result.return_code)
         config_handle = create_result.response
+        handle_opened("config", config_handle, self)
 
-        # Export in-memory representation to a JSON document.
-        save_result = self._library_handle.SzConfig_export_helper(as_c_uintptr_t(config_handle))
-        with FreeCResources(self._library_handle, save_result.response):
-            self._check_result(save_result.return_code)
-            self.config_definition = as_python_str(save_result.response)
+        try:
+            self.config_definition = self._export(config_handle)
+        finally:
+            self._close(config_handle)
 
-        # Delete the in-memory representation of the Senzing configuration JSON.
-        close_result = self._library_handle.SzConfig_close_helper(as_c_uintptr_t(config_handle))
-        self._check_result(close_result)
+        # Concurrent misses may each export the template, they store the same value
+        if self._resource_path is not None:
+            SzConfigCore._template_cache[self._resource_path] = self.config_definition
 
     @catch_sdk_exceptions
     def _initialize(
@@ -294,6 +522,7 @@ class SzConfigCore(SzConfig):
             verbose_logging,
         )
         self._check_result(result)
+        self._resource_path = _resource_path(settings)
 
     @catch_sdk_exceptions
     def verify_config_definition(self, config_definition: str) -> None:
@@ -302,18 +531,20 @@ class SzConfigCore(SzConfig):
         This method does not update the internal Senzing configuration.
         If an error is not thrown, the Senzing configuration JSON is valid.
         """
-        # Create an in-memory representation of the Senzing configuration JSON.
-        load_result = self._library_handle.SzConfig_load_helper(as_c_char_p(config_definition))
-        self._check_result(load_result.return_code)
-        config_handle = load_result.response
-
-        # Export in-memory representation to a JSON document.
-        save_result = self._library_handle.SzConfig_export_helper(as_c_uintptr_t(config_handle))
-        with FreeCResources(self._library_handle, save_result.response):
-            self._check_result(save_result.return_code)
-            _ = as_python_str(save_result.response)
-
-        # Delete the in-memory representation of the Senzing configuration JSON.
-
-        close_result = self._library_handle.SzConfig_close_helper(as_c_uintptr_t(config_handle))
-        self._check_result(close_result)
+        # Loading parses and validates the document, exporting it again would only serialize it
+        if SzConfigCore._verified_config_hashes_max <= 0:
+            self._close(self._load(config_definition))
+            return
+
+        config_hash = hashlib.sha256(as_c_char_p(config_definition)).digest()
+        with SzConfigCore._verified_config_hashes_lock:
+            if config_hash in SzConfigCore._verified_config_hashes:
+                SzConfigCore._verified_config_hashes.move_to_end(config_hash)
+                return
+
+        self._close(self._load(config_definition))
+
+        with SzConfigCore._verified_config_hashes_lock:
+            SzConfigCore._verified_config_hashes[config_hash] = None
+            while len(SzConfigCore._verified_config_hashes) > SzConfigCore._verified_config_hashes_max:
+                SzConfigCore._verified_config_hashes.popitem(last=False)
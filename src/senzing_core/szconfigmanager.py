@@ -15,21 +15,21 @@ Example:
 """
 
 # pylint: disable=R0903
-from ctypes import POINTER, Structure, c_char, c_char_p, c_longlong, c_void_p
+import threading
+from collections import OrderedDict
+from ctypes import CDLL, POINTER, Structure, c_char, c_char_p, c_longlong, c_void_p
 from functools import partial
-from typing import Any, Dict, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
-from senzing import SzConfig, SzConfigManager
+from senzing import SzConfig, SzConfigManager, SzSdkError
 
 from ._helpers import (
-    FreeCResources,
     as_c_char_p,
-    as_python_str,
     as_str,
-    catch_sdk_exceptions,
-    check_is_destroyed,
     check_result_rc,
-    load_sz_library,
+    get_sz_library,
+    response_as_str,
+    sdk_method,
 )
 from .szconfig import SzConfigCore
 
@@ -78,6 +78,85 @@ class SzConfigMgrRegisterConfigResult(SzResponseLonglongReturnCodeResult):
     """In SzLang_helpers.h SzConfigMgr_registerConfig_result"""
 
 
+# -----------------------------------------------------------------------------
+# Declarations of C function input parameters and results
+# -----------------------------------------------------------------------------
+
+
+def _declare_function_signatures(library_handle: CDLL) -> None:
+    """
+    Initialize C function input parameters and results used by SzConfigManagerCore, called once per process.
+    Must be synchronized with er/sdk/c/libSzConfigMgr.h
+    """
+    library_handle.SzConfigMgr_destroy.argtypes = []
+    library_handle.SzConfigMgr_destroy.restype = c_longlong
+    library_handle.SzConfigMgr_getConfig_helper.argtypes = [c_longlong]
+    library_handle.SzConfigMgr_getConfig_helper.restype = SzConfigMgrGetConfigResult
+    library_handle.SzConfigMgr_getConfigRegistry_helper.argtypes = []
+    library_handle.SzConfigMgr_getConfigRegistry_helper.restype = SzConfigMgrGetConfigRegistryResult
+    library_handle.SzConfigMgr_getDefaultConfigID_helper.restype = SzConfigMgrGetDefaultConfigIDResult
+    library_handle.SzConfigMgr_init.argtypes = [c_char_p, c_char_p, c_longlong]
+    library_handle.SzConfigMgr_init.restype = c_longlong
+    library_handle.SzConfigMgr_registerConfig_helper.argtypes = [c_char_p, c_char_p]
+    library_handle.SzConfigMgr_registerConfig_helper.restype = SzConfigMgrRegisterConfigResult
+    library_handle.SzConfigMgr_replaceDefaultConfigID.argtypes = [
+        c_longlong,
+        c_longlong,
+    ]
+    library_handle.SzConfigMgr_replaceDefaultConfigID.restype = c_longlong
+    library_handle.SzConfigMgr_setDefaultConfigID.argtypes = [c_longlong]
+    library_handle.SzConfigMgr_setDefaultConfigID.restype = c_longlong
+    library_handle.SzHelper_free.argtypes = [c_void_p]
+
+
+# -----------------------------------------------------------------------------
+# Helpers
+# -----------------------------------------------------------------------------
+
+
+class _ConfigDefinitionCache:
+    """
+    Least recently used cache of config ID to Senzing configuration JSON document, bounded by the total size of the
+    documents in UTF-8 bytes. Registered configurations can't change, so entries are never invalidated.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        if max_bytes <= 0:
+            raise SzSdkError(f"max_bytes should be greater than 0, not {max_bytes}")
+        self._entries: OrderedDict[int, Tuple[str, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"bytes": 0, "evictions": 0, "hits": 0, "max_bytes": max_bytes, "misses": 0}
+
+    def get(self, config_id: int) -> Optional[str]:
+        """Return the configuration for config_id, or None if it isn't cached."""
+        with self._lock:
+            entry = self._entries.get(config_id)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(config_id)
+            self._stats["hits"] += 1
+            return entry[0]
+
+    def put(self, config_id: int, config_definition: str) -> None:
+        """Cache the configuration for config_id, evicting the least recently used to stay within max_bytes."""
+        size = len(config_definition.encode("utf-8"))
+        with self._lock:
+            if size > self._stats["max_bytes"] or config_id in self._entries:
+                return
+            self._entries[config_id] = (config_definition, size)
+            self._stats["bytes"] += size
+            while self._stats["bytes"] > self._stats["max_bytes"]:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._stats["bytes"] -= evicted_size
+                self._stats["evictions"] += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Return the cache's counters, sizes and number of entries."""
+        with self._lock:
+            return dict(self._stats, entries=len(self._entries))
+
+
 # -----------------------------------------------------------------------------
 # SzConfigManagerCore class
 # -----------------------------------------------------------------------------
@@ -111,7 +190,7 @@ class SzConfigManagerCore(SzConfigManager):
         _ = kwargs
 
         self._is_destroyed = False
-        self._library_handle = load_sz_library()
+        self._library_handle = get_sz_library(_declare_function_signatures)
 
         # Partial function to use this modules self._library_handle for exception handling
         self._check_result = partial(
@@ -121,28 +200,10 @@ class SzConfigManagerCore(SzConfigManager):
             self._library_handle.SzConfigMgr_getLastExceptionCode,
         )
 
-        # Initialize C function input parameters and results.
-        # Synchronized with er/sdk/c/libSzConfigMgr.h
-        self._library_handle.SzConfigMgr_destroy.argtypes = []
-        self._library_handle.SzConfigMgr_destroy.restype = c_longlong
-        self._library_handle.SzConfigMgr_getConfig_helper.argtypes = [c_longlong]
-        self._library_handle.SzConfigMgr_getConfig_helper.restype = SzConfigMgrGetConfigResult
-        self._library_handle.SzConfigMgr_getConfigRegistry_helper.argtypes = []
-        self._library_handle.SzConfigMgr_getConfigRegistry_helper.restype = SzConfigMgrGetConfigRegistryResult
-        self._library_handle.SzConfigMgr_getDefaultConfigID_helper.restype = SzConfigMgrGetDefaultConfigIDResult
-        self._library_handle.SzConfigMgr_init.argtypes = [c_char_p, c_char_p, c_longlong]
-        self._library_handle.SzConfigMgr_init.restype = c_longlong
-        self._library_handle.SzConfigMgr_registerConfig_helper.argtypes = [c_char_p, c_char_p]
-        self._library_handle.SzConfigMgr_registerConfig_helper.restype = SzConfigMgrRegisterConfigResult
-        self._library_handle.SzConfigMgr_replaceDefaultConfigID.argtypes = [
-            c_longlong,
-            c_longlong,
-        ]
-        self._library_handle.SzConfigMgr_replaceDefaultConfigID.restype = c_longlong
-        self._library_handle.SzConfigMgr_setDefaultConfigID.argtypes = [c_longlong]
-        self._library_handle.SzConfigMgr_setDefaultConfigID.restype = c_longlong
-        self._library_handle.SzHelper_free.argtypes = [c_void_p]
+        # Partial function to check the return code, convert and free responses from C functions
+        self._response_as_str = partial(response_as_str, self._library_handle.SzHelper_free, self._check_result)
 
+        self._config_cache: Optional[_ConfigDefinitionCache] = None
         self.instance_name = ""
         self.settings = ""
         self.config_id = 0
@@ -157,20 +218,21 @@ class SzConfigManagerCore(SzConfigManager):
     # SzConfigManager methods
     # -------------------------------------------------------------------------
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @sdk_method
     def create_config_from_config_id(self, config_id: int) -> SzConfig:
-        get_config_result = self._library_handle.SzConfigMgr_getConfig_helper(config_id)
-        with FreeCResources(self._library_handle, get_config_result.response):
-            self._check_result(get_config_result.return_code)
-            config_definition = as_python_str(get_config_result.response)
+        config_cache = self._config_cache
+        config_definition = config_cache.get(config_id) if config_cache is not None else None
+        if config_definition is None:
+            get_config_result = self._library_handle.SzConfigMgr_getConfig_helper(config_id)
+            config_definition = self._response_as_str(get_config_result)
+            if config_cache is not None:
+                config_cache.put(config_id, config_definition)
         result = SzConfigCore()
         result.import_config_definition(config_definition)
         result._initialize(self.instance_name, self.settings, self.verbose_logging)  # pylint: disable=protected-access
         return result
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @sdk_method
     def create_config_from_string(self, config_definition: str) -> SzConfig:
         result = SzConfigCore()
         result.verify_config_definition(config_definition)
@@ -178,29 +240,25 @@ class SzConfigManagerCore(SzConfigManager):
         result._initialize(self.instance_name, self.settings, self.verbose_logging)  # pylint: disable=protected-access
         return result
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @sdk_method
     def create_config_from_template(self) -> SzConfig:
         result = SzConfigCore()
         result._initialize(self.instance_name, self.settings, self.verbose_logging)  # pylint: disable=protected-access
         result.import_template()
         return result
 
-    @check_is_destroyed
+    @sdk_method
     def get_config_registry(self) -> str:
         result = self._library_handle.SzConfigMgr_getConfigRegistry_helper()
-        with FreeCResources(self._library_handle, result.response):
-            self._check_result(result.return_code)
-            return as_python_str(result.response)
+        return self._response_as_str(result)
 
-    @check_is_destroyed
+    @sdk_method
     def get_default_config_id(self) -> int:
         result = self._library_handle.SzConfigMgr_getDefaultConfigID_helper()
         self._check_result(result.return_code)
         return result.response  # type: ignore[no-any-return]
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @sdk_method
     def register_config(
         self,
         config_definition: str,
@@ -213,8 +271,7 @@ class SzConfigManagerCore(SzConfigManager):
         self._check_result(result.return_code)
         return result.response  # type: ignore[no-any-return]
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @sdk_method
     def replace_default_config_id(
         self,
         current_default_config_id: int,
@@ -225,15 +282,13 @@ class SzConfigManagerCore(SzConfigManager):
         )
         self._check_result(result)
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @sdk_method
     def set_default_config(self, config_definition: str, config_comment: str) -> int:
         config_id = self.register_config(config_definition, config_comment)
         self.set_default_config_id(config_id)
         return config_id
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @sdk_method
     def set_default_config_id(self, config_id: int) -> None:
         result = self._library_handle.SzConfigMgr_setDefaultConfigID(config_id)
         self._check_result(result)
@@ -242,6 +297,34 @@ class SzConfigManagerCore(SzConfigManager):
     # Public non-interface methods
     # -------------------------------------------------------------------------
 
+    def config_cache_stats(self) -> Dict[str, int]:
+        """
+        Return the counters and sizes of the cache enabled by enable_config_cache().
+
+        Returns:
+            Dict[str, int]: bytes, entries, evictions, hits, max_bytes and misses. Empty if the cache isn't enabled.
+        """
+        config_cache = self._config_cache
+        return config_cache.stats() if config_cache is not None else {}
+
+    def disable_config_cache(self) -> None:
+        """Stop caching configurations and discard those cached."""
+        self._config_cache = None
+
+    def enable_config_cache(self, max_bytes: int) -> None:
+        """
+        Cache the configurations fetched by create_config_from_config_id(), replacing any existing cache. Registered
+        configurations can't change, so repeated calls for a config ID don't need to fetch it from the repository
+        again. The least recently used configurations are evicted to keep the cache within max_bytes.
+
+        Args:
+            max_bytes (int): The maximum total size of the cached configurations, in UTF-8 bytes.
+
+        Raises:
+            SzSdkError: max_bytes is less than 1.
+        """
+        self._config_cache = _ConfigDefinitionCache(max_bytes)
+
     # NOTE - Not to use check_is_destroyed decorator
     def _destroy(self) -> None:
         if not self._is_destroyed:
@@ -253,8 +336,7 @@ class SzConfigManagerCore(SzConfigManager):
         result = self._library_handle.SzConfigMgr_destroy()
         self._check_result(result)
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @sdk_method
     def _initialize(
         self,
         instance_name: str,
@@ -0,0 +1,168 @@
+"""
+``senzing_core.szconfigwatcher.SzConfigWatcher`` reinitializes the Senzing engine when the default configuration in
+the repository changes, for example after another node registers a new data source.
+
+A background thread periodically compares SzConfigManager.get_default_config_id() with
+SzEngine.get_active_config_id(). When they differ the watcher holds back new SzEngineCore calls, waits for the calls in
+progress to finish, reinitializes with the new default configuration and lets calls resume. The length of each pause
+is reported by stats().
+
+Example:
+
+.. code-block:: python
+
+    from senzing_core import SzAbstractFactoryCore, SzConfigWatcher
+
+    sz_abstract_factory = SzAbstractFactoryCore(instance_name, settings)
+    sz_engine = sz_abstract_factory.create_engine()
+
+    with SzConfigWatcher(sz_abstract_factory, poll_interval=30):
+        result = sz_engine.get_entity_by_entity_id(1)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from senzing import SzAbstractFactory, SzSdkError
+
+from ._helpers import ReaderWriterGate
+from ._histogram import LatencyHistogram
+from .szengine import SzEngineCore
+
+# Metadata
+
+__all__ = ["SzConfigWatcher"]
+__updated__ = "2025-10-20"
+
+DEFAULT_POLL_INTERVAL = 10.0
+
+
+# -----------------------------------------------------------------------------
+# SzConfigWatcher class
+# -----------------------------------------------------------------------------
+
+
+class SzConfigWatcher:
+    """
+    Watch for changes to the default configuration and reinitialize the Senzing engine without failing the calls in
+    progress. While started, every SzEngineCore call in the process holds a reader on the watcher's gate and
+    reinitializing holds the writer. Calls already in progress when the watcher starts aren't waited for. One watcher
+    can be started at a time.
+
+    Args:
+        sz_abstract_factory (SzAbstractFactory): The abstract factory to create the SzConfigManager and SzEngine used to
+            compare config IDs and to reinitialize.
+        poll_interval (float, optional): Seconds between checks. Defaults to 10.
+
+    Raises:
+        SzSdkError: poll_interval isn't greater than 0.
+    """
+
+    def __init__(self, sz_abstract_factory: SzAbstractFactory, poll_interval: float = DEFAULT_POLL_INTERVAL) -> None:
+        if poll_interval <= 0:
+            raise SzSdkError(f"poll_interval must be greater than 0, received {poll_interval}")
+
+        self._gate = ReaderWriterGate()
+        self._last_error: Optional[Exception] = None
+        self._lock = threading.Lock()
+        self._pauses = LatencyHistogram()
+        self._poll_interval = poll_interval
+        self._stats = {"checks": 0, "errors": 0, "reinitializations": 0}
+        self._stop_event = threading.Event()
+        self._sz_abstract_factory = sz_abstract_factory
+        self._sz_config_manager = sz_abstract_factory.create_configmanager()
+        self._sz_engine = sz_abstract_factory.create_engine()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> SzConfigWatcher:
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    @property
+    def last_error(self) -> Optional[Exception]:
+        """Return the last error raised checking or reinitializing in the background, or None."""
+        with self._lock:
+            return self._last_error
+
+    def check(self) -> bool:
+        """
+        Compare the default and active config IDs once and reinitialize if they differ. Called periodically once
+        started, can also be called directly, e.g. after registering a new default configuration.
+
+        Returns:
+            bool: True if the engine was reinitialized.
+        """
+        default_config_id = self._sz_config_manager.get_default_config_id()
+        active_config_id = self._sz_engine.get_active_config_id()
+        with self._lock:
+            self._stats["checks"] += 1
+        if default_config_id == active_config_id:
+            return False
+
+        start = time.perf_counter_ns()
+        with self._gate.writer():
+            self._sz_abstract_factory.reinitialize(default_config_id)
+        pause = time.perf_counter_ns() - start
+
+        with self._lock:
+            self._pauses.record(pause)
+            self._stats["reinitializations"] += 1
+        return True
+
+    def start(self) -> None:
+        """
+        Start gating SzEngineCore calls and checking for changes every poll_interval seconds.
+
+        Raises:
+            SzSdkError: This or another watcher is already started.
+        """
+        with self._lock:
+            if SzEngineCore._call_gate is not None:  # pylint: disable=protected-access
+                raise SzSdkError("an SzConfigWatcher is already started, stop it first")
+            SzEngineCore._call_gate = self._gate  # pylint: disable=protected-access
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name="SzConfigWatcher", daemon=True)
+            self._thread.start()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the number of checks, errors and reinitializations and the length of the pauses in SzEngineCore calls
+        while reinitializing, in milliseconds.
+
+        Returns:
+            Dict[str, Any]: For example {"checks": 10, "errors": 0, "reinitializations": 1, "pause": {"count": 1,
+            "min_ms": 12.1, ...}}
+        """
+        with self._lock:
+            return dict(self._stats, pause=self._pauses.summary())
+
+    def stop(self) -> None:
+        """Stop checking for changes and stop gating SzEngineCore calls."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            self._stop_event.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        with self._lock:
+            if SzEngineCore._call_gate is self._gate:  # pylint: disable=protected-access
+                SzEngineCore._call_gate = None  # pylint: disable=protected-access
+
+    # -------------------------------------------------------------------------
+    # Non-public SzConfigWatcher methods
+    # -------------------------------------------------------------------------
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self._poll_interval):
+            # NOTE - Any exception is kept rather than ending the thread, which would leave calls gated for nothing
+            try:
+                self.check()
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                with self._lock:
+                    self._last_error = err
+                    self._stats["errors"] += 1
@@ -16,21 +16,28 @@ Example:
 
 # pylint: disable=R0903
 
-from ctypes import POINTER, Structure, c_char, c_char_p, c_int, c_longlong, c_void_p
+from ctypes import (
+    CDLL,
+    POINTER,
+    Structure,
+    c_char,
+    c_char_p,
+    c_int,
+    c_longlong,
+    c_void_p,
+)
 from functools import partial
 from typing import Any, Dict, Union
 
 from senzing import SzDiagnostic, SzNotInitializedError
 
 from ._helpers import (
-    FreeCResources,
     as_c_char_p,
-    as_python_str,
     as_str,
-    catch_sdk_exceptions,
-    check_is_destroyed,
     check_result_rc,
-    load_sz_library,
+    get_sz_library,
+    response_as_str,
+    sdk_method,
 )
 
 # Metadata
@@ -65,6 +72,38 @@ class SzDiagnosticGetRepositoryInfoResult(SzResponseReturnCodeResult):
     """In SzLang_helpers.h SzDiagnostic_getRepositoryInfo_result"""
 
 
+# -----------------------------------------------------------------------------
+# Declarations of C function input parameters and results
+# -----------------------------------------------------------------------------
+
+
+def _declare_function_signatures(library_handle: CDLL) -> None:
+    """
+    Initialize C function input parameters and results used by SzDiagnosticCore, called once per process.
+    Must be synchronized with er/sdk/c/libSzDiagnostic.h
+    """
+    library_handle.SzDiagnostic_checkRepositoryPerformance_helper.argtypes = [c_longlong]
+    library_handle.SzDiagnostic_checkRepositoryPerformance_helper.restype = SzDiagnosticCheckRepositoryPerformanceResult
+    library_handle.SzDiagnostic_destroy.argtypes = []
+    library_handle.SzDiagnostic_destroy.restype = c_longlong
+    library_handle.SzDiagnostic_getRepositoryInfo_helper.argtypes = []
+    library_handle.SzDiagnostic_getFeature_helper.restype = SzDiagnosticGetFeatureResult
+    library_handle.SzDiagnostic_getRepositoryInfo_helper.restype = SzDiagnosticGetRepositoryInfoResult
+    library_handle.SzDiagnostic_getFeature_helper.argtypes = [c_longlong]
+    library_handle.SzDiagnostic_init.argtypes = [c_char_p, c_char_p, c_int]
+    library_handle.SzDiagnostic_init.restype = c_longlong
+    library_handle.SzDiagnostic_initWithConfigID.argtypes = [
+        c_char_p,
+        c_char_p,
+        c_longlong,
+        c_longlong,
+    ]
+    library_handle.SzDiagnostic_initWithConfigID.restype = c_longlong
+    library_handle.SzDiagnostic_reinit.argtypes = [c_longlong]
+    library_handle.SzDiagnostic_reinit.restype = c_longlong
+    library_handle.SzHelper_free.argtypes = [c_void_p]
+
+
 # -----------------------------------------------------------------------------
 # SzDiagnosticCore class
 # -----------------------------------------------------------------------------
@@ -98,7 +137,7 @@ class SzDiagnosticCore(SzDiagnostic):
         _ = kwargs
 
         self._is_destroyed = False
-        self._library_handle = load_sz_library()
+        self._library_handle = get_sz_library(_declare_function_signatures)
 
         # Partial function to use this modules self._library_handle for exception handling
         self._check_result = partial(
@@ -108,30 +147,8 @@ class SzDiagnosticCore(SzDiagnostic):
             self._library_handle.SzDiagnostic_getLastExceptionCode,
         )
 
-        # Initialize C function input parameters and results.
-        # Must be synchronized with er/sdk/c/libSzDiagnostic.h
-        self._library_handle.SzDiagnostic_checkRepositoryPerformance_helper.argtypes = [c_longlong]
-        self._library_handle.SzDiagnostic_checkRepositoryPerformance_helper.restype = (
-            SzDiagnosticCheckRepositoryPerformanceResult
-        )
-        self._library_handle.SzDiagnostic_destroy.argtypes = []
-        self._library_handle.SzDiagnostic_destroy.restype = c_longlong
-        self._library_handle.SzDiagnostic_getRepositoryInfo_helper.argtypes = []
-        self._library_handle.SzDiagnostic_getFeature_helper.restype = SzDiagnosticGetFeatureResult
-        self._library_handle.SzDiagnostic_getRepositoryInfo_helper.restype = SzDiagnosticGetRepositoryInfoResult
-        self._library_handle.SzDiagnostic_getFeature_helper.argtypes = [c_longlong]
-        self._library_handle.SzDiagnostic_init.argtypes = [c_char_p, c_char_p, c_int]
-        self._library_handle.SzDiagnostic_init.restype = c_longlong
-        self._library_handle.SzDiagnostic_initWithConfigID.argtypes = [
-            c_char_p,
-            c_char_p,
-            c_longlong,
-            c_longlong,
-        ]
-        self._library_handle.SzDiagnostic_initWithConfigID.restype = c_longlong
-        self._library_handle.SzDiagnostic_reinit.argtypes = [c_longlong]
-        self._library_handle.SzDiagnostic_reinit.restype = c_longlong
-        self._library_handle.SzHelper_free.argtypes = [c_void_p]
+        # Partial function to check the return code, convert and free responses from C functions
+        self._response_as_str = partial(response_as_str, self._library_handle.SzHelper_free, self._check_result)
 
     @property
     def is_destroyed(self) -> bool:
@@ -142,13 +159,10 @@ class SzDiagnosticCore(SzDiagnostic):
     # SzDiagnostic methods
     # -------------------------------------------------------------------------
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @sdk_method
     def check_repository_performance(self, seconds_to_run: int) -> str:
         result = self._library_handle.SzDiagnostic_checkRepositoryPerformance_helper(seconds_to_run)
-        with FreeCResources(self._library_handle, result.response):
-            self._check_result(result.return_code)
-            return as_python_str(result.response)
+        return self._response_as_str(result)
 
     # NOTE - Not to use check_is_destroyed decorator
     def _destroy(self) -> None:
@@ -161,23 +175,17 @@ class SzDiagnosticCore(SzDiagnostic):
         result = self._library_handle.SzDiagnostic_destroy()
         self._check_result(result)
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @sdk_method
     def get_feature(self, feature_id: int) -> str:
         result = self._library_handle.SzDiagnostic_getFeature_helper(feature_id)
-        with FreeCResources(self._library_handle, result.response):
-            self._check_result(result.return_code)
-            return as_python_str(result.response)
+        return self._response_as_str(result)
 
-    @check_is_destroyed
+    @sdk_method
     def get_repository_info(self) -> str:
         result = self._library_handle.SzDiagnostic_getRepositoryInfo_helper()
-        with FreeCResources(self._library_handle, result.response):
-            self._check_result(result.return_code)
-            return as_python_str(result.response)
+        return self._response_as_str(result)
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @sdk_method
     def _initialize(
         self,
         instance_name: str,
@@ -202,22 +210,21 @@ class SzDiagnosticCore(SzDiagnostic):
         )
         self._check_result(result)
 
-    # NOTE - Internal use only!
+    # NOTE - Internal use only! Calls the Senzing library directly so call observers don't see the check
     def _internal_is_initialized(self) -> bool:
         try:
-            _ = self.get_repository_info()
+            _ = self._response_as_str(self._library_handle.SzDiagnostic_getRepositoryInfo_helper())
         except SzNotInitializedError:
             return False
 
         return True
 
-    @check_is_destroyed
+    @sdk_method
     def purge_repository(self) -> None:
         result = self._library_handle.SzDiagnostic_purgeRepository()
         self._check_result(result)
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @sdk_method
     def _reinitialize(self, config_id: int) -> None:
         result = self._library_handle.SzDiagnostic_reinit(config_id)
         self._check_result(result)
@@ -19,6 +19,7 @@ Example:
 from __future__ import annotations
 
 from ctypes import (
+    CDLL,
     POINTER,
     Structure,
     c_char,
@@ -34,25 +35,29 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 from senzing import SZ_NO_INFO, SzEngine, SzEngineFlags, SzNotInitializedError
 
 from ._helpers import (
-    FreeCResources,
+    ReaderWriterGate,
     as_c_char_p,
     as_c_uintptr_t,
-    as_python_str,
     as_str,
     build_data_sources_json,
     build_entities_json,
     build_records_json,
-    catch_sdk_exceptions,
-    check_is_destroyed,
     check_result_rc,
-    load_sz_library,
+    gated_sdk_method,
+    get_sz_library,
+    response_as_str,
+    sdk_method,
 )
+from ._observers import handle_closed, handle_opened
 
 # Metadata
 
 __all__ = ["SzEngineCore"]
 __updated__ = "2025-08-06"
 
+# NOTE - A plain int, so flags passed as ints are masked without the order of magnitude slower SzEngineFlags operators
+_SZ_WITH_INFO = int(SzEngineFlags.SZ_WITH_INFO)
+
 
 # -----------------------------------------------------------------------------
 # Classes that are result structures from calls to Senzing
@@ -219,6 +224,259 @@ class SzWhySearchV2Result(SzResponseReturnCodeResult):
     """In SzLang_helpers.h Sz_whyEntities_V2_result"""
 
 
+# -----------------------------------------------------------------------------
+# Declarations of C function input parameters and results
+# -----------------------------------------------------------------------------
+
+
+def _declare_function_signatures(library_handle: CDLL) -> None:
+    """
+    Initialize C function input parameters and results used by SzEngineCore, called once per process.
+    Must be synchronized with /opt/senzing/er/sdk/c/libSz.h
+    """
+    library_handle.Szinternal_bulkLoad.argtypes = [POINTER(POINTER(c_char))]
+    library_handle.Szinternal_bulkLoad.restype = c_longlong
+    library_handle.Sz_addRecord.argtypes = [
+        c_char_p,
+        c_char_p,
+        c_char_p,
+    ]
+    library_handle.Sz_addRecord.restype = c_longlong
+    library_handle.Sz_addRecordWithInfo_helper.argtypes = [
+        c_char_p,
+        c_char_p,
+        c_char_p,
+        c_longlong,
+    ]
+    library_handle.Sz_addRecordWithInfo_helper.restype = SzAddRecordWithInfoResult
+    library_handle.Sz_closeExportReport_helper.argtypes = [
+        POINTER(c_uint),
+    ]
+    library_handle.Sz_closeExportReport_helper.restype = c_longlong
+    library_handle.Sz_countRedoRecords.argtypes = []
+    library_handle.Sz_countRedoRecords.restype = c_longlong
+    library_handle.Sz_deleteRecord.argtypes = [
+        c_char_p,
+        c_char_p,
+    ]
+    library_handle.Sz_deleteRecord.restype = c_longlong
+    library_handle.Sz_deleteRecordWithInfo_helper.argtypes = [
+        c_char_p,
+        c_char_p,
+        c_longlong,
+    ]
+    library_handle.Sz_deleteRecordWithInfo_helper.restype = SzDeleteRecordWithInfoResult
+    library_handle.Sz_destroy.argtypes = []
+    library_handle.Sz_destroy.restype = c_longlong
+    library_handle.Sz_exportCSVEntityReport_helper.argtypes = [
+        c_char_p,
+        c_longlong,
+    ]
+    library_handle.Sz_exportCSVEntityReport_helper.restype = SzExportCSVEntityReportResult
+    library_handle.Sz_exportJSONEntityReport_helper.argtypes = [c_longlong]
+    library_handle.Sz_exportJSONEntityReport_helper.restype = SzExportJSONEntityReportResult
+    library_handle.Sz_fetchNext_helper.argtypes = [
+        POINTER(c_uint),
+    ]
+    library_handle.Sz_fetchNext_helper.restype = SzFetchNextResult
+    library_handle.Sz_findInterestingEntitiesByEntityID_helper.argtypes = [
+        c_longlong,
+        c_longlong,
+    ]
+    library_handle.Sz_findInterestingEntitiesByEntityID_helper.restype = SzFindInterestingEntitiesByEntityIDResult
+    library_handle.Sz_findInterestingEntitiesByRecordID_helper.argtypes = [
+        c_char_p,
+        c_char_p,
+        c_longlong,
+    ]
+    library_handle.Sz_findInterestingEntitiesByRecordID_helper.restype = SzFindInterestingEntitiesByRecordIDResult
+    library_handle.Sz_findNetworkByEntityID_V2_helper.argtypes = [
+        c_char_p,
+        c_longlong,
+        c_longlong,
+        c_longlong,
+        c_longlong,
+    ]
+    library_handle.Sz_findNetworkByEntityID_V2_helper.restype = SzFindNetworkByEntityIDV2Result
+    library_handle.Sz_findNetworkByRecordID_V2_helper.argtypes = [
+        c_char_p,
+        c_longlong,
+        c_longlong,
+        c_longlong,
+        c_longlong,
+    ]
+    library_handle.Sz_findNetworkByRecordID_V2_helper.restype = SzFindNetworkByRecordIDV2Result
+    library_handle.Sz_findPathByEntityID_V2_helper.argtypes = [
+        c_longlong,
+        c_longlong,
+        c_longlong,
+        c_longlong,
+    ]
+    library_handle.Sz_findPathByEntityID_V2_helper.restype = SzFindPathByEntityIDV2Result
+    library_handle.Sz_findPathByEntityIDIncludingSource_V2_helper.argtypes = [
+        c_longlong,
+        c_longlong,
+        c_longlong,
+        c_char_p,
+        c_char_p,
+        c_longlong,
+    ]
+    library_handle.Sz_findPathByEntityIDIncludingSource_V2_helper.restype = SzFindPathIncludingSourceByEntityIDV2Result
+    library_handle.Sz_findPathByEntityIDWithAvoids_V2_helper.argtypes = [
+        c_longlong,
+        c_longlong,
+        c_longlong,
+        c_char_p,
+        c_longlong,
+    ]
+    library_handle.Sz_findPathByEntityIDWithAvoids_V2_helper.restype = SzFindPathExcludingByEntityIDV2Result
+    library_handle.Sz_findPathByRecordID_V2_helper.argtypes = [
+        c_char_p,
+        c_char_p,
+        c_char_p,
+        c_char_p,
+        c_longlong,
+        c_longlong,
+    ]
+    library_handle.Sz_findPathByRecordID_V2_helper.restype = SzFindPathByRecordIDV2Result
+    library_handle.Sz_findPathByRecordIDIncludingSource_V2_helper.argtypes = [
+        c_char_p,
+        c_char_p,
+        c_char_p,
+        c_char_p,
+        c_longlong,
+        c_char_p,
+        c_char_p,
+        c_longlong,
+    ]
+    library_handle.Sz_findPathByRecordIDIncludingSource_V2_helper.restype = SzFindPathIncludingSourceByRecordIDV2Result
+    library_handle.Sz_findPathByRecordIDWithAvoids_V2_helper.argtypes = [
+        c_char_p,
+        c_char_p,
+        c_char_p,
+        c_char_p,
+        c_longlong,
+        c_char_p,
+        c_longlong,
+    ]
+    library_handle.Sz_findPathByRecordIDWithAvoids_V2_helper.restype = SzFindPathExcludingByRecordIDV2Result
+    library_handle.Sz_getActiveConfigID_helper.argtypes = []
+    library_handle.Sz_getActiveConfigID_helper.restype = SzGetActiveConfigIDResult
+    library_handle.Sz_getEntityByEntityID_V2_helper.argtypes = [
+        c_longlong,
+        c_longlong,
+    ]
+    library_handle.Sz_getEntityByEntityID_V2_helper.restype = SzGetEntityByEntityIDV2Result
+    library_handle.Sz_getEntityByRecordID_V2_helper.argtypes = [
+        c_char_p,
+        c_char_p,
+        c_longlong,
+    ]
+    library_handle.Sz_getEntityByRecordID_V2_helper.restype = SzGetEntityByRecordIDV2Result
+    library_handle.Sz_getRecord_V2_helper.argtypes = [
+        c_char_p,
+        c_char_p,
+        c_longlong,
+    ]
+    library_handle.Sz_getRecord_V2_helper.restype = SzGetRecordV2Result
+    library_handle.Sz_getRecordPreview_helper.argtypes = [
+        c_char_p,
+        c_longlong,
+    ]
+    library_handle.Sz_getRecordPreview_helper.restype = SzGetRecordPreviewResult
+    library_handle.Sz_getRedoRecord_helper.argtypes = []
+    library_handle.Sz_getRedoRecord_helper.restype = SzGetRedoRecordResult
+    library_handle.Sz_getVirtualEntityByRecordID_V2_helper.argtypes = [
+        c_char_p,
+        c_longlong,
+    ]
+    library_handle.Sz_getVirtualEntityByRecordID_V2_helper.restype = SzGetVirtualEntityByRecordIDV2Result
+    library_handle.Sz_howEntityByEntityID_V2_helper.argtypes = [
+        c_longlong,
+        c_longlong,
+    ]
+    library_handle.Sz_howEntityByEntityID_V2_helper.restype = SzHowEntityByEntityIDV2Result
+    library_handle.Sz_init.argtypes = [c_char_p, c_char_p, c_longlong]
+    library_handle.Sz_init.restype = c_longlong
+    library_handle.Sz_initWithConfigID.argtypes = [
+        c_char_p,
+        c_char_p,
+        c_longlong,
+        c_longlong,
+    ]
+    library_handle.Sz_processRedoRecord.argtypes = [
+        c_char_p,
+    ]
+    library_handle.Sz_processRedoRecord.restype = c_longlong
+    library_handle.Sz_processRedoRecordWithInfo_helper.argtypes = [
+        c_char_p,
+    ]
+    library_handle.Sz_processRedoRecordWithInfo_helper.restype = SzProcessRedoRecordWithInfoResult
+    library_handle.Sz_reevaluateEntity.argtypes = [c_longlong, c_longlong]
+    library_handle.Sz_reevaluateEntity.restype = c_longlong
+    library_handle.Sz_reevaluateEntityWithInfo_helper.argtypes = [
+        c_longlong,
+        c_longlong,
+    ]
+    library_handle.Sz_reevaluateEntityWithInfo_helper.restype = SzReevaluateEntityWithInfoResult
+    library_handle.Sz_reevaluateRecord.argtypes = [
+        c_char_p,
+        c_char_p,
+        c_longlong,
+    ]
+    library_handle.Sz_reevaluateRecord.restype = c_longlong
+    library_handle.Sz_reevaluateRecordWithInfo_helper.argtypes = [
+        c_char_p,
+        c_char_p,
+        c_longlong,
+    ]
+    library_handle.Sz_reevaluateRecordWithInfo_helper.restype = SzReevaluateRecordWithInfoResult
+    library_handle.Sz_reinit.argtypes = [c_longlong]
+    library_handle.Sz_reinit.restype = c_longlong
+    library_handle.Sz_searchByAttributes_V3_helper.argtypes = [
+        c_char_p,
+        c_char_p,
+        c_longlong,
+    ]
+    library_handle.Sz_searchByAttributes_V3_helper.restype = SzSearchByAttributesV3Result
+    library_handle.Sz_stats_helper.argtypes = []
+    library_handle.Sz_stats_helper.restype = SzStatsResult
+    library_handle.Sz_whyEntities_V2_helper.argtypes = [
+        c_longlong,
+        c_longlong,
+        c_longlong,
+    ]
+    library_handle.Sz_whyEntities_V2_helper.restype = SzWhyEntitiesV2Result
+    library_handle.Sz_whyRecordInEntity_V2_helper.argtypes = [
+        c_char_p,
+        c_char_p,
+        c_longlong,
+    ]
+    library_handle.Sz_whyRecords_V2_helper.restype = SzWhyRecordsV2Result
+    library_handle.Sz_whyRecordInEntity_V2_helper.restype = SzWhyRecordInEntityV2Result
+    library_handle.Sz_whyRecords_V2_helper.argtypes = [
+        c_char_p,
+        c_char_p,
+        c_char_p,
+        c_char_p,
+        c_longlong,
+    ]
+    library_handle.Sz_whySearch_helper.restype = SzWhySearchResult
+    library_handle.Sz_whySearch_helper.argtypes = [
+        c_char_p,
+        c_longlong,
+        c_char_p,
+    ]
+    library_handle.Sz_whySearch_V2_helper.restype = SzWhySearchV2Result
+    library_handle.Sz_whySearch_V2_helper.argtypes = [
+        c_char_p,
+        c_longlong,
+        c_char_p,
+        c_longlong,
+    ]
+    library_handle.SzHelper_free.argtypes = [c_void_p]
+
+
 # -----------------------------------------------------------------------------
 # SzEngineCore class
 # -----------------------------------------------------------------------------
@@ -244,6 +502,9 @@ class SzEngineCore(SzEngine):
 
     """
 
+    # Set by SzConfigWatcher, shared by all instances as they share the process's Senzing engine
+    _call_gate: Optional[ReaderWriterGate] = None
+
     # -------------------------------------------------------------------------
     # Dunder/magic methods
     # -------------------------------------------------------------------------
@@ -252,10 +513,10 @@ class SzEngineCore(SzEngine):
         _ = kwargs
 
         self._is_destroyed = False
-        self._library_handle = load_sz_library()
+        self._library_handle = get_sz_library(_declare_function_signatures)
 
         # Mask for removing SDK specific flags not supplied to method call
-        self._sdk_flags_mask = ~(SzEngineFlags.SZ_WITH_INFO)
+        self._sdk_flags_mask = ~_SZ_WITH_INFO
 
         # Partial function to use this modules self._library_handle for exception handling
         self._check_result = partial(
@@ -265,257 +526,8 @@ class SzEngineCore(SzEngine):
             self._library_handle.Sz_getLastExceptionCode,
         )
 
-        # Initialize C function input parameters and results.
-        # Must be synchronized with /opt/senzing/er/sdk/c/libSz.h
-        self._library_handle.Szinternal_bulkLoad.argtypes = [POINTER(POINTER(c_char))]
-        self._library_handle.Szinternal_bulkLoad.restype = c_longlong
-        self._library_handle.Sz_addRecord.argtypes = [
-            c_char_p,
-            c_char_p,
-            c_char_p,
-        ]
-        self._library_handle.Sz_addRecord.restype = c_longlong
-        self._library_handle.Sz_addRecordWithInfo_helper.argtypes = [
-            c_char_p,
-            c_char_p,
-            c_char_p,
-            c_longlong,
-        ]
-        self._library_handle.Sz_addRecordWithInfo_helper.restype = SzAddRecordWithInfoResult
-        self._library_handle.Sz_closeExportReport_helper.argtypes = [
-            POINTER(c_uint),
-        ]
-        self._library_handle.Sz_closeExportReport_helper.restype = c_longlong
-        self._library_handle.Sz_countRedoRecords.argtypes = []
-        self._library_handle.Sz_countRedoRecords.restype = c_longlong
-        self._library_handle.Sz_deleteRecord.argtypes = [
-            c_char_p,
-            c_char_p,
-        ]
-        self._library_handle.Sz_deleteRecord.restype = c_longlong
-        self._library_handle.Sz_deleteRecordWithInfo_helper.argtypes = [
-            c_char_p,
-            c_char_p,
-            c_longlong,
-        ]
-        self._library_handle.Sz_deleteRecordWithInfo_helper.restype = SzDeleteRecordWithInfoResult
-        self._library_handle.Sz_destroy.argtypes = []
-        self._library_handle.Sz_destroy.restype = c_longlong
-        self._library_handle.Sz_exportCSVEntityReport_helper.argtypes = [
-            c_char_p,
-            c_longlong,
-        ]
-        self._library_handle.Sz_exportCSVEntityReport_helper.restype = SzExportCSVEntityReportResult
-        self._library_handle.Sz_exportJSONEntityReport_helper.argtypes = [c_longlong]
-        self._library_handle.Sz_exportJSONEntityReport_helper.restype = SzExportJSONEntityReportResult
-        self._library_handle.Sz_fetchNext_helper.argtypes = [
-            POINTER(c_uint),
-        ]
-        self._library_handle.Sz_fetchNext_helper.restype = SzFetchNextResult
-        self._library_handle.Sz_findInterestingEntitiesByEntityID_helper.argtypes = [
-            c_longlong,
-            c_longlong,
-        ]
-        self._library_handle.Sz_findInterestingEntitiesByEntityID_helper.restype = (
-            SzFindInterestingEntitiesByEntityIDResult
-        )
-        self._library_handle.Sz_findInterestingEntitiesByRecordID_helper.argtypes = [
-            c_char_p,
-            c_char_p,
-            c_longlong,
-        ]
-        self._library_handle.Sz_findInterestingEntitiesByRecordID_helper.restype = (
-            SzFindInterestingEntitiesByRecordIDResult
-        )
-        self._library_handle.Sz_findNetworkByEntityID_V2_helper.argtypes = [
-            c_char_p,
-            c_longlong,
-            c_longlong,
-            c_longlong,
-            c_longlong,
-        ]
-        self._library_handle.Sz_findNetworkByEntityID_V2_helper.restype = SzFindNetworkByEntityIDV2Result
-        self._library_handle.Sz_findNetworkByRecordID_V2_helper.argtypes = [
-            c_char_p,
-            c_longlong,
-            c_longlong,
-            c_longlong,
-            c_longlong,
-        ]
-        self._library_handle.Sz_findNetworkByRecordID_V2_helper.restype = SzFindNetworkByRecordIDV2Result
-        self._library_handle.Sz_findPathByEntityID_V2_helper.argtypes = [
-            c_longlong,
-            c_longlong,
-            c_longlong,
-            c_longlong,
-        ]
-        self._library_handle.Sz_findPathByEntityID_V2_helper.restype = SzFindPathByEntityIDV2Result
-        self._library_handle.Sz_findPathByEntityIDIncludingSource_V2_helper.argtypes = [
-            c_longlong,
-            c_longlong,
-            c_longlong,
-            c_char_p,
-            c_char_p,
-            c_longlong,
-        ]
-        self._library_handle.Sz_findPathByEntityIDIncludingSource_V2_helper.restype = (
-            SzFindPathIncludingSourceByEntityIDV2Result
-        )
-        self._library_handle.Sz_findPathByEntityIDWithAvoids_V2_helper.argtypes = [
-            c_longlong,
-            c_longlong,
-            c_longlong,
-            c_char_p,
-            c_longlong,
-        ]
-        self._library_handle.Sz_findPathByEntityIDWithAvoids_V2_helper.restype = SzFindPathExcludingByEntityIDV2Result
-        self._library_handle.Sz_findPathByRecordID_V2_helper.argtypes = [
-            c_char_p,
-            c_char_p,
-            c_char_p,
-            c_char_p,
-            c_longlong,
-            c_longlong,
-        ]
-        self._library_handle.Sz_findPathByRecordID_V2_helper.restype = SzFindPathByRecordIDV2Result
-        self._library_handle.Sz_findPathByRecordIDIncludingSource_V2_helper.argtypes = [
-            c_char_p,
-            c_char_p,
-            c_char_p,
-            c_char_p,
-            c_longlong,
-            c_char_p,
-            c_char_p,
-            c_longlong,
-        ]
-        self._library_handle.Sz_findPathByRecordIDIncludingSource_V2_helper.restype = (
-            SzFindPathIncludingSourceByRecordIDV2Result
-        )
-        self._library_handle.Sz_findPathByRecordIDWithAvoids_V2_helper.argtypes = [
-            c_char_p,
-            c_char_p,
-            c_char_p,
-            c_char_p,
-            c_longlong,
-            c_char_p,
-            c_longlong,
-        ]
-        self._library_handle.Sz_findPathByRecordIDWithAvoids_V2_helper.restype = SzFindPathExcludingByRecordIDV2Result
-        self._library_handle.Sz_getActiveConfigID_helper.argtypes = []
-        self._library_handle.Sz_getActiveConfigID_helper.restype = SzGetActiveConfigIDResult
-        self._library_handle.Sz_getEntityByEntityID_V2_helper.argtypes = [
-            c_longlong,
-            c_longlong,
-        ]
-        self._library_handle.Sz_getEntityByEntityID_V2_helper.restype = SzGetEntityByEntityIDV2Result
-        self._library_handle.Sz_getEntityByRecordID_V2_helper.argtypes = [
-            c_char_p,
-            c_char_p,
-            c_longlong,
-        ]
-        self._library_handle.Sz_getEntityByRecordID_V2_helper.restype = SzGetEntityByRecordIDV2Result
-        self._library_handle.Sz_getRecord_V2_helper.argtypes = [
-            c_char_p,
-            c_char_p,
-            c_longlong,
-        ]
-        self._library_handle.Sz_getRecord_V2_helper.restype = SzGetRecordV2Result
-        self._library_handle.Sz_getRecordPreview_helper.argtypes = [
-            c_char_p,
-            c_longlong,
-        ]
-        self._library_handle.Sz_getRecordPreview_helper.restype = SzGetRecordPreviewResult
-        self._library_handle.Sz_getRedoRecord_helper.argtypes = []
-        self._library_handle.Sz_getRedoRecord_helper.restype = SzGetRedoRecordResult
-        self._library_handle.Sz_getVirtualEntityByRecordID_V2_helper.argtypes = [
-            c_char_p,
-            c_longlong,
-        ]
-        self._library_handle.Sz_getVirtualEntityByRecordID_V2_helper.restype = SzGetVirtualEntityByRecordIDV2Result
-        self._library_handle.Sz_howEntityByEntityID_V2_helper.argtypes = [
-            c_longlong,
-            c_longlong,
-        ]
-        self._library_handle.Sz_howEntityByEntityID_V2_helper.restype = SzHowEntityByEntityIDV2Result
-        self._library_handle.Sz_init.argtypes = [c_char_p, c_char_p, c_longlong]
-        self._library_handle.Sz_init.restype = c_longlong
-        self._library_handle.Sz_initWithConfigID.argtypes = [
-            c_char_p,
-            c_char_p,
-            c_longlong,
-            c_longlong,
-        ]
-        self._library_handle.Sz_processRedoRecord.argtypes = [
-            c_char_p,
-        ]
-        self._library_handle.Sz_processRedoRecord.restype = c_longlong
-        self._library_handle.Sz_processRedoRecordWithInfo_helper.argtypes = [
-            c_char_p,
-        ]
-        self._library_handle.Sz_processRedoRecordWithInfo_helper.restype = SzProcessRedoRecordWithInfoResult
-        self._library_handle.Sz_reevaluateEntity.argtypes = [c_longlong, c_longlong]
-        self._library_handle.Sz_reevaluateEntity.restype = c_longlong
-        self._library_handle.Sz_reevaluateEntityWithInfo_helper.argtypes = [
-            c_longlong,
-            c_longlong,
-        ]
-        self._library_handle.Sz_reevaluateEntityWithInfo_helper.restype = SzReevaluateEntityWithInfoResult
-        self._library_handle.Sz_reevaluateRecord.argtypes = [
-            c_char_p,
-            c_char_p,
-            c_longlong,
-        ]
-        self._library_handle.Sz_reevaluateRecord.restype = c_longlong
-        self._library_handle.Sz_reevaluateRecordWithInfo_helper.argtypes = [
-            c_char_p,
-            c_char_p,
-            c_longlong,
-        ]
-        self._library_handle.Sz_reevaluateRecordWithInfo_helper.restype = SzReevaluateRecordWithInfoResult
-        self._library_handle.Sz_reinit.argtypes = [c_longlong]
-        self._library_handle.Sz_reinit.restype = c_longlong
-        self._library_handle.Sz_searchByAttributes_V3_helper.argtypes = [
-            c_char_p,
-            c_char_p,
-            c_longlong,
-        ]
-        self._library_handle.Sz_searchByAttributes_V3_helper.restype = SzSearchByAttributesV3Result
-        self._library_handle.Sz_stats_helper.argtypes = []
-        self._library_handle.Sz_stats_helper.restype = SzStatsResult
-        self._library_handle.Sz_whyEntities_V2_helper.argtypes = [
-            c_longlong,
-            c_longlong,
-            c_longlong,
-        ]
-        self._library_handle.Sz_whyEntities_V2_helper.restype = SzWhyEntitiesV2Result
-        self._library_handle.Sz_whyRecordInEntity_V2_helper.argtypes = [
-            c_char_p,
-            c_char_p,
-            c_longlong,
-        ]
-        self._library_handle.Sz_whyRecords_V2_helper.restype = SzWhyRecordsV2Result
-        self._library_handle.Sz_whyRecordInEntity_V2_helper.restype = SzWhyRecordInEntityV2Result
-        self._library_handle.Sz_whyRecords_V2_helper.argtypes = [
-            c_char_p,
-            c_char_p,
-            c_char_p,
-            c_char_p,
-            c_longlong,
-        ]
-        self._library_handle.Sz_whySearch_helper.restype = SzWhySearchResult
-        self._library_handle.Sz_whySearch_helper.argtypes = [
-            c_char_p,
-            c_longlong,
-            c_char_p,
-        ]
-        self._library_handle.Sz_whySearch_V2_helper.restype = SzWhySearchV2Result
-        self._library_handle.Sz_whySearch_V2_helper.argtypes = [
-            c_char_p,
-            c_longlong,
-            c_char_p,
-            c_longlong,
-        ]
-        self._library_handle.SzHelper_free.argtypes = [c_void_p]
+        # Partial function to check the return code, convert and free responses from C functions
+        self._response_as_str = partial(response_as_str, self._library_handle.SzHelper_free, self._check_result)
 
     @property
     def is_destroyed(self) -> bool:
@@ -526,8 +538,7 @@ class SzEngineCore(SzEngine):
     # SzEngine methods
     # -------------------------------------------------------------------------
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @gated_sdk_method
     def _test_load(
         self,
         records: List[str],
@@ -546,8 +557,7 @@ class SzEngineCore(SzEngine):
             raise
         return SZ_NO_INFO
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @gated_sdk_method
     def add_record(
         self,
         data_source_code: str,
@@ -555,16 +565,14 @@ class SzEngineCore(SzEngine):
         record_definition: str,
         flags: int = SzEngineFlags.SZ_ADD_RECORD_DEFAULT_FLAGS,
     ) -> str:
-        if (flags & SzEngineFlags.SZ_WITH_INFO) != 0:
+        if (flags & _SZ_WITH_INFO) != 0:
             result = self._library_handle.Sz_addRecordWithInfo_helper(
                 as_c_char_p(data_source_code),
                 as_c_char_p(record_id),
                 as_c_char_p(record_definition),
                 flags & self._sdk_flags_mask,
             )
-            with FreeCResources(self._library_handle, result.response):
-                self._check_result(result.return_code)
-                return as_python_str(result.response)
+            return self._response_as_str(result)
 
         result = self._library_handle.Sz_addRecord(
             as_c_char_p(data_source_code),
@@ -574,36 +582,33 @@ class SzEngineCore(SzEngine):
         self._check_result(result)
         return SZ_NO_INFO
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @gated_sdk_method
     def close_export_report(self, export_handle: int) -> None:
         result = self._library_handle.Sz_closeExportReport_helper(as_c_uintptr_t(export_handle))
         self._check_result(result)
+        handle_closed("export", export_handle)
 
-    @check_is_destroyed
+    @gated_sdk_method
     def count_redo_records(self) -> int:
         result: int = self._library_handle.Sz_countRedoRecords()
         if result < 0:
             self._check_result(result)
         return result
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @gated_sdk_method
     def delete_record(
         self,
         data_source_code: str,
         record_id: str,
         flags: int = SzEngineFlags.SZ_DELETE_RECORD_DEFAULT_FLAGS,
     ) -> str:
-        if (flags & SzEngineFlags.SZ_WITH_INFO) != 0:
+        if (flags & _SZ_WITH_INFO) != 0:
             result = self._library_handle.Sz_deleteRecordWithInfo_helper(
                 as_c_char_p(data_source_code),
                 as_c_char_p(record_id),
                 flags & self._sdk_flags_mask,
             )
-            with FreeCResources(self._library_handle, result.response):
-                self._check_result(result.return_code)
-                return as_python_str(result.response)
+            return self._response_as_str(result)
 
         result = self._library_handle.Sz_deleteRecord(
             as_c_char_p(data_source_code),
@@ -623,17 +628,18 @@ class SzEngineCore(SzEngine):
         result = self._library_handle.Sz_destroy()
         self._check_result(result)
 
-    # NOTE - Internal use only!
+    # NOTE - Internal use only! Called by SzAbstractFactoryCore.reinitialize() while SzConfigWatcher holds the writer
+    # NOTE - on _call_gate, so it calls the Senzing library directly rather than the gated get_active_config_id()
     def _internal_is_initialized(self) -> bool:
+        result = self._library_handle.Sz_getActiveConfigID_helper()
         try:
-            _ = self.get_active_config_id()
+            self._check_result(result.return_code)
         except SzNotInitializedError:
             return False
 
         return True
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @gated_sdk_method
     def export_csv_entity_report(
         self,
         csv_column_list: str,
@@ -641,40 +647,34 @@ class SzEngineCore(SzEngine):
     ) -> int:
         result = self._library_handle.Sz_exportCSVEntityReport_helper(as_c_char_p(csv_column_list), flags)
         self._check_result(result.return_code)
+        handle_opened("export", result.export_handle, self)
         return result.export_handle  # type: ignore[no-any-return]
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @gated_sdk_method
     def export_json_entity_report(
         self,
         flags: int = SzEngineFlags.SZ_EXPORT_DEFAULT_FLAGS,
     ) -> int:
         result = self._library_handle.Sz_exportJSONEntityReport_helper(flags)
         self._check_result(result.return_code)
+        handle_opened("export", result.export_handle, self)
         return result.export_handle  # type: ignore[no-any-return]
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @gated_sdk_method
     def fetch_next(self, export_handle: int) -> str:
         result = self._library_handle.Sz_fetchNext_helper(as_c_uintptr_t(export_handle))
-        with FreeCResources(self._library_handle, result.response):
-            self._check_result(result.return_code)
-            return as_python_str(result.response)
+        return self._response_as_str(result)
 
     # NOTE - Included but not documented or examples, early adaptor feature, needs manual additions to config
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @gated_sdk_method
     def find_interesting_entities_by_entity_id(
         self, entity_id: int, flags: int = SzEngineFlags.SZ_FIND_INTERESTING_ENTITIES_DEFAULT_FLAGS
     ) -> str:
         result = self._library_handle.Sz_findInterestingEntitiesByEntityID_helper(entity_id, flags)
-        with FreeCResources(self._library_handle, result.response):
-            self._check_result(result.return_code)
-            return as_python_str(result.response)
+        return self._response_as_str(result)
 
     # NOTE - Included but not documented or examples, early adaptor feature, needs manual additions to config
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @gated_sdk_method
     def find_interesting_entities_by_record_id(
         self,
         data_source_code: str,
@@ -684,12 +684,9 @@ class SzEngineCore(SzEngine):
         result = self._library_handle.Sz_findInterestingEntitiesByRecordID_helper(
             as_c_char_p(data_source_code), as_c_char_p(record_id), flags
         )
-        with FreeCResources(self._library_handle, result.response):
-            self._check_result(result.return_code)
-            return as_python_str(result.response)
+        return self._response_as_str(result)
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @gated_sdk_method
     def find_network_by_entity_id(
         self,
         entity_ids: List[int],
@@ -706,12 +703,9 @@ class SzEngineCore(SzEngine):
             flags,
         )
 
-        with FreeCResources(self._library_handle, result.response):
-            self._check_result(result.return_code)
-            return as_python_str(result.response)
+        return self._response_as_str(result)
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @gated_sdk_method
     def find_network_by_record_id(
         self,
         record_keys: List[Tuple[str, str]],
@@ -727,12 +721,9 @@ class SzEngineCore(SzEngine):
             build_out_max_entities,
             flags,
         )
-        with FreeCResources(self._library_handle, result.response):
-            self._check_result(result.return_code)
-            return as_python_str(result.response)
+        return self._response_as_str(result)
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @gated_sdk_method
     def find_path_by_entity_id(
         self,
         start_entity_id: int,
@@ -742,12 +733,14 @@ class SzEngineCore(SzEngine):
         required_data_sources: Optional[List[str]] = None,
         flags: int = SzEngineFlags.SZ_FIND_PATH_DEFAULT_FLAGS,
     ) -> str:
-        if avoid_entity_ids and not required_data_sources:
+        # NOTE - Build first, avoid_entity_ids can be a generator or an array without a truth value
+        avoid_entities_json = build_entities_json(avoid_entity_ids)
+        if avoid_entities_json and not required_data_sources:
             result = self._library_handle.Sz_findPathByEntityIDWithAvoids_V2_helper(
                 start_entity_id,
                 end_entity_id,
                 max_degrees,
-                as_c_char_p(build_entities_json(avoid_entity_ids)),
+                as_c_char_p(avoid_entities_json),
                 flags,
             )
         elif required_data_sources:
@@ -755,7 +748,7 @@ class SzEngineCore(SzEngine):
                 start_entity_id,
                 end_entity_id,
                 max_degrees,
-                as_c_char_p(build_entities_json(avoid_entity_ids)),
+                as_c_char_p(avoid_entities_json),
                 as_c_char_p(build_data_sources_json(required_data_sources)),
                 flags,
             )
@@ -766,12 +759,9 @@ class SzEngineCore(SzEngine):
                 max_degrees,
                 flags,
             )
-        with FreeCResources(self._library_handle, result.response):
-            self._check_result(result.return_code)
-            return as_python_str(result.response)
+        return self._response_as_str(result)
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @gated_sdk_method
     def find_path_by_record_id(
         self,
         start_data_source_code: str,
@@ -813,30 +803,24 @@ class SzEngineCore(SzEngine):
                 max_degrees,
                 flags,
             )
-        with FreeCResources(self._library_handle, result.response):
-            self._check_result(result.return_code)
-            return as_python_str(result.response)
+        return self._response_as_str(result)
 
-    @check_is_destroyed
+    @gated_sdk_method
     def get_active_config_id(self) -> int:
         result = self._library_handle.Sz_getActiveConfigID_helper()
         self._check_result(result.return_code)
         return result.response  # type: ignore[no-any-return]
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @gated_sdk_method
     def get_entity_by_entity_id(
         self,
         entity_id: int,
         flags: int = SzEngineFlags.SZ_ENTITY_DEFAULT_FLAGS,
     ) -> str:
         result = self._library_handle.Sz_getEntityByEntityID_V2_helper(entity_id, flags)
-        with FreeCResources(self._library_handle, result.response):
-            self._check_result(result.return_code)
-            return as_python_str(result.response)
+        return self._response_as_str(result)
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @gated_sdk_method
     def get_entity_by_record_id(
         self,
         data_source_code: str,
@@ -846,12 +830,9 @@ class SzEngineCore(SzEngine):
         result = self._library_handle.Sz_getEntityByRecordID_V2_helper(
             as_c_char_p(data_source_code), as_c_char_p(record_id), flags
         )
-        with FreeCResources(self._library_handle, result.response):
-            self._check_result(result.return_code)
-            return as_python_str(result.response)
+        return self._response_as_str(result)
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @gated_sdk_method
     def get_record(
         self,
         data_source_code: str,
@@ -863,12 +844,9 @@ class SzEngineCore(SzEngine):
             as_c_char_p(record_id),
             flags,
         )
-        with FreeCResources(self._library_handle, result.response):
-            self._check_result(result.return_code)
-            return as_python_str(result.response)
+        return self._response_as_str(result)
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @gated_sdk_method
     def get_record_preview(
         self,
         record_definition: str,
@@ -878,26 +856,19 @@ class SzEngineCore(SzEngine):
             as_c_char_p(record_definition),
             flags,
         )
-        with FreeCResources(self._library_handle, result.response):
-            self._check_result(result.return_code)
-            return as_python_str(result.response)
+        return self._response_as_str(result)
 
-    @check_is_destroyed
+    @gated_sdk_method
     def get_redo_record(self) -> str:
         result = self._library_handle.Sz_getRedoRecord_helper()
-        with FreeCResources(self._library_handle, result.response):
-            self._check_result(result.return_code)
-            return as_python_str(result.response)
+        return self._response_as_str(result)
 
-    @check_is_destroyed
+    @gated_sdk_method
     def get_stats(self) -> str:
         result = self._library_handle.Sz_stats_helper()
-        with FreeCResources(self._library_handle, result.response):
-            self._check_result(result.return_code)
-            return as_python_str(result.response)
+        return self._response_as_str(result)
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @gated_sdk_method
     def get_virtual_entity_by_record_id(
         self,
         record_keys: List[Tuple[str, str]],
@@ -907,24 +878,18 @@ class SzEngineCore(SzEngine):
             as_c_char_p(build_records_json(record_keys)),
             flags,
         )
-        with FreeCResources(self._library_handle, result.response):
-            self._check_result(result.return_code)
-            return as_python_str(result.response)
+        return self._response_as_str(result)
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @gated_sdk_method
     def how_entity_by_entity_id(
         self,
         entity_id: int,
         flags: int = SzEngineFlags.SZ_HOW_ENTITY_DEFAULT_FLAGS,
     ) -> str:
         result = self._library_handle.Sz_howEntityByEntityID_V2_helper(entity_id, flags)
-        with FreeCResources(self._library_handle, result.response):
-            self._check_result(result.return_code)
-            return as_python_str(result.response)
+        return self._response_as_str(result)
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @sdk_method
     def _initialize(
         self,
         instance_name: str,
@@ -950,21 +915,18 @@ class SzEngineCore(SzEngine):
         )
         self._check_result(result)
 
-    @check_is_destroyed
+    @gated_sdk_method
     def prime_engine(self) -> None:
         result = self._library_handle.Sz_primeEngine()
         self._check_result(result)
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @gated_sdk_method
     def process_redo_record(self, redo_record: str, flags: int = SzEngineFlags.SZ_REDO_DEFAULT_FLAGS) -> str:
-        if (flags & SzEngineFlags.SZ_WITH_INFO) != 0:
+        if (flags & _SZ_WITH_INFO) != 0:
             result = self._library_handle.Sz_processRedoRecordWithInfo_helper(
                 as_c_char_p(redo_record), flags & self._sdk_flags_mask
             )
-            with FreeCResources(self._library_handle, result.response):
-                self._check_result(result.return_code)
-                return as_python_str(result.response)
+            return self._response_as_str(result)
 
         result = self._library_handle.Sz_processRedoRecord(
             as_c_char_p(redo_record),
@@ -972,54 +934,46 @@ class SzEngineCore(SzEngine):
         self._check_result(result)
         return SZ_NO_INFO
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @gated_sdk_method
     def reevaluate_entity(self, entity_id: int, flags: int = SzEngineFlags.SZ_REEVALUATE_RECORD_DEFAULT_FLAGS) -> str:
-        if (flags & SzEngineFlags.SZ_WITH_INFO) != 0:
+        if (flags & _SZ_WITH_INFO) != 0:
             result = self._library_handle.Sz_reevaluateEntityWithInfo_helper(
                 entity_id,
                 flags & self._sdk_flags_mask,
             )
-            with FreeCResources(self._library_handle, result.response):
-                self._check_result(result.return_code)
-                response_str = as_python_str(result.response)
-                return response_str if response_str else SZ_NO_INFO
+            response_str = self._response_as_str(result)
+            return response_str if response_str else SZ_NO_INFO
 
         result = self._library_handle.Sz_reevaluateEntity(entity_id, flags)
         self._check_result(result)
         return SZ_NO_INFO
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @gated_sdk_method
     def reevaluate_record(
         self,
         data_source_code: str,
         record_id: str,
         flags: int = SzEngineFlags.SZ_REEVALUATE_RECORD_DEFAULT_FLAGS,
     ) -> str:
-        if (flags & SzEngineFlags.SZ_WITH_INFO) != 0:
+        if (flags & _SZ_WITH_INFO) != 0:
             result = self._library_handle.Sz_reevaluateRecordWithInfo_helper(
                 as_c_char_p(data_source_code),
                 as_c_char_p(record_id),
                 flags & self._sdk_flags_mask,
             )
-            with FreeCResources(self._library_handle, result.response):
-                self._check_result(result.return_code)
-                response_str = as_python_str(result.response)
-                return response_str if response_str else SZ_NO_INFO
+            response_str = self._response_as_str(result)
+            return response_str if response_str else SZ_NO_INFO
 
         result = self._library_handle.Sz_reevaluateRecord(as_c_char_p(data_source_code), as_c_char_p(record_id), flags)
         self._check_result(result)
         return SZ_NO_INFO
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @sdk_method
     def _reinitialize(self, config_id: int) -> None:
         result = self._library_handle.Sz_reinit(config_id)
         self._check_result(result)
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @gated_sdk_method
     def search_by_attributes(
         self,
         attributes: str,
@@ -1031,12 +985,9 @@ class SzEngineCore(SzEngine):
             as_c_char_p(search_profile),
             flags,
         )
-        with FreeCResources(self._library_handle, result.response):
-            self._check_result(result.return_code)
-            return as_python_str(result.response)
+        return self._response_as_str(result)
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @gated_sdk_method
     def why_entities(
         self,
         entity_id_1: int,
@@ -1048,12 +999,9 @@ class SzEngineCore(SzEngine):
             entity_id_2,
             flags,
         )
-        with FreeCResources(self._library_handle, result.response):
-            self._check_result(result.return_code)
-            return as_python_str(result.response)
+        return self._response_as_str(result)
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @gated_sdk_method
     def why_records(
         self,
         data_source_code_1: str,
@@ -1069,12 +1017,9 @@ class SzEngineCore(SzEngine):
             as_c_char_p(record_id_2),
             flags,
         )
-        with FreeCResources(self._library_handle, result.response):
-            self._check_result(result.return_code)
-            return as_python_str(result.response)
+        return self._response_as_str(result)
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @gated_sdk_method
     def why_record_in_entity(
         self,
         data_source_code: str,
@@ -1086,12 +1031,9 @@ class SzEngineCore(SzEngine):
             as_c_char_p(record_id),
             flags,
         )
-        with FreeCResources(self._library_handle, result.response):
-            self._check_result(result.return_code)
-            return as_python_str(result.response)
+        return self._response_as_str(result)
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @gated_sdk_method
     def why_search(
         self,
         attributes: str,
@@ -1105,6 +1047,4 @@ class SzEngineCore(SzEngine):
             as_c_char_p(search_profile),
             flags,
         )
-        with FreeCResources(self._library_handle, result.response):
-            self._check_result(result.return_code)
-            return as_python_str(result.response)
+        return self._response_as_str(result)
@@ -0,0 +1,295 @@
+"""
+``senzing_core.szenginecoalescer.SzEngineCoalescer`` wraps an SzEngine so that concurrent, identical read requests
+share a single in-flight call to the Senzing binaries.
+
+Under burst load many threads frequently request the same entity, search or path at the same moment. Rather than
+each thread making its own native call, the first caller (the leader) makes the call and every other caller with the
+same method, arguments and flags waits for and receives the leader's result, or its exception.
+
+Example:
+
+.. code-block:: python
+
+    from senzing_core import SzAbstractFactoryCore, SzEngineCoalescer
+
+    sz_abstract_factory = SzAbstractFactoryCore(instance_name, settings)
+    sz_engine = SzEngineCoalescer(sz_abstract_factory.create_engine())
+    result = sz_engine.get_entity_by_entity_id(1)
+    print(sz_engine.stats())
+"""
+
+from __future__ import annotations
+
+import inspect
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from senzing import SzEngine, SzEngineFlags
+
+# Metadata
+
+__all__ = ["COALESCED_METHODS", "SzEngineCoalescer"]
+__updated__ = "2025-10-20"
+
+COALESCED_METHODS = (
+    "find_interesting_entities_by_entity_id",
+    "find_interesting_entities_by_record_id",
+    "find_network_by_entity_id",
+    "find_network_by_record_id",
+    "find_path_by_entity_id",
+    "find_path_by_record_id",
+    "get_entity_by_entity_id",
+    "get_entity_by_record_id",
+    "search_by_attributes",
+)
+
+
+# -----------------------------------------------------------------------------
+# Helpers
+# -----------------------------------------------------------------------------
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Convert an argument value to a hashable equivalent so it can be part of a call key.
+
+    Raises:
+        TypeError: The value, or an element of it, can't be hashed.
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(element) for element in value)
+
+    if isinstance(value, dict):
+        return tuple(sorted((str(key), _freeze(element)) for key, element in value.items()))
+
+    hash(value)
+    return value  # type: ignore[no-any-return]
+
+
+# -----------------------------------------------------------------------------
+# SzEngineCoalescer class
+# -----------------------------------------------------------------------------
+
+
+class SzEngineCoalescer:
+    """
+    Coalesce concurrent, identical calls to the read methods of an SzEngine. Methods not in COALESCED_METHODS are
+    passed directly to the wrapped SzEngine.
+
+    Args:
+        sz_engine (SzEngine): The SzEngine to wrap, usually from SzAbstractFactoryCore.create_engine().
+    """
+
+    def __init__(self, sz_engine: SzEngine) -> None:
+        self._sz_engine = sz_engine
+        self._in_flight: Dict[Tuple[Hashable, ...], Future[str]] = {}
+        self._lock = threading.Lock()
+        self._signatures: Dict[str, inspect.Signature] = {}
+        self._stats = {method_name: {"calls": 0, "coalesced": 0} for method_name in COALESCED_METHODS}
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not found on SzEngineCoalescer, e.g. add_record()
+        return getattr(self._sz_engine, name)
+
+    @property
+    def coalesced_count(self) -> int:
+        """Return the total number of calls that were satisfied by another caller's in-flight call."""
+        with self._lock:
+            return sum(method_stats["coalesced"] for method_stats in self._stats.values())
+
+    @property
+    def sz_engine(self) -> SzEngine:
+        """Return the wrapped SzEngine."""
+        return self._sz_engine
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Return, per coalesced method, the number of calls made and how many of those were coalesced.
+
+        Returns:
+            Dict[str, Dict[str, int]]: For example {"get_entity_by_entity_id": {"calls": 10, "coalesced": 7}, ...}
+        """
+        with self._lock:
+            return {method_name: dict(method_stats) for method_name, method_stats in self._stats.items()}
+
+    def reset_stats(self) -> None:
+        """Reset the call and coalesced counters to zero."""
+        with self._lock:
+            for method_stats in self._stats.values():
+                method_stats["calls"] = 0
+                method_stats["coalesced"] = 0
+
+    # -------------------------------------------------------------------------
+    # Coalesced SzEngine methods
+    # -------------------------------------------------------------------------
+
+    def find_interesting_entities_by_entity_id(
+        self, entity_id: int, flags: int = SzEngineFlags.SZ_FIND_INTERESTING_ENTITIES_DEFAULT_FLAGS
+    ) -> str:
+        """Coalesced SzEngine.find_interesting_entities_by_entity_id()"""
+        return self._coalesce("find_interesting_entities_by_entity_id", entity_id, flags)
+
+    def find_interesting_entities_by_record_id(
+        self,
+        data_source_code: str,
+        record_id: str,
+        flags: int = SzEngineFlags.SZ_FIND_INTERESTING_ENTITIES_DEFAULT_FLAGS,
+    ) -> str:
+        """Coalesced SzEngine.find_interesting_entities_by_record_id()"""
+        return self._coalesce("find_interesting_entities_by_record_id", data_source_code, record_id, flags)
+
+    def find_network_by_entity_id(
+        self,
+        entity_ids: List[int],
+        max_degrees: int,
+        build_out_degrees: int,
+        build_out_max_entities: int,
+        flags: int = SzEngineFlags.SZ_FIND_NETWORK_DEFAULT_FLAGS,
+    ) -> str:
+        """Coalesced SzEngine.find_network_by_entity_id()"""
+        return self._coalesce(
+            "find_network_by_entity_id", entity_ids, max_degrees, build_out_degrees, build_out_max_entities, flags
+        )
+
+    def find_network_by_record_id(
+        self,
+        record_keys: List[Tuple[str, str]],
+        max_degrees: int,
+        build_out_degrees: int,
+        build_out_max_entities: int,
+        flags: int = SzEngineFlags.SZ_FIND_NETWORK_DEFAULT_FLAGS,
+    ) -> str:
+        """Coalesced SzEngine.find_network_by_record_id()"""
+        return self._coalesce(
+            "find_network_by_record_id", record_keys, max_degrees, build_out_degrees, build_out_max_entities, flags
+        )
+
+    def find_path_by_entity_id(
+        self,
+        start_entity_id: int,
+        end_entity_id: int,
+        max_degrees: int,
+        avoid_entity_ids: Optional[List[int]] = None,
+        required_data_sources: Optional[List[str]] = None,
+        flags: int = SzEngineFlags.SZ_FIND_PATH_DEFAULT_FLAGS,
+    ) -> str:
+        """Coalesced SzEngine.find_path_by_entity_id()"""
+        return self._coalesce(
+            "find_path_by_entity_id",
+            start_entity_id,
+            end_entity_id,
+            max_degrees,
+            avoid_entity_ids,
+            required_data_sources,
+            flags,
+        )
+
+    def find_path_by_record_id(
+        self,
+        start_data_source_code: str,
+        start_record_id: str,
+        end_data_source_code: str,
+        end_record_id: str,
+        max_degrees: int,
+        avoid_record_keys: Optional[List[Tuple[str, str]]] = None,
+        required_data_sources: Optional[List[str]] = None,
+        flags: int = SzEngineFlags.SZ_FIND_PATH_DEFAULT_FLAGS,
+    ) -> str:
+        """Coalesced SzEngine.find_path_by_record_id()"""
+        return self._coalesce(
+            "find_path_by_record_id",
+            start_data_source_code,
+            start_record_id,
+            end_data_source_code,
+            end_record_id,
+            max_degrees,
+            avoid_record_keys,
+            required_data_sources,
+            flags,
+        )
+
+    def get_entity_by_entity_id(
+        self,
+        entity_id: int,
+        flags: int = SzEngineFlags.SZ_ENTITY_DEFAULT_FLAGS,
+    ) -> str:
+        """Coalesced SzEngine.get_entity_by_entity_id()"""
+        return self._coalesce("get_entity_by_entity_id", entity_id, flags)
+
+    def get_entity_by_record_id(
+        self,
+        data_source_code: str,
+        record_id: str,
+        flags: int = SzEngineFlags.SZ_ENTITY_DEFAULT_FLAGS,
+    ) -> str:
+        """Coalesced SzEngine.get_entity_by_record_id()"""
+        return self._coalesce("get_entity_by_record_id", data_source_code, record_id, flags)
+
+    def search_by_attributes(
+        self,
+        attributes: str,
+        flags: int = SzEngineFlags.SZ_SEARCH_BY_ATTRIBUTES_DEFAULT_FLAGS,
+        search_profile: str = "",
+    ) -> str:
+        """Coalesced SzEngine.search_by_attributes()"""
+        return self._coalesce("search_by_attributes", attributes, flags, search_profile)
+
+    # -------------------------------------------------------------------------
+    # Non-public methods
+    # -------------------------------------------------------------------------
+
+    def _call_key(self, method_name: str, args: Tuple[Any, ...]) -> Optional[Tuple[Hashable, ...]]:
+        """Build a hashable key identifying a call, None if the arguments can't be used in a key."""
+        signature = self._signatures.get(method_name)
+        if signature is None:
+            signature = self._signatures.setdefault(
+                method_name, inspect.signature(getattr(self._sz_engine, method_name))
+            )
+
+        try:
+            bound_args = signature.bind(*args)
+            bound_args.apply_defaults()
+            return (method_name,) + tuple(_freeze(arg) for arg in bound_args.args)
+        except TypeError:
+            return None
+
+    def _coalesce(self, method_name: str, *args: Any) -> str:
+        """Make the call to the wrapped SzEngine, or wait for an identical in-flight call to complete."""
+        method = getattr(self._sz_engine, method_name)
+        key = self._call_key(method_name, args)
+
+        # Can't key the call, e.g. bad argument types, let the SzEngine method raise the correct error
+        if key is None:
+            with self._lock:
+                self._stats[method_name]["calls"] += 1
+            return method(*args)  # type: ignore[no-any-return]
+
+        with self._lock:
+            self._stats[method_name]["calls"] += 1
+            future = self._in_flight.get(key)
+            is_leader = future is None
+            if future is None:
+                future = Future()
+                self._in_flight[key] = future
+            else:
+                self._stats[method_name]["coalesced"] += 1
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = method(*args)
+        except BaseException as err:
+            self._complete(key)
+            future.set_exception(err)
+            raise
+
+        self._complete(key)
+        future.set_result(result)
+        return result  # type: ignore[no-any-return]
+
+    def _complete(self, key: Tuple[Hashable, ...]) -> None:
+        """Remove an in-flight call so later callers make a new call to the SzEngine."""
+        with self._lock:
+            del self._in_flight[key]
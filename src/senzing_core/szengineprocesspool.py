@@ -0,0 +1,499 @@
+"""
+``senzing_core.szengineprocesspool.SzEngineProcessPool`` runs SzEngine calls in a pool of worker processes so that
+calls can be given a deadline.
+
+A call in to the Senzing binaries through ctypes can't be interrupted, so a pathological query such as
+find_network_by_entity_id() with a high degree can tie up a thread for minutes. Each worker process in the pool has its
+own SzAbstractFactoryCore and SzEngine. When a call exceeds its deadline its worker process is killed and replaced and
+the caller receives an SzEngineTimeoutError.
+
+Long running loads can also recycle worker processes, replacing one after a number of calls or once its RSS has grown
+by a number of bytes since it created its SzEngine, to shed memory held by the Senzing library. A worker process is only
+recycled between calls, once its call has returned, so no work in progress is lost.
+
+Example:
+
+.. code-block:: python
+
+    from senzing_core import SzEngineProcessPool, SzEngineTimeoutError
+
+    factory_parameters = {"instance_name": instance_name, "settings": settings}
+
+    with SzEngineProcessPool(factory_parameters, processes=4, default_timeout=30) as pool:
+        try:
+            result = pool.call("find_network_by_entity_id", [1, 4], 6, 2, 100)
+        except SzEngineTimeoutError:
+            ...
+
+    with SzEngineProcessPool(factory_parameters, max_calls_per_worker=100_000, max_rss_growth_bytes=2**30) as pool:
+        for record in records:
+            pool.call("add_record", record["DATA_SOURCE"], record["RECORD_ID"], record)
+"""
+
+# pylint: disable=R0903
+
+from __future__ import annotations
+
+import multiprocessing
+import pickle
+import queue
+import threading
+import time
+from multiprocessing.connection import Connection
+from typing import Any, Dict, List, Optional
+
+from senzing import SzRetryTimeoutExceededError, SzSdkError
+
+from .szabstractfactory import SzAbstractFactoryCore, SzAbstractFactoryParametersCore
+from .szmemory import rss_bytes
+
+# Metadata
+
+__all__ = ["SzEngineProcessPool", "SzEngineTimeoutError"]
+__updated__ = "2025-10-20"
+
+DEFAULT_STARTUP_TIMEOUT = 120.0
+
+# Seconds a stopped worker process has to destroy its SzAbstractFactoryCore and exit before it's killed
+_STOP_TIMEOUT = 60.0
+
+_MESSAGE_ERROR = "error"
+_MESSAGE_READY = "ready"
+_MESSAGE_RESULT = "result"
+
+
+# -----------------------------------------------------------------------------
+# Exceptions
+# -----------------------------------------------------------------------------
+
+
+class SzEngineTimeoutError(SzRetryTimeoutExceededError, TimeoutError):
+    """An SzEngineProcessPool call didn't complete before its deadline."""
+
+
+# -----------------------------------------------------------------------------
+# Worker process
+# -----------------------------------------------------------------------------
+
+
+def _picklable_error(err: BaseException) -> BaseException:
+    """Return err if it can be sent to the parent process, otherwise an SzSdkError describing it."""
+    try:
+        pickle.dumps(err)
+        return err
+    except Exception:  # pylint: disable=broad-exception-caught
+        return SzSdkError(f"{type(err).__name__}: {err}")
+
+
+def _worker_main(connection: Connection, factory_parameters: SzAbstractFactoryParametersCore) -> None:
+    """
+    Entry point of a worker process. Create an SzEngine then run calls received on connection until it's closed.
+
+    :meta private:
+    """
+    try:
+        sz_abstract_factory = SzAbstractFactoryCore(**factory_parameters)
+        sz_engine = sz_abstract_factory.create_engine()
+    except BaseException as err:  # pylint: disable=broad-exception-caught
+        connection.send((_MESSAGE_ERROR, _picklable_error(err)))
+        return
+
+    connection.send((_MESSAGE_READY, None))
+
+    while True:
+        try:
+            method_name, args, kwargs = connection.recv()
+        except (EOFError, OSError):
+            break
+
+        try:
+            result = getattr(sz_engine, method_name)(*args, **kwargs)
+        except BaseException as err:  # pylint: disable=broad-exception-caught
+            connection.send((_MESSAGE_ERROR, _picklable_error(err)))
+        else:
+            connection.send((_MESSAGE_RESULT, result))
+
+    sz_abstract_factory.destroy()
+
+
+# -----------------------------------------------------------------------------
+# Helper classes
+# -----------------------------------------------------------------------------
+
+
+class _Worker:
+    """Parent side of a worker process."""
+
+    def __init__(
+        self,
+        context: multiprocessing.context.BaseContext,
+        factory_parameters: SzAbstractFactoryParametersCore,
+    ) -> None:
+        self.baseline_rss: Optional[int] = None
+        self.calls = 0
+        self.connection, child_connection = context.Pipe()
+        self.is_ready = False
+        self.process = context.Process(  # type: ignore[attr-defined]
+            target=_worker_main,
+            args=(child_connection, factory_parameters),
+            daemon=True,
+        )
+        self.process.start()
+        self.started = time.monotonic()
+        child_connection.close()
+
+    def kill(self) -> None:
+        """Kill the worker process, it may be mid-call. Safe to call on a worker process that has exited."""
+        self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+    def stop(self, timeout: float) -> None:
+        """Ask the worker process to exit once it has finished its current call, kill it if it hasn't within timeout."""
+        self.connection.close()
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.kill()
+
+    def wait_until_ready(self, startup_timeout: float, deadline: Optional[float] = None) -> bool:
+        """
+        Wait for the worker process to create its SzEngine, up to startup_timeout seconds after it was started. Return
+        False, leaving the worker process starting, if the time.monotonic() deadline passes first.
+        """
+        if self.is_ready:
+            return True
+
+        startup_deadline = self.started + startup_timeout
+        wait_until = startup_deadline if deadline is None else min(deadline, startup_deadline)
+        if not self.connection.poll(max(0.0, wait_until - time.monotonic())):
+            if wait_until < startup_deadline:
+                return False
+            self.kill()
+            raise SzSdkError(f"worker process didn't create an SzEngine within {startup_timeout} seconds")
+
+        try:
+            message, payload = self.connection.recv()
+        except EOFError as err:
+            self.kill()
+            raise SzSdkError("worker process exited before creating an SzEngine") from err
+
+        if message == _MESSAGE_ERROR:
+            self.kill()
+            raise SzSdkError(f"worker process couldn't create an SzEngine: {payload}") from payload
+
+        self.is_ready = True
+        return True
+
+
+# -----------------------------------------------------------------------------
+# SzEngineProcessPool class
+# -----------------------------------------------------------------------------
+
+
+class SzEngineProcessPool:
+    """
+    Run SzEngine calls in worker processes, killing and replacing a worker when a call exceeds its deadline.
+
+    Args:
+        factory_parameters (SzAbstractFactoryParametersCore): Arguments to create an SzAbstractFactoryCore in each
+            worker process.
+        processes (int, optional): Number of worker processes. Defaults to 2.
+        default_timeout (Optional[float], optional): Deadline in seconds for calls that don't specify one, None for no
+            deadline. Defaults to None.
+        startup_timeout (float, optional): Seconds a worker process has to create its SzEngine, from when it's
+            started. Defaults to 120.
+        start_method (str, optional): multiprocessing start method. Defaults to "spawn", the Senzing binaries
+            shouldn't be forked once initialized.
+        max_calls_per_worker (Optional[int], optional): Recycle a worker process after this many calls, None to not
+            recycle on calls. Defaults to None.
+        max_rss_growth_bytes (Optional[int], optional): Recycle a worker process once its RSS has grown by this many
+            bytes since it created its SzEngine, None to not recycle on RSS growth. Defaults to None. The RSS is read
+            after each call.
+
+    Raises:
+        SzSdkError: processes, max_calls_per_worker or max_rss_growth_bytes is less than 1, the RSS of processes can't
+            be read or a worker process couldn't create an SzEngine.
+    """
+
+    def __init__(
+        self,
+        factory_parameters: SzAbstractFactoryParametersCore,
+        processes: int = 2,
+        default_timeout: Optional[float] = None,
+        startup_timeout: float = DEFAULT_STARTUP_TIMEOUT,
+        start_method: str = "spawn",
+        max_calls_per_worker: Optional[int] = None,
+        max_rss_growth_bytes: Optional[int] = None,
+    ) -> None:
+        if processes < 1:
+            raise SzSdkError(f"processes must be 1 or more, received {processes}")
+        if max_calls_per_worker is not None and max_calls_per_worker < 1:
+            raise SzSdkError(f"max_calls_per_worker must be 1 or more, received {max_calls_per_worker}")
+        if max_rss_growth_bytes is not None:
+            if max_rss_growth_bytes < 1:
+                raise SzSdkError(f"max_rss_growth_bytes must be 1 or more, received {max_rss_growth_bytes}")
+            # NOTE - Fail now rather than on the first call if the RSS can't be read on this platform
+            rss_bytes()
+
+        self._closed = False
+        self._context = multiprocessing.get_context(start_method)
+        self._default_timeout = default_timeout
+        self._factory_parameters = factory_parameters
+        self._idle: queue.Queue[_Worker] = queue.Queue()
+        self._lock = threading.Lock()
+        self._max_calls_per_worker = max_calls_per_worker
+        self._max_rss_growth_bytes = max_rss_growth_bytes
+        self._processes = processes
+        self._retiring: List[threading.Thread] = []
+        self._startup_timeout = startup_timeout
+        self._stats = {"calls": 0, "dropped": 0, "errors": 0, "recycled": 0, "replaced": 0, "timeouts": 0}
+        self._workers: List[_Worker] = []
+
+        try:
+            for _ in range(processes):
+                self._workers.append(_Worker(self._context, factory_parameters))
+            for worker in self._workers:
+                self._wait_until_ready(worker)
+                self._idle.put(worker)
+        except BaseException:
+            self.close(timeout=0)
+            raise
+
+    def __enter__(self) -> SzEngineProcessPool:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @property
+    def processes(self) -> int:
+        """Return the number of worker processes."""
+        return len(self._workers)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return counts of calls made, calls that raised an error, calls that timed out, worker processes recycled,
+        worker processes replaced after a timeout or failure and worker processes dropped because their replacement
+        couldn't be started. Dropped worker processes are started again by a later call.
+
+        Returns:
+            Dict[str, int]: For example {"calls": 10, "dropped": 0, "errors": 1, "recycled": 1, "replaced": 2,
+            "timeouts": 2}
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    # -------------------------------------------------------------------------
+    # Public methods
+    # -------------------------------------------------------------------------
+
+    def call(self, method_name: str, *args: Any, timeout: Optional[float] = None, **kwargs: Any) -> Any:
+        """
+        Call an SzEngine method in a worker process.
+
+        Args:
+            method_name (str): Name of the SzEngine method, e.g. "find_network_by_entity_id".
+            timeout (Optional[float], optional): Deadline in seconds, including any time waiting for a free worker
+                process and for a replacement worker process to create its SzEngine. Defaults to the pool
+                default_timeout.
+
+        Raises:
+            SzEngineTimeoutError: The call didn't complete before its deadline.
+            SzSdkError: The pool has been closed.
+
+        Returns:
+            Any: The result of the SzEngine method, errors raised by the method are raised to the caller.
+        """
+        if self._closed:
+            raise SzSdkError("process pool has been closed and can no longer be used")
+
+        timeout = self._default_timeout if timeout is None else timeout
+        deadline = None if timeout is None else time.monotonic() + timeout
+        worker = self._acquire(method_name, timeout)
+        idle_worker: Optional[_Worker] = worker
+
+        is_timed_out = False
+        message: str = _MESSAGE_RESULT
+        payload: Any = None
+        try:
+            # NOTE - A replacement worker process not ready by the deadline is left starting for the next caller
+            is_timed_out = not self._wait_until_ready(worker, deadline)
+            if not is_timed_out:
+                worker.calls += 1
+                worker.connection.send((method_name, args, kwargs))
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                is_timed_out = not worker.connection.poll(remaining)
+                if is_timed_out:
+                    idle_worker = self._replace(worker)
+                else:
+                    message, payload = worker.connection.recv()
+        except (EOFError, OSError) as err:
+            idle_worker = self._replace(worker)
+            raise SzSdkError(f"worker process exited during {method_name}") from err
+        except BaseException:
+            # NOTE - E.g. the worker process couldn't create an SzEngine, or KeyboardInterrupt in poll() or recv(). A
+            # NOTE - worker process left with a request in flight would send its response to the next caller.
+            idle_worker = self._replace(worker)
+            raise
+        else:
+            # NOTE - Not in the try, so failing to recycle the worker process can't lose the result received
+            if not is_timed_out and self._is_worn_out(worker):
+                idle_worker = self._recycle(worker)
+        finally:
+            self._count("calls")
+            if idle_worker is not None:
+                self._idle.put(idle_worker)
+
+        if is_timed_out:
+            self._count("timeouts")
+            raise SzEngineTimeoutError(f"{method_name} timed out after {timeout} seconds")
+
+        if message == _MESSAGE_ERROR:
+            self._count("errors")
+            raise payload
+
+        return payload
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the worker processes. Calls in progress are left to complete, then their worker processes are stopped.
+        Worker processes still running a call after timeout seconds are killed and their calls fail.
+
+        Args:
+            timeout (Optional[float], optional): Seconds to wait for calls in progress, None to wait for them to
+                complete. Defaults to None.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            workers = list(self._workers)
+            retiring = list(self._retiring)
+
+        # NOTE - Once closed, every worker process goes back to the idle queue at the end of its call and isn't replaced
+        deadline = None if timeout is None else time.monotonic() + timeout
+        stopped: List[_Worker] = []
+        while len(stopped) < len(workers):
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                worker = self._idle.get(timeout=remaining)
+            except queue.Empty:
+                break
+            worker.stop(_STOP_TIMEOUT)
+            stopped.append(worker)
+
+        for worker in workers:
+            if worker not in stopped:
+                worker.kill()
+        for worker in stopped:
+            self._idle.put(worker)
+        for thread in retiring:
+            thread.join()
+
+    # -------------------------------------------------------------------------
+    # Non-public methods
+    # -------------------------------------------------------------------------
+
+    def _acquire(self, method_name: str, timeout: Optional[float]) -> _Worker:
+        """Wait up to timeout seconds for an idle worker process."""
+        self._refill()
+        try:
+            worker = self._idle.get(timeout=timeout)
+        except queue.Empty as err:
+            self._count("timeouts")
+            raise SzEngineTimeoutError(
+                f"{method_name} timed out after {timeout} seconds waiting for a free worker process"
+            ) from err
+
+        if self._closed:
+            # NOTE - close() puts the stopped worker processes back for callers that were waiting for one
+            self._idle.put(worker)
+            raise SzSdkError("process pool has been closed and can no longer be used")
+
+        return worker
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+    def _is_worn_out(self, worker: _Worker) -> bool:
+        """Return True if a worker process has reached max_calls_per_worker or max_rss_growth_bytes."""
+        if self._max_calls_per_worker is not None and worker.calls >= self._max_calls_per_worker:
+            return True
+        if self._max_rss_growth_bytes is None or worker.baseline_rss is None:
+            return False
+        try:
+            return rss_bytes(worker.process.pid) - worker.baseline_rss >= self._max_rss_growth_bytes
+        except SzSdkError:
+            # The worker process has exited, replace it
+            return True
+
+    def _recycle(self, worker: _Worker) -> _Worker:
+        """
+        Stop an idle worker process and start a new one in its place, the new one is readied by its first caller. The
+        worker process is stopped in the background, it destroys its SzAbstractFactoryCore before exiting. Once the
+        pool is closed, or if the new worker process can't be started, the worker process is kept, for close() to stop
+        or to recycle after its next call.
+        """
+        with self._lock:
+            if self._closed:
+                return worker
+            try:
+                replacement = _Worker(self._context, self._factory_parameters)
+            except OSError:
+                return worker
+            thread = threading.Thread(
+                target=worker.stop, args=(_STOP_TIMEOUT,), name="SzEngineProcessPool-recycle", daemon=True
+            )
+            thread.start()
+            self._workers[self._workers.index(worker)] = replacement
+            self._retiring = [item for item in self._retiring if item.is_alive()]
+            self._retiring.append(thread)
+            self._stats["recycled"] += 1
+        return replacement
+
+    def _refill(self) -> None:
+        """Start worker processes in place of those dropped by _replace(), while they can be started."""
+        if len(self._workers) >= self._processes:
+            return
+        with self._lock:
+            while not self._closed and len(self._workers) < self._processes:
+                try:
+                    worker = _Worker(self._context, self._factory_parameters)
+                except OSError:
+                    return
+                self._workers.append(worker)
+                self._idle.put(worker)
+
+    def _replace(self, worker: _Worker) -> Optional[_Worker]:
+        """
+        Kill a worker process and start a new one in its place, the new one is readied by its first caller. Once the
+        pool is closed no replacement is started and the killed worker process is returned, for close() to stop. If
+        the new worker process can't be started the worker process is dropped and None returned, _refill() starts it
+        again on a later call.
+        """
+        worker.kill()
+        with self._lock:
+            if self._closed:
+                return worker
+            index = self._workers.index(worker)
+            try:
+                replacement = _Worker(self._context, self._factory_parameters)
+            except OSError:
+                del self._workers[index]
+                self._stats["dropped"] += 1
+                return None
+            self._workers[index] = replacement
+            self._stats["replaced"] += 1
+        return replacement
+
+    def _wait_until_ready(self, worker: _Worker, deadline: Optional[float] = None) -> bool:
+        """
+        Wait for a worker process to create its SzEngine and record its RSS to measure growth from. Return False if the
+        deadline passes first.
+        """
+        if not worker.wait_until_ready(self._startup_timeout, deadline):
+            return False
+        if self._max_rss_growth_bytes is not None and worker.baseline_rss is None:
+            worker.baseline_rss = rss_bytes(worker.process.pid)
+        return True
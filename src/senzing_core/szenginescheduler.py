@@ -0,0 +1,315 @@
+"""
+``senzing_core.szenginescheduler.SzEngineScheduler`` runs SzEngine calls on a pool of worker threads with priority
+classes and per-class concurrency limits.
+
+A process that serves interactive lookups while also loading records and processing redo can have its interactive
+latency collapse when bulk work occupies every thread. The scheduler always starts the highest priority waiting call
+first and caps the number of workers each class can occupy, so bulk work leaves slots free for interactive calls.
+
+Example:
+
+.. code-block:: python
+
+    from senzing_core import SzAbstractFactoryCore, SzEngineScheduler, SzPriority
+
+    sz_abstract_factory = SzAbstractFactoryCore(instance_name, settings)
+    sz_engine = sz_abstract_factory.create_engine()
+
+    with SzEngineScheduler(sz_engine, max_workers=8) as scheduler:
+        future = scheduler.submit(SzPriority.BULK, "add_record", "CUSTOMERS", "1001", record_definition)
+        result = scheduler.call(SzPriority.INTERACTIVE, "get_entity_by_entity_id", 1)
+        future.result()
+        print(scheduler.metrics())
+"""
+
+# pylint: disable=R0903
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from enum import IntEnum
+from typing import Any, Deque, Dict, List, Mapping, Optional, Tuple
+
+from senzing import SzEngine, SzSdkError
+
+from ._histogram import LatencyHistogram
+
+# Metadata
+
+__all__ = ["SzEngineScheduler", "SzPriority"]
+__updated__ = "2025-10-20"
+
+
+# -----------------------------------------------------------------------------
+# SzPriority class
+# -----------------------------------------------------------------------------
+
+
+class SzPriority(IntEnum):
+    """Priority classes for SzEngineScheduler, lower values are started first."""
+
+    INTERACTIVE = 0
+    BULK = 1
+    REDO = 2
+
+
+DEFAULT_MAX_WORKERS = 8
+
+# NOTE - By default bulk writes and redo can't occupy every worker, leaving slots for interactive calls.
+DEFAULT_CONCURRENCY_LIMITS = {
+    SzPriority.INTERACTIVE: DEFAULT_MAX_WORKERS,
+    SzPriority.BULK: DEFAULT_MAX_WORKERS // 2,
+    SzPriority.REDO: DEFAULT_MAX_WORKERS // 4,
+}
+
+
+# -----------------------------------------------------------------------------
+# Helper classes
+# -----------------------------------------------------------------------------
+
+
+class _ScheduledCall:
+    """A call waiting for, or running on, a worker."""
+
+    __slots__ = ("args", "future", "kwargs", "method_name", "priority", "submitted_ns")
+
+    def __init__(
+        self,
+        priority: SzPriority,
+        method_name: str,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> None:
+        self.args = args
+        self.future: Future[Any] = Future()
+        self.kwargs = kwargs
+        self.method_name = method_name
+        self.priority = priority
+        self.submitted_ns = time.perf_counter_ns()
+
+
+class _ClassMetrics:
+    """Counters and latency histograms for a priority class."""
+
+    __slots__ = ("completed", "errors", "run", "submitted", "total", "wait")
+
+    def __init__(self) -> None:
+        self.completed = 0
+        self.errors = 0
+        self.run = LatencyHistogram()
+        self.submitted = 0
+        self.total = LatencyHistogram()
+        self.wait = LatencyHistogram()
+
+
+# -----------------------------------------------------------------------------
+# SzEngineScheduler class
+# -----------------------------------------------------------------------------
+
+
+class SzEngineScheduler:
+    """
+    Schedule SzEngine calls by priority class.
+
+    Args:
+        sz_engine (SzEngine): The SzEngine calls are made on.
+        max_workers (int, optional): Number of worker threads. Defaults to 8.
+        concurrency_limits (Mapping[SzPriority, int], optional): Maximum number of workers each priority class can
+            occupy at once. Classes not specified can use every worker. Defaults to all workers for INTERACTIVE, half
+            for BULK and a quarter for REDO.
+
+    Raises:
+        SzSdkError: max_workers or a concurrency limit is less than 1.
+    """
+
+    def __init__(
+        self,
+        sz_engine: SzEngine,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        concurrency_limits: Optional[Mapping[SzPriority, int]] = None,
+    ) -> None:
+        if max_workers < 1:
+            raise SzSdkError(f"max_workers must be 1 or more, received {max_workers}")
+
+        if concurrency_limits is None:
+            concurrency_limits = {
+                priority: max(1, limit * max_workers // DEFAULT_MAX_WORKERS)
+                for priority, limit in DEFAULT_CONCURRENCY_LIMITS.items()
+            }
+
+        self._limits = {priority: max_workers for priority in SzPriority}
+        for priority, limit in concurrency_limits.items():
+            if limit < 1:
+                raise SzSdkError(
+                    f"concurrency limit for {SzPriority(priority).name} must be 1 or more, received {limit}"
+                )
+            self._limits[SzPriority(priority)] = min(limit, max_workers)
+
+        self._condition = threading.Condition()
+        self._metrics = {priority: _ClassMetrics() for priority in SzPriority}
+        self._queues: Dict[SzPriority, Deque[_ScheduledCall]] = {priority: deque() for priority in SzPriority}
+        self._running = {priority: 0 for priority in SzPriority}
+        self._shutdown = False
+        self._sz_engine = sz_engine
+        self._workers: List[threading.Thread] = []
+
+        for worker_number in range(max_workers):
+            worker = threading.Thread(target=self._worker, name=f"SzEngineScheduler-{worker_number}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def __enter__(self) -> SzEngineScheduler:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.shutdown()
+
+    @property
+    def concurrency_limits(self) -> Dict[SzPriority, int]:
+        """Return the maximum number of workers each priority class can occupy."""
+        return dict(self._limits)
+
+    # -------------------------------------------------------------------------
+    # Public methods
+    # -------------------------------------------------------------------------
+
+    def call(self, priority: SzPriority, method_name: str, *args: Any, **kwargs: Any) -> Any:
+        """
+        Schedule an SzEngine call and wait for its result.
+
+        Args:
+            priority (SzPriority): The priority class of the call.
+            method_name (str): Name of the SzEngine method, e.g. "get_entity_by_entity_id".
+
+        Returns:
+            Any: The result of the SzEngine method.
+        """
+        return self.submit(priority, method_name, *args, **kwargs).result()
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return metrics for each priority class. Latencies are in milliseconds and are reported for the time calls
+        waited for a worker (wait), ran on a worker (run) and from submission to completion (total).
+
+        Returns:
+            Dict[str, Dict[str, Any]]: For example {"INTERACTIVE": {"submitted": 10, "completed": 10, "errors": 0,
+            "queued": 0, "running": 0, "wait": {...}, "run": {...}, "total": {...}}, ...}
+        """
+        with self._condition:
+            return {
+                priority.name: {
+                    "submitted": class_metrics.submitted,
+                    "completed": class_metrics.completed,
+                    "errors": class_metrics.errors,
+                    "queued": len(self._queues[priority]),
+                    "running": self._running[priority],
+                    "wait": class_metrics.wait.summary(),
+                    "run": class_metrics.run.summary(),
+                    "total": class_metrics.total.summary(),
+                }
+                for priority, class_metrics in self._metrics.items()
+            }
+
+    def shutdown(self, wait: bool = True, cancel_pending: bool = False) -> None:
+        """
+        Stop accepting calls and stop the workers once calls already submitted have run.
+
+        Args:
+            wait (bool, optional): Wait for the workers to stop. Defaults to True.
+            cancel_pending (bool, optional): Cancel calls that haven't started instead of running them. Defaults to
+                False.
+        """
+        with self._condition:
+            self._shutdown = True
+            if cancel_pending:
+                for queue in self._queues.values():
+                    while queue:
+                        queue.popleft().future.cancel()
+            self._condition.notify_all()
+
+        if wait:
+            for worker in self._workers:
+                if worker is not threading.current_thread():
+                    worker.join()
+
+    def submit(self, priority: SzPriority, method_name: str, *args: Any, **kwargs: Any) -> Future[Any]:
+        """
+        Schedule an SzEngine call.
+
+        Args:
+            priority (SzPriority): The priority class of the call.
+            method_name (str): Name of the SzEngine method, e.g. "add_record".
+
+        Raises:
+            SzSdkError: The scheduler has been shutdown or the method doesn't exist on the SzEngine.
+
+        Returns:
+            Future[Any]: Completed with the result, or exception, of the SzEngine method.
+        """
+        if method_name.startswith("_") or not callable(getattr(self._sz_engine, method_name, None)):
+            raise SzSdkError(f"{method_name} is not an SzEngine method")
+
+        scheduled_call = _ScheduledCall(SzPriority(priority), method_name, args, kwargs)
+        with self._condition:
+            if self._shutdown:
+                raise SzSdkError("scheduler has been shutdown and can no longer accept calls")
+            self._queues[scheduled_call.priority].append(scheduled_call)
+            self._metrics[scheduled_call.priority].submitted += 1
+            self._condition.notify()
+
+        return scheduled_call.future
+
+    # -------------------------------------------------------------------------
+    # Non-public methods
+    # -------------------------------------------------------------------------
+
+    def _next_call(self) -> Optional[_ScheduledCall]:
+        """Return the highest priority waiting call whose class is under its limit. Caller holds the condition."""
+        for priority in SzPriority:
+            if self._queues[priority] and self._running[priority] < self._limits[priority]:
+                self._running[priority] += 1
+                return self._queues[priority].popleft()
+        return None
+
+    def _worker(self) -> None:
+        """Run scheduled calls until shutdown and no calls are waiting."""
+        while True:
+            with self._condition:
+                scheduled_call = self._next_call()
+                while scheduled_call is None:
+                    if self._shutdown and not any(self._queues.values()):
+                        return
+                    self._condition.wait()
+                    scheduled_call = self._next_call()
+
+            started_ns = time.perf_counter_ns()
+            error: Optional[BaseException] = None
+            result: Any = None
+            is_running = scheduled_call.future.set_running_or_notify_cancel()
+            if is_running:
+                try:
+                    method = getattr(self._sz_engine, scheduled_call.method_name)
+                    result = method(*scheduled_call.args, **scheduled_call.kwargs)
+                except BaseException as err:  # pylint: disable=broad-exception-caught
+                    error = err
+            finished_ns = time.perf_counter_ns()
+
+            with self._condition:
+                self._running[scheduled_call.priority] -= 1
+                class_metrics = self._metrics[scheduled_call.priority]
+                class_metrics.completed += 1
+                class_metrics.errors += 0 if error is None else 1
+                class_metrics.wait.record(started_ns - scheduled_call.submitted_ns)
+                class_metrics.run.record(finished_ns - started_ns)
+                class_metrics.total.record(finished_ns - scheduled_call.submitted_ns)
+                # A slot for this priority class is free, wake workers that may be waiting for one
+                self._condition.notify_all()
+
+            if is_running:
+                if error is None:
+                    scheduled_call.future.set_result(result)
+                else:
+                    scheduled_call.future.set_exception(error)
@@ -0,0 +1,261 @@
+"""
+``senzing_core.szhandles`` tracks the native handles opened by the SDK, to find the ones leaking native memory.
+
+Export handles returned by SzEngineCore.export_json_entity_report() and export_csv_entity_report() are plain ints the
+caller must pass to close_export_report(), as are the in-memory configuration handles SzConfigCore opens. Nothing
+notices when one isn't closed. While tracking is enabled each open handle is recorded with its age and, optionally,
+the stack that opened it. With auto_close, handles still open when the object owning them is collected are closed.
+
+Example:
+
+.. code-block:: python
+
+    from senzing_core import SzAbstractFactoryCore, szhandles
+
+    szhandles.enable()
+    sz_abstract_factory = SzAbstractFactoryCore(instance_name, settings)
+    sz_engine = sz_abstract_factory.create_engine()
+    export_handle = sz_engine.export_json_entity_report()
+    for handle in szhandles.open_handles(min_age_seconds=60):
+        print(handle["kind"], handle["age_seconds"], "".join(handle["stack"]))
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import traceback
+import weakref
+from collections import deque
+from ctypes import CDLL
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from senzing import SzSdkError
+
+from ._helpers import as_c_uintptr_t
+from ._observers import set_handle_tracker
+
+# Metadata
+
+__all__ = ["KINDS", "bind", "disable", "enable", "is_enabled", "open_handles", "stats"]
+__updated__ = "2025-10-20"
+
+DEFAULT_STACK_DEPTH = 16
+
+# Kind: Senzing library function closing handles of that kind
+_CLOSE_FUNCTIONS = {
+    "config": "SzConfig_close_helper",
+    "export": "Sz_closeExportReport_helper",
+}
+KINDS = tuple(_CLOSE_FUNCTIONS)
+
+
+# -----------------------------------------------------------------------------
+# Classes
+# -----------------------------------------------------------------------------
+
+
+class _OpenHandle:  # pylint: disable=R0903
+    """An open handle, the library it was opened with and the finalizer closing it with its owner"""
+
+    __slots__ = ("finalizer", "library_handle", "opened", "owner", "stack")
+
+    def __init__(self, library_handle: Optional[CDLL], owner: str, stack: List[str]) -> None:
+        self.finalizer: Optional[weakref.finalize] = None  # type: ignore[type-arg, unused-ignore]
+        self.library_handle = library_handle
+        self.opened = time.monotonic()
+        self.owner = owner
+        self.stack = stack
+
+
+class _Registry:
+    """Handle tracker recording the handles open, by kind and handle"""
+
+    def __init__(self, stacks: bool, auto_close: bool, stack_depth: int) -> None:
+        self.auto_close = auto_close
+        # NOTE - Finalizers can run in the middle of any allocation, including while this thread holds the lock, so
+        # NOTE - they only close the handle and queue it for the registry to forget the next time it's used
+        self.auto_closed: Deque[Tuple[str, int]] = deque()
+        self.handles: Dict[Tuple[str, int], _OpenHandle] = {}
+        self.lock = threading.Lock()
+        self.stack_depth = stack_depth
+        self.stacks = stacks
+        self.stats = {"auto_closed": 0, "closed": 0, "opened": 0}
+
+    def bind(self, kind: str, handle: int, owner: Any) -> None:
+        """Close an open handle when owner is collected."""
+        with self.lock:
+            self.forget_auto_closed()
+            open_handle = self.handles.get((kind, handle))
+            if open_handle is None:
+                raise SzSdkError(f"{kind} handle {handle} isn't open or was opened before tracking was enabled")
+            if open_handle.finalizer is not None:
+                open_handle.finalizer.detach()
+            open_handle.finalizer = self.finalizer(kind, handle, open_handle.library_handle, owner)
+
+    def closed(self, kind: str, handle: int) -> None:
+        """Handle tracker, forget a closed handle."""
+        with self.lock:
+            self.forget_auto_closed()
+            open_handle = self.handles.pop((kind, handle), None)
+            if open_handle is not None:
+                self.stats["closed"] += 1
+                if open_handle.finalizer is not None:
+                    open_handle.finalizer.detach()
+
+    def finalizer(
+        self, kind: str, handle: int, library_handle: Optional[CDLL], owner: Any
+    ) -> Optional[weakref.finalize]:  # type: ignore[type-arg, unused-ignore]
+        """Return a finalizer closing the handle when owner is collected, None if it can't be."""
+        if library_handle is None:
+            return None
+        try:
+            return weakref.finalize(owner, self.close_with_owner, kind, handle, library_handle)
+        except TypeError:
+            # NOTE - owner doesn't support weak references
+            return None
+
+    def close_with_owner(self, kind: str, handle: int, library_handle: CDLL) -> None:
+        """Finalizer, close a handle still open when its owner is collected."""
+        getattr(library_handle, _CLOSE_FUNCTIONS[kind])(as_c_uintptr_t(handle))
+        self.auto_closed.append((kind, handle))
+
+    def forget_auto_closed(self) -> None:
+        """Forget the handles closed by finalizers. The lock must be held."""
+        while self.auto_closed:
+            if self.handles.pop(self.auto_closed.popleft(), None) is not None:
+                self.stats["auto_closed"] += 1
+
+    def opened(self, kind: str, handle: int, owner: Any) -> None:
+        """Handle tracker, record an opened handle."""
+        # NOTE - The last frames are handle_opened() and this method
+        stack = traceback.format_stack(limit=self.stack_depth + 2)[:-2] if self.stacks else []
+        open_handle = _OpenHandle(getattr(owner, "_library_handle", None), type(owner).__name__, stack)
+        if self.auto_close:
+            open_handle.finalizer = self.finalizer(kind, handle, open_handle.library_handle, owner)
+        with self.lock:
+            self.forget_auto_closed()
+            # NOTE - A handle closed before tracking was enabled may be reused, its old finalizer mustn't close it
+            replaced = self.handles.get((kind, handle))
+            if replaced is not None and replaced.finalizer is not None:
+                replaced.finalizer.detach()
+            self.handles[(kind, handle)] = open_handle
+            self.stats["opened"] += 1
+
+
+_registry: Optional[_Registry] = None  # pylint: disable=C0103
+_registry_lock = threading.Lock()
+
+
+# -----------------------------------------------------------------------------
+# Functions
+# -----------------------------------------------------------------------------
+
+
+def bind(handle: int, owner: Any, kind: str = "export") -> None:
+    """
+    Close an open handle when owner is collected, instead of when the SDK object that opened it is, e.g. to tie an
+    export handle to the response streaming the export. Closing the handle after owner is collected is an error.
+
+    Args:
+        handle (int): The handle, e.g. returned by export_json_entity_report().
+        owner (Any): The object to tie the handle to, must support weak references.
+        kind (str, optional): The kind of handle, one of KINDS. Defaults to "export".
+
+    Raises:
+        SzSdkError: Tracking isn't enabled or the handle isn't open.
+    """
+    registry = _registry
+    if registry is None:
+        raise SzSdkError("handle tracking isn't enabled, call szhandles.enable() first")
+    registry.bind(kind, handle, owner)
+
+
+def disable() -> None:
+    """Stop tracking handles and forget those open. Handles aren't closed when their owners are collected anymore."""
+    global _registry  # pylint: disable=global-statement
+    with _registry_lock:
+        registry, _registry = _registry, None
+        set_handle_tracker(None)
+    if registry is not None:
+        with registry.lock:
+            for open_handle in registry.handles.values():
+                if open_handle.finalizer is not None:
+                    open_handle.finalizer.detach()
+            registry.handles.clear()
+
+
+def enable(stacks: bool = True, auto_close: bool = False, stack_depth: int = DEFAULT_STACK_DEPTH) -> None:
+    """
+    Start tracking the handles opened from now on, replacing any tracking already enabled.
+
+    Args:
+        stacks (bool, optional): Record the stack that opened each handle. Defaults to True.
+        auto_close (bool, optional): Close handles still open when the SzEngineCore or SzConfigCore that opened them,
+            or the object they were bound to with bind(), is collected. Defaults to False.
+        stack_depth (int, optional): The number of frames of each stack to record. Defaults to 16.
+    """
+    global _registry  # pylint: disable=global-statement
+    disable()
+    with _registry_lock:
+        _registry = _Registry(stacks, auto_close, stack_depth)
+        set_handle_tracker(_registry)
+
+
+def is_enabled() -> bool:
+    """Return True if handles are being tracked."""
+    return _registry is not None
+
+
+def open_handles(min_age_seconds: float = 0.0) -> List[Dict[str, Any]]:
+    """
+    Return the handles opened since tracking was enabled and not closed yet, oldest first.
+
+    Args:
+        min_age_seconds (float, optional): Only return handles open for at least this long. Defaults to 0.
+
+    Returns:
+        List[Dict[str, Any]]: For example [{"kind": "export", "handle": 94791220, "age_seconds": 3600.2, "owner":
+        "SzEngineCore", "stack": ['  File "load.py", line 12, in main\\n ...', ...]}, ...]
+    """
+    registry = _registry
+    if registry is None:
+        return []
+
+    now = time.monotonic()
+    with registry.lock:
+        registry.forget_auto_closed()
+        handles = list(registry.handles.items())
+    result = [
+        {
+            "kind": kind,
+            "handle": handle,
+            "age_seconds": now - open_handle.opened,
+            "owner": open_handle.owner,
+            "stack": open_handle.stack,
+        }
+        for (kind, handle), open_handle in handles
+        if now - open_handle.opened >= min_age_seconds
+    ]
+    return sorted(result, key=lambda item: -item["age_seconds"])
+
+
+def stats() -> Dict[str, Any]:
+    """
+    Return the number of handles open by kind and the number opened, closed and closed with their owner since tracking
+    was enabled.
+
+    Returns:
+        Dict[str, Any]: For example {"open": {"config": 0, "export": 2}, "opened": 40, "closed": 37, "auto_closed": 1}
+    """
+    registry = _registry
+    if registry is None:
+        return {"open": dict.fromkeys(KINDS, 0), "opened": 0, "closed": 0, "auto_closed": 0}
+
+    with registry.lock:
+        registry.forget_auto_closed()
+        result: Dict[str, Any] = {"open": dict.fromkeys(KINDS, 0)}
+        for kind, _ in registry.handles:
+            result["open"][kind] += 1
+        result.update(registry.stats)
+    return result
@@ -0,0 +1,272 @@
+"""
+``senzing_core.szmemory.SzMemoryMonitor`` samples the resident set size (RSS) of the process on an interval and
+correlates its growth with the SDK calls made, e.g. to tell a slow native leak in the Senzing library from the working
+set of a load warming up.
+
+Memory allocated by the Senzing library isn't visible to Python's own tools such as tracemalloc, only the process RSS
+shows it. Each sample holds the RSS and the number of SDK calls made so far, by method, so growth can be expressed per
+call as well as per second. The RSS is read with psutil when it's installed, otherwise from /proc on Linux.
+
+Example:
+
+.. code-block:: python
+
+    from senzing_core import SzAbstractFactoryCore, SzMemoryMonitor
+
+    sz_abstract_factory = SzAbstractFactoryCore(instance_name, settings)
+    sz_engine = sz_abstract_factory.create_engine()
+
+    with SzMemoryMonitor(interval=10) as sz_memory_monitor:
+        ...
+        print(sz_memory_monitor.growth(last=60))
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from senzing import SzSdkError
+
+from ._observers import add_call_observer, remove_call_observer
+
+try:
+    import psutil  # type: ignore[import-not-found, import-untyped, unused-ignore]
+except ImportError:
+    psutil = None  # pylint: disable=C0103
+
+# Metadata
+
+__all__ = ["SzMemoryMonitor", "rss_bytes"]
+__updated__ = "2025-10-20"
+
+DEFAULT_CAPACITY = 360
+DEFAULT_INTERVAL = 10.0
+
+
+# -----------------------------------------------------------------------------
+# Functions
+# -----------------------------------------------------------------------------
+
+
+def rss_bytes(pid: Optional[int] = None) -> int:
+    """
+    Return the resident set size of a process in bytes.
+
+    Args:
+        pid (Optional[int], optional): The process. Defaults to None, this process.
+
+    Raises:
+        SzSdkError: The process doesn't exist or its RSS can't be read, psutil isn't installed and there's no /proc.
+
+    Returns:
+        int: The RSS in bytes.
+    """
+    pid = os.getpid() if pid is None else pid
+    if psutil is not None:
+        try:
+            return int(psutil.Process(pid).memory_info().rss)
+        except psutil.Error as err:
+            raise SzSdkError(f"couldn't read the RSS of process {pid}: {err}") from err
+
+    try:
+        with open(f"/proc/{pid}/statm", encoding="utf-8") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (IndexError, OSError, ValueError) as err:
+        raise SzSdkError(f"couldn't read the RSS of process {pid}, install psutil to read it on this platform") from err
+
+
+# -----------------------------------------------------------------------------
+# Helpers
+# -----------------------------------------------------------------------------
+
+
+def _slope(xs: Sequence[float], ys: Sequence[float]) -> float:
+    """Return the least squares slope of ys over xs, 0.0 if xs don't vary."""
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    if not variance:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / variance
+
+
+# -----------------------------------------------------------------------------
+# SzMemoryMonitor class
+# -----------------------------------------------------------------------------
+
+
+class SzMemoryMonitor:
+    """
+    Sample the RSS of this process every interval seconds from a background thread while started, keeping the most
+    recent samples, and count the calls to the methods of SzEngineCore, SzConfigManagerCore, SzDiagnosticCore and
+    SzProductCore made anywhere in the process.
+
+    Args:
+        interval (float, optional): Seconds between samples. Defaults to 10.
+        capacity (int, optional): The number of samples to keep, older samples are discarded. Defaults to 360, an hour
+            of samples at the default interval.
+
+    Raises:
+        SzSdkError: interval isn't greater than 0 or capacity is less than 1.
+    """
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL, capacity: int = DEFAULT_CAPACITY) -> None:
+        if interval <= 0:
+            raise SzSdkError(f"interval must be greater than 0, received {interval}")
+        if capacity < 1:
+            raise SzSdkError(f"capacity must be 1 or more, received {capacity}")
+
+        self._calls: Dict[str, int] = {}
+        self._errors = 0
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._samples: Deque[Dict[str, Any]] = deque(maxlen=capacity)
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> SzMemoryMonitor:
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    @property
+    def errors(self) -> int:
+        """Return the number of times the RSS couldn't be read sampling in the background."""
+        with self._lock:
+            return self._errors
+
+    def growth(self, last: Optional[int] = None) -> Dict[str, float]:
+        """
+        Return the RSS growth over the most recent samples, in total, per SDK call and per second. Growth per call is
+        the least squares slope of the RSS over the calls made, so a steady creep shows through the noise of individual
+        samples.
+
+        Args:
+            last (Optional[int], optional): The number of samples to include. Defaults to None, all samples kept.
+
+        Returns:
+            Dict[str, float]: For example {"rss_bytes": 912000000, "rss_growth_bytes": 48000000, "calls": 120000,
+            "bytes_per_call": 396.5, "bytes_per_second": 13300.2}, rss_bytes is the last RSS sampled. All 0 if there
+            are no samples.
+        """
+        samples = self.samples(last)
+        if not samples:
+            return dict.fromkeys(("rss_bytes", "rss_growth_bytes", "calls", "bytes_per_call", "bytes_per_second"), 0)
+
+        rss = [sample["rss_bytes"] for sample in samples]
+        return {
+            "rss_bytes": rss[-1],
+            "rss_growth_bytes": rss[-1] - rss[0],
+            "calls": samples[-1]["calls"] - samples[0]["calls"],
+            "bytes_per_call": _slope([sample["calls"] for sample in samples], rss),
+            "bytes_per_second": _slope([sample["time"] for sample in samples], rss),
+        }
+
+    def sample(self) -> Dict[str, Any]:
+        """
+        Read the RSS once and keep the sample. Called every interval once started, can also be called directly.
+
+        Returns:
+            Dict[str, Any]: The sample. For example {"time": 1760947200.0, "rss_bytes": 912000000, "calls": 120000,
+            "method_calls": {"SzEngineCore.add_record": 119000, ...}}, the calls made since the monitor was created.
+
+        Raises:
+            SzSdkError: The RSS couldn't be read.
+        """
+        rss = rss_bytes()
+        with self._lock:
+            method_calls = dict(self._calls)
+            result = {
+                "time": time.time(),
+                "rss_bytes": rss,
+                "calls": sum(method_calls.values()),
+                "method_calls": method_calls,
+            }
+            self._samples.append(result)
+            return result
+
+    def samples(self, last: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Return the samples kept, oldest first.
+
+        Args:
+            last (Optional[int], optional): Return only the most recent samples. Defaults to None, all samples.
+
+        Returns:
+            List[Dict[str, Any]]: The samples, as returned by sample().
+        """
+        with self._lock:
+            samples = list(self._samples)
+        if last is None:
+            return samples
+        return samples[-last:] if last > 0 else []
+
+    def start(self) -> None:
+        """
+        Start counting calls and sampling every interval seconds, with a first sample straight away.
+
+        Raises:
+            SzSdkError: The monitor is already started or the RSS can't be read.
+        """
+        # NOTE - The thread is claimed before sampling, outside the lock, so concurrent starts can't both pass the check
+        with self._lock:
+            if self._thread is not None:
+                raise SzSdkError("the SzMemoryMonitor is already started, stop it first")
+            thread = threading.Thread(target=self._run, name="SzMemoryMonitor", daemon=True)
+            self._thread = thread
+            self._stop_event.clear()
+        try:
+            self.sample()
+        except BaseException:
+            with self._lock:
+                if self._thread is thread:
+                    self._thread = None
+            raise
+        with self._lock:
+            # NOTE - Stopped while taking the first sample
+            if self._thread is not thread:
+                return
+            add_call_observer(self._observe)
+            thread.start()
+
+    def stop(self) -> None:
+        """Stop counting calls and sampling. Samples already kept are kept."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            self._stop_event.set()
+            if thread is not None:
+                remove_call_observer(self._observe)
+        # NOTE - Not alive if stopped before start() started it
+        if thread is not None and thread.is_alive() and thread is not threading.current_thread():
+            thread.join()
+
+    # -------------------------------------------------------------------------
+    # Non-public SzMemoryMonitor methods
+    # -------------------------------------------------------------------------
+
+    def _observe(
+        self,
+        func: Callable[..., Any],
+        _args: Tuple[Any, ...],
+        _kwargs: Dict[str, Any],
+        _elapsed_ns: int,
+        _result: Any,
+        _error: Optional[BaseException],
+    ) -> None:
+        method_name = func.__qualname__
+        with self._lock:
+            self._calls[method_name] = self._calls.get(method_name, 0) + 1
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self._interval):
+            try:
+                self.sample()
+            except SzSdkError:
+                with self._lock:
+                    self._errors += 1
@@ -0,0 +1,217 @@
+"""
+``senzing_core.szmetrics`` records, per SDK method, the number of calls, the errors raised by type and a latency
+histogram.
+
+Recording is off until enable() is called. Each thread accumulates in to its own counters and histograms, so
+recording doesn't take a lock or contend with other threads, and snapshot() merges them when read.
+
+With enable(phases=True) the latency of each call is also split in to phases, to tell whether slow calls are spending
+their time in the Senzing library or in the SDK's Python code:
+
+- native: in the Senzing library's functions.
+- response: decoding and freeing the responses of the Senzing library.
+- exception: building the exceptions raised for errors.
+- python: the rest, e.g. checking arguments, building and encoding JSON and the SDK's own overhead.
+
+Example:
+
+.. code-block:: python
+
+    from senzing_core import SzAbstractFactoryCore, szmetrics
+
+    szmetrics.enable()
+    sz_abstract_factory = SzAbstractFactoryCore(instance_name, settings)
+    sz_engine = sz_abstract_factory.create_engine()
+    result = sz_engine.get_entity_by_entity_id(1)
+    print(szmetrics.snapshot()["SzEngineCore.get_entity_by_entity_id"])
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ._helpers import disable_phase_timing, enable_phase_timing
+from ._histogram import LatencyHistogram
+from ._observers import add_call_observer, get_phase_times, remove_call_observer
+
+# Metadata
+
+__all__ = ["PHASES", "disable", "enable", "is_enabled", "reset", "snapshot"]
+__updated__ = "2025-10-20"
+
+PHASES = ("native", "response", "exception", "python")
+
+
+# -----------------------------------------------------------------------------
+# Classes
+# -----------------------------------------------------------------------------
+
+
+class _MethodMetrics:  # pylint: disable=R0903
+    """Counters and latency histograms for one SDK method, on one thread"""
+
+    __slots__ = ("calls", "errors", "latency", "phases")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors: Dict[str, int] = {}
+        self.latency = LatencyHistogram()
+        self.phases: Dict[str, LatencyHistogram] = {}
+
+    def record_phases(self, elapsed_ns: int, native_ns: int, response_ns: int, exception_ns: int) -> None:
+        """Record the time a call spent in each phase."""
+        if not self.phases:
+            self.phases.update((phase, LatencyHistogram()) for phase in PHASES)
+        self.phases["native"].record(native_ns)
+        self.phases["response"].record(response_ns)
+        self.phases["exception"].record(exception_ns)
+        self.phases["python"].record(max(0, elapsed_ns - native_ns - response_ns - exception_ns))
+
+
+class _Recorder:
+    """Per thread metrics, registered on first use so snapshot() can find them"""
+
+    def __init__(self) -> None:
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.threads: List[Dict[str, _MethodMetrics]] = []
+
+    def observe(
+        self,
+        func: Callable[..., Any],
+        _args: Tuple[Any, ...],
+        _kwargs: Dict[str, Any],
+        elapsed_ns: int,
+        _result: Any,
+        error: Optional[BaseException],
+    ) -> None:
+        """Call observer, record a call in the calling thread's metrics."""
+        method_name = func.__qualname__
+        try:
+            thread_metrics: Dict[str, _MethodMetrics] = self.local.metrics
+        except AttributeError:
+            thread_metrics = self.local.metrics = {}
+            with self.lock:
+                self.threads.append(thread_metrics)
+
+        method_metrics = thread_metrics.get(method_name)
+        if method_metrics is None:
+            method_metrics = thread_metrics[method_name] = _MethodMetrics()
+
+        method_metrics.calls += 1
+        method_metrics.latency.record(elapsed_ns)
+        phase_times = get_phase_times()
+        if phase_times is not None:
+            method_metrics.record_phases(
+                elapsed_ns, phase_times.native_ns, phase_times.response_ns, phase_times.exception_ns
+            )
+        if error is not None:
+            error_name = type(error).__name__
+            method_metrics.errors[error_name] = method_metrics.errors.get(error_name, 0) + 1
+
+    def merged(self) -> Dict[str, _MethodMetrics]:
+        """Merge the metrics of every thread, by method name."""
+        with self.lock:
+            threads = tuple(self.threads)
+
+        result: Dict[str, _MethodMetrics] = {}
+        for thread_metrics in threads:
+            # NOTE - Copied as the owning thread may add a method while it's read
+            for method_name, method_metrics in tuple(thread_metrics.items()):
+                merged = result.get(method_name)
+                if merged is None:
+                    merged = result[method_name] = _MethodMetrics()
+                merged.calls += method_metrics.calls
+                merged.latency.merge(method_metrics.latency)
+                for phase, histogram in tuple(method_metrics.phases.items()):
+                    merged.phases.setdefault(phase, LatencyHistogram()).merge(histogram)
+                for error_name, count in tuple(method_metrics.errors.items()):
+                    merged.errors[error_name] = merged.errors.get(error_name, 0) + count
+
+        return result
+
+
+# NOTE - Replaced on reset() so threads start new metrics without coordinating with each other
+_state: Tuple[Optional[_Recorder], _Recorder] = (None, _Recorder())
+_state_lock = threading.Lock()
+
+
+# -----------------------------------------------------------------------------
+# Functions
+# -----------------------------------------------------------------------------
+
+
+def disable() -> None:
+    """Stop recording. Metrics already recorded are kept until reset()."""
+    global _state  # pylint: disable=global-statement
+    with _state_lock:
+        enabled, recorder = _state
+        if enabled is not None:
+            remove_call_observer(enabled.observe)
+        disable_phase_timing()
+        _state = (None, recorder)
+
+
+def enable(phases: bool = False) -> None:
+    """
+    Start recording calls to the methods of SzConfigManagerCore, SzDiagnosticCore, SzEngineCore and SzProductCore.
+
+    Args:
+        phases (bool, optional): Also record the time calls spend in each of PHASES. Timing the Senzing library's
+            functions adds overhead to every call, so this is best enabled while investigating. Defaults to False.
+    """
+    global _state  # pylint: disable=global-statement
+    with _state_lock:
+        enabled, recorder = _state
+        if enabled is None:
+            add_call_observer(recorder.observe)
+        if phases:
+            enable_phase_timing()
+        else:
+            disable_phase_timing()
+        _state = (recorder, recorder)
+
+
+def is_enabled() -> bool:
+    """Return True if calls are being recorded."""
+    return _state[0] is not None
+
+
+def reset() -> None:
+    """Discard the metrics recorded so far."""
+    global _state  # pylint: disable=global-statement
+    with _state_lock:
+        enabled, recorder = _state
+        new_recorder = _Recorder()
+        if enabled is not None:
+            add_call_observer(new_recorder.observe)
+            remove_call_observer(recorder.observe)
+            _state = (new_recorder, new_recorder)
+        else:
+            _state = (None, new_recorder)
+
+
+def snapshot() -> Dict[str, Dict[str, Any]]:
+    """
+    Return the metrics recorded for each SDK method called. Calls still being recorded by other threads may be
+    partially included. Latencies are in milliseconds.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: For example {"SzEngineCore.get_entity_by_entity_id": {"calls": 10, "errors":
+        {"SzNotFoundError": 1}, "latency": {"count": 10, "min_ms": 0.2, "mean_ms": 0.4, "p50_ms": 0.3, "p95_ms": 1.1,
+        "p99_ms": 1.1, "max_ms": 1.1}}, ...}. Calls recorded with phases enabled add "phases": {"native": {...},
+        "response": {...}, "exception": {...}, "python": {...}}, a latency summary per phase.
+    """
+    result: Dict[str, Dict[str, Any]] = {}
+    for method_name, method_metrics in sorted(_state[1].merged().items()):
+        result[method_name] = {
+            "calls": method_metrics.calls,
+            "errors": method_metrics.errors,
+            "latency": method_metrics.latency.summary(),
+        }
+        if method_metrics.phases:
+            result[method_name]["phases"] = {
+                phase: histogram.summary() for phase, histogram in method_metrics.phases.items()
+            }
+    return result
@@ -16,7 +16,7 @@ Example:
 
 # pylint: disable=R0903
 
-from ctypes import c_char_p, c_int, c_longlong, c_void_p
+from ctypes import CDLL, c_char_p, c_int, c_longlong, c_void_p
 from functools import partial
 from typing import Any, Dict, Union
 
@@ -26,10 +26,9 @@ from ._helpers import (
     as_c_char_p,
     as_python_str,
     as_str,
-    catch_sdk_exceptions,
-    check_is_destroyed,
     check_result_rc,
-    load_sz_library,
+    get_sz_library,
+    sdk_method,
 )
 
 # Metadata
@@ -38,6 +37,27 @@ __all__ = ["SzProductCore"]
 __updated__ = "2025-08-06"
 
 
+# -----------------------------------------------------------------------------
+# Declarations of C function input parameters and results
+# -----------------------------------------------------------------------------
+
+
+def _declare_function_signatures(library_handle: CDLL) -> None:
+    """
+    Initialize C function input parameters and results used by SzProductCore, called once per process.
+    Must be synchronized with /opt/senzing/er/sdk/c/libSzProduct.h
+    """
+    library_handle.SzProduct_destroy.argtypes = []
+    library_handle.SzProduct_destroy.restype = c_longlong
+    library_handle.SzProduct_getLicense.argtypes = []
+    library_handle.SzProduct_getLicense.restype = c_char_p
+    library_handle.SzProduct_getVersion.argtypes = []
+    library_handle.SzProduct_getVersion.restype = c_char_p
+    library_handle.SzProduct_init.argtypes = [c_char_p, c_char_p, c_int]
+    library_handle.SzProduct_init.restype = c_longlong
+    library_handle.SzHelper_free.argtypes = [c_void_p]
+
+
 # -----------------------------------------------------------------------------
 # SzProductCore class
 # -----------------------------------------------------------------------------
@@ -71,7 +91,7 @@ class SzProductCore(SzProduct):
         _ = kwargs
 
         self._is_destroyed = False
-        self._library_handle = load_sz_library()
+        self._library_handle = get_sz_library(_declare_function_signatures)
 
         # Partial function to use this modules self._library_handle for exception handling
         self._check_result = partial(
@@ -81,18 +101,6 @@ class SzProductCore(SzProduct):
             self._library_handle.SzProduct_getLastExceptionCode,
         )
 
-        # Initialize C function input parameters and results
-        # Must be synchronized with /opt/senzing/er/sdk/c/libSzProduct.h
-        self._library_handle.SzProduct_destroy.argtypes = []
-        self._library_handle.SzProduct_destroy.restype = c_longlong
-        self._library_handle.SzProduct_getLicense.argtypes = []
-        self._library_handle.SzProduct_getLicense.restype = c_char_p
-        self._library_handle.SzProduct_getVersion.argtypes = []
-        self._library_handle.SzProduct_getVersion.restype = c_char_p
-        self._library_handle.SzProduct_init.argtypes = [c_char_p, c_char_p, c_int]
-        self._library_handle.SzProduct_init.restype = c_longlong
-        self._library_handle.SzHelper_free.argtypes = [c_void_p]
-
     @property
     def is_destroyed(self) -> bool:
         """Return if the instance has been destroyed."""
@@ -113,8 +121,7 @@ class SzProductCore(SzProduct):
         result = self._library_handle.SzProduct_destroy()
         self._check_result(result)
 
-    @check_is_destroyed
-    @catch_sdk_exceptions
+    @sdk_method
     def _initialize(
         self,
         instance_name: str,
@@ -128,10 +135,10 @@ class SzProductCore(SzProduct):
         )
         self._check_result(result)
 
-    @check_is_destroyed
+    @sdk_method
     def get_license(self) -> str:
         return as_python_str(self._library_handle.SzProduct_getLicense())
 
-    @check_is_destroyed
+    @sdk_method
     def get_version(self) -> str:
         return as_python_str(self._library_handle.SzProduct_getVersion())
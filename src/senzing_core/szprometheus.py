@@ -0,0 +1,363 @@
+"""
+``senzing_core.szprometheus.SzPrometheusExporter`` exposes the activity of SzEngineCore to Prometheus.
+
+The exporter counts the add, delete, redo, search and get calls and their errors, keeps a histogram of their durations
+and reports the depth of the redo queue from SzEngine.count_redo_records(). The metrics are rendered in the Prometheus
+text exposition format and are either written to a file for node_exporter's textfile collector on an interval or
+served over HTTP.
+
+Example:
+
+.. code-block:: python
+
+    from senzing_core import SzAbstractFactoryCore, SzPrometheusExporter
+
+    sz_abstract_factory = SzAbstractFactoryCore(instance_name, settings)
+    sz_engine = sz_abstract_factory.create_engine()
+
+    with SzPrometheusExporter(sz_engine) as sz_prometheus_exporter:
+        sz_prometheus_exporter.serve_http(port=9464)
+        sz_engine.add_record("CUSTOMERS", "1001", record_definition)
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+from bisect import bisect_left
+from contextlib import suppress
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from senzing import SzEngine, SzError, SzSdkError
+
+from ._observers import add_call_observer, remove_call_observer
+
+# Metadata
+
+__all__ = ["DEFAULT_BUCKETS", "DEFAULT_OPERATIONS", "SzPrometheusExporter"]
+__updated__ = "2025-10-20"
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_INTERVAL = 15.0
+
+# Upper bounds, in seconds, of the call duration histogram buckets
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Qualified method name: operation label
+DEFAULT_OPERATIONS = {
+    "SzEngineCore.add_record": "add",
+    "SzEngineCore.delete_record": "delete",
+    "SzEngineCore.get_entity_by_entity_id": "get",
+    "SzEngineCore.get_entity_by_record_id": "get",
+    "SzEngineCore.get_record": "get",
+    "SzEngineCore.get_redo_record": "redo",
+    "SzEngineCore.get_virtual_entity_by_record_id": "get",
+    "SzEngineCore.process_redo_record": "redo",
+    "SzEngineCore.search_by_attributes": "search",
+}
+
+NS_PER_SECOND = 1_000_000_000
+
+
+# -----------------------------------------------------------------------------
+# Helpers
+# -----------------------------------------------------------------------------
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+class _OperationMetrics:  # pylint: disable=R0903
+    """Call count, errors by type and duration histogram of one operation"""
+
+    __slots__ = ("buckets", "calls", "errors", "total_ns")
+
+    def __init__(self, bucket_count: int) -> None:
+        self.buckets = [0] * bucket_count
+        self.calls = 0
+        self.errors: Dict[str, int] = {}
+        self.total_ns = 0
+
+
+# -----------------------------------------------------------------------------
+# SzPrometheusExporter class
+# -----------------------------------------------------------------------------
+
+
+class SzPrometheusExporter:
+    """
+    Collect metrics on SzEngineCore calls made anywhere in the process while started and render them for Prometheus.
+
+    Args:
+        sz_engine (Optional[SzEngine], optional): The engine to report the redo queue depth of, sampled each time the
+            metrics are rendered. Defaults to None, the depth isn't reported.
+        operations (Optional[Dict[str, str]], optional): The qualified names of the methods to count, e.g.
+            "SzEngineCore.add_record", mapped to the operation label they are counted under. Defaults to
+            DEFAULT_OPERATIONS.
+        buckets (Tuple[float, ...], optional): Upper bounds, in seconds, of the call duration histogram buckets.
+            Defaults to DEFAULT_BUCKETS.
+
+    Raises:
+        SzSdkError: buckets is empty or isn't in ascending order.
+    """
+
+    def __init__(
+        self,
+        sz_engine: Optional[SzEngine] = None,
+        operations: Optional[Dict[str, str]] = None,
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        if not buckets or list(buckets) != sorted(set(buckets)):
+            raise SzSdkError(f"buckets must be in ascending order, received {buckets}")
+
+        self._bucket_bounds_ns = [int(bound * NS_PER_SECOND) for bound in buckets]
+        self._buckets = buckets
+        self._errors = 0
+        self._http_server: Optional[ThreadingHTTPServer] = None
+        self._last_error: Optional[Exception] = None
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, _OperationMetrics] = {}
+        self._operations = dict(DEFAULT_OPERATIONS if operations is None else operations)
+        self._started = False
+        self._stop_event = threading.Event()
+        self._sz_engine = sz_engine
+        self._threads: List[threading.Thread] = []
+
+    def __enter__(self) -> SzPrometheusExporter:
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    @property
+    def errors(self) -> int:
+        """Return the number of errors raised writing the file in the background, see start_textfile()."""
+        with self._lock:
+            return self._errors
+
+    @property
+    def last_error(self) -> Optional[Exception]:
+        """Return the last error raised writing the file in the background, or None."""
+        with self._lock:
+            return self._last_error
+
+    def render(self) -> str:
+        """
+        Return the metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: The metrics, senzing_engine_calls_total, senzing_engine_errors_total,
+            senzing_engine_call_duration_seconds and, if an engine was given, senzing_engine_redo_queue_depth.
+        """
+        lines = [
+            "# HELP senzing_engine_calls_total Calls to the Senzing engine, by operation.",
+            "# TYPE senzing_engine_calls_total counter",
+        ]
+        with self._lock:
+            metrics = sorted(
+                (
+                    operation,
+                    operation_metrics.calls,
+                    dict(operation_metrics.errors),
+                    list(operation_metrics.buckets),
+                    operation_metrics.total_ns,
+                )
+                for operation, operation_metrics in self._metrics.items()
+            )
+
+        for operation, calls, _, _, _ in metrics:
+            lines.append(f'senzing_engine_calls_total{{operation="{operation}"}} {calls}')
+
+        lines.append("# HELP senzing_engine_errors_total Calls to the Senzing engine that raised an error, by type.")
+        lines.append("# TYPE senzing_engine_errors_total counter")
+        for operation, _, errors, _, _ in metrics:
+            for error_type, count in sorted(errors.items()):
+                lines.append(
+                    f'senzing_engine_errors_total{{operation="{operation}",error_type="{error_type}"}} {count}'
+                )
+
+        lines.append("# HELP senzing_engine_call_duration_seconds Duration of calls to the Senzing engine.")
+        lines.append("# TYPE senzing_engine_call_duration_seconds histogram")
+        for operation, calls, _, buckets, total_ns in metrics:
+            cumulative = 0
+            for bound, count in zip((*self._buckets, float("inf")), buckets):
+                cumulative += count
+                lines.append(
+                    f'senzing_engine_call_duration_seconds_bucket{{operation="{operation}",le="{_format_value(bound)}"}}'
+                    f" {cumulative}"
+                )
+            lines.append(
+                f'senzing_engine_call_duration_seconds_sum{{operation="{operation}"}}'
+                f" {_format_value(total_ns / NS_PER_SECOND)}"
+            )
+            lines.append(f'senzing_engine_call_duration_seconds_count{{operation="{operation}"}} {calls}')
+
+        if self._sz_engine is not None:
+            # NOTE - A failed sample leaves the gauge out of this scrape rather than failing it
+            try:
+                redo_queue_depth = self._sz_engine.count_redo_records()
+            except SzError:
+                pass
+            else:
+                lines.append("# HELP senzing_engine_redo_queue_depth Redo records waiting to be processed.")
+                lines.append("# TYPE senzing_engine_redo_queue_depth gauge")
+                lines.append(f"senzing_engine_redo_queue_depth {redo_queue_depth}")
+
+        return "\n".join(lines) + "\n"
+
+    def serve_http(self, port: int = 0, host: str = "127.0.0.1") -> Tuple[str, int]:
+        """
+        Serve the metrics over HTTP, on any path, from a background thread until stopped.
+
+        Args:
+            port (int, optional): The port to listen on. Defaults to 0, a free port.
+            host (str, optional): The address to listen on. Defaults to "127.0.0.1".
+
+        Returns:
+            Tuple[str, int]: The address and port listened on.
+
+        Raises:
+            SzSdkError: Metrics are already served over HTTP.
+        """
+        with self._lock:
+            if self._http_server is not None:
+                raise SzSdkError("metrics are already served over HTTP, stop the exporter first")
+            self._http_server = ThreadingHTTPServer((host, port), _handler(self.render))
+            self._http_server.daemon_threads = True
+            self._start_thread(self._http_server.serve_forever, "SzPrometheusExporter-http")
+            return self._http_server.server_address[:2]  # type: ignore[return-value]
+
+    def start(self) -> None:
+        """Start counting SzEngineCore calls."""
+        with self._lock:
+            if not self._started:
+                add_call_observer(self._observe)
+                self._started = True
+
+    def start_textfile(self, path: str, interval: float = DEFAULT_INTERVAL) -> None:
+        """
+        Write the metrics to a file every interval seconds from a background thread until stopped. The file is
+        replaced atomically so the textfile collector never reads a partial file. Errors writing the file are counted
+        in errors, the last kept in last_error, and the file is written again after the next interval.
+
+        Args:
+            path (str): The file to write, e.g. "/var/lib/node_exporter/senzing.prom".
+            interval (float, optional): Seconds between writes. Defaults to 15.
+
+        Raises:
+            SzSdkError: interval isn't greater than 0.
+        """
+        if interval <= 0:
+            raise SzSdkError(f"interval must be greater than 0, received {interval}")
+
+        def run() -> None:
+            self._write_textfile_in_background(path)
+            while not self._stop_event.wait(interval):
+                self._write_textfile_in_background(path)
+
+        with self._lock:
+            self._start_thread(run, "SzPrometheusExporter-textfile")
+
+    def stop(self) -> None:
+        """Stop counting calls, serving over HTTP and writing files. Counts already made are kept."""
+        with self._lock:
+            if self._started:
+                remove_call_observer(self._observe)
+                self._started = False
+            http_server, self._http_server = self._http_server, None
+            threads, self._threads = self._threads, []
+            self._stop_event.set()
+        if http_server is not None:
+            http_server.shutdown()
+            http_server.server_close()
+        for thread in threads:
+            thread.join()
+        self._stop_event.clear()
+
+    def write_textfile(self, path: str) -> None:
+        """
+        Write the metrics to a file once, replacing it atomically.
+
+        Args:
+            path (str): The file to write.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        temp_path: Optional[str] = None
+        try:
+            with tempfile.NamedTemporaryFile("w", dir=directory, encoding="utf-8", delete=False, suffix=".tmp") as file:
+                temp_path = file.name
+                file.write(self.render())
+            os.replace(temp_path, path)
+            temp_path = None
+        finally:
+            if temp_path is not None:
+                with suppress(OSError):
+                    os.remove(temp_path)
+
+    # -------------------------------------------------------------------------
+    # Non-public SzPrometheusExporter methods
+    # -------------------------------------------------------------------------
+
+    def _observe(
+        self,
+        func: Callable[..., Any],
+        _args: Tuple[Any, ...],
+        _kwargs: Dict[str, Any],
+        elapsed_ns: int,
+        _result: Any,
+        error: Optional[BaseException],
+    ) -> None:
+        operation = self._operations.get(func.__qualname__)
+        if operation is None:
+            return
+
+        bucket = bisect_left(self._bucket_bounds_ns, elapsed_ns)
+        with self._lock:
+            operation_metrics = self._metrics.get(operation)
+            if operation_metrics is None:
+                operation_metrics = self._metrics[operation] = _OperationMetrics(len(self._bucket_bounds_ns) + 1)
+            operation_metrics.calls += 1
+            operation_metrics.buckets[bucket] += 1
+            operation_metrics.total_ns += elapsed_ns
+            if error is not None:
+                error_type = type(error).__name__
+                operation_metrics.errors[error_type] = operation_metrics.errors.get(error_type, 0) + 1
+
+    def _write_textfile_in_background(self, path: str) -> None:
+        # NOTE - Any exception is kept rather than ending the thread, e.g. a full disk or an error rendering
+        try:
+            self.write_textfile(path)
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            with self._lock:
+                self._errors += 1
+                self._last_error = err
+
+    def _start_thread(self, target: Callable[[], None], name: str) -> None:
+        thread = threading.Thread(target=target, name=name, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+
+def _handler(render: Callable[[], str]) -> type:
+    """Return a request handler class serving the rendered metrics on GET."""
+
+    class _MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # pylint: disable=invalid-name
+            """Serve the metrics."""
+            body = render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:  # pylint: disable=redefined-builtin
+            """Don't log scrapes."""
+
+    return _MetricsHandler
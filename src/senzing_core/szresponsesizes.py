@@ -0,0 +1,198 @@
+"""
+``senzing_core.szresponsesizes.SzResponseSizeTracker`` tracks the size of the JSON responses of SDK methods, by method
+and flags, and the largest responses with the arguments that produced them.
+
+Large responses cost time to build, decode and parse, e.g. SZ_ENTITY_DEFAULT_FLAGS on an entity with thousands of
+records can return megabytes. The sizes by flags show which flags are worth cutting and the largest responses point at
+the runaway entities.
+
+Example:
+
+.. code-block:: python
+
+    from senzing_core import SzAbstractFactoryCore, SzResponseSizeTracker
+
+    sz_abstract_factory = SzAbstractFactoryCore(instance_name, settings)
+    sz_engine = sz_abstract_factory.create_engine()
+
+    with SzResponseSizeTracker(top_n=5) as sz_response_size_tracker:
+        result = sz_engine.get_entity_by_entity_id(1)
+    print(sz_response_size_tracker.snapshot()["SzEngineCore.get_entity_by_entity_id"])
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from senzing import SzSdkError
+
+from ._histogram import LatencyHistogram
+from ._observers import (
+    add_call_observer,
+    call_argument,
+    remove_call_observer,
+    summarize_call_arguments,
+)
+
+# Metadata
+
+__all__ = ["SzResponseSizeTracker"]
+__updated__ = "2025-10-20"
+
+DEFAULT_MAX_ARGUMENT_LENGTH = 256
+DEFAULT_TOP_N = 10
+
+
+# -----------------------------------------------------------------------------
+# Helpers
+# -----------------------------------------------------------------------------
+
+
+def _size_summary(histogram: LatencyHistogram) -> Dict[str, float]:
+    """Return the count, total and the min, mean, p50, p95, p99 and max sizes in bytes."""
+    return {
+        "count": histogram.count,
+        "total_bytes": histogram.total,
+        "min_bytes": histogram.min or 0,
+        "mean_bytes": (histogram.total / histogram.count) if histogram.count else 0.0,
+        "p50_bytes": histogram.percentile(50),
+        "p95_bytes": histogram.percentile(95),
+        "p99_bytes": histogram.percentile(99),
+        "max_bytes": histogram.max,
+    }
+
+
+# -----------------------------------------------------------------------------
+# SzResponseSizeTracker class
+# -----------------------------------------------------------------------------
+
+
+class SzResponseSizeTracker:
+    """
+    Track the UTF-8 size of the responses returned by calls to the methods of SzEngineCore, SzConfigManagerCore,
+    SzDiagnosticCore and SzProductCore made anywhere in the process while started. Methods without a flags parameter
+    are tracked under flags None.
+
+    Args:
+        top_n (int, optional): The number of largest responses to keep per method, with the arguments of their calls.
+            Defaults to 10.
+        max_argument_length (int, optional): Truncate the text of each argument kept to this many characters. Defaults
+            to 256.
+
+    Raises:
+        SzSdkError: top_n is negative or max_argument_length is less than 1.
+    """
+
+    def __init__(self, top_n: int = DEFAULT_TOP_N, max_argument_length: int = DEFAULT_MAX_ARGUMENT_LENGTH) -> None:
+        if top_n < 0:
+            raise SzSdkError(f"top_n must be 0 or more, received {top_n}")
+        if max_argument_length < 1:
+            raise SzSdkError(f"max_argument_length must be 1 or more, received {max_argument_length}")
+
+        self._largest: Dict[str, List[Tuple[int, int, Dict[str, Any]]]] = {}
+        self._lock = threading.Lock()
+        self._max_argument_length = max_argument_length
+        self._sequence = itertools.count()
+        # NOTE - LatencyHistogram counts any non-negative integers, here sizes in bytes
+        self._sizes: Dict[str, Dict[Optional[int], LatencyHistogram]] = {}
+        self._started = False
+        self._top_n = top_n
+
+    def __enter__(self) -> SzResponseSizeTracker:
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    def reset(self) -> None:
+        """Discard the sizes tracked so far."""
+        with self._lock:
+            self._largest = {}
+            self._sizes = {}
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the response sizes tracked for each SDK method called.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: For example {"SzEngineCore.get_entity_by_entity_id": {"flags": {3: {"count": 10,
+            "total_bytes": 52000, "min_bytes": 900, "mean_bytes": 5200.0, "p50_bytes": 1100, "p95_bytes": 41000,
+            "p99_bytes": 41000, "max_bytes": 41000}, ...}, "largest": [{"bytes": 41000, "flags": 3, "arguments":
+            {"entity_id": 1}}, ...]}, ...}, the largest responses first.
+        """
+        with self._lock:
+            result: Dict[str, Dict[str, Any]] = {}
+            for method_name, sizes in sorted(self._sizes.items()):
+                result[method_name] = {
+                    "flags": {flags: _size_summary(histogram) for flags, histogram in sizes.items()},
+                    "largest": [entry for _, _, entry in sorted(self._largest.get(method_name, []), reverse=True)],
+                }
+            return result
+
+    def start(self) -> None:
+        """Start tracking response sizes."""
+        with self._lock:
+            if not self._started:
+                add_call_observer(self._observe)
+                self._started = True
+
+    def stop(self) -> None:
+        """Stop tracking response sizes. Sizes already tracked are kept until reset()."""
+        with self._lock:
+            if self._started:
+                remove_call_observer(self._observe)
+                self._started = False
+
+    # -------------------------------------------------------------------------
+    # Non-public SzResponseSizeTracker methods
+    # -------------------------------------------------------------------------
+
+    def _is_largest(self, method_name: str, size: int) -> bool:
+        largest = self._largest.get(method_name)
+        if not largest:
+            return self._top_n > 0
+        return len(largest) < self._top_n or size > largest[0][0]
+
+    def _observe(
+        self,
+        func: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        _elapsed_ns: int,
+        result: Any,
+        _error: Optional[BaseException],
+    ) -> None:
+        if not isinstance(result, str):
+            return
+
+        # NOTE - isascii() is O(1) and the length of an ASCII str is its UTF-8 size, only other responses are encoded
+        size = len(result) if result.isascii() else len(result.encode("utf-8"))
+        method_name = func.__qualname__
+        flags = call_argument(func, args, kwargs, "flags")
+        flags = int(flags) if isinstance(flags, int) else None
+
+        # NOTE - Arguments are summarized outside the lock, only for responses likely to be among the largest
+        entry: Optional[Dict[str, Any]] = None
+        if self._is_largest(method_name, size):
+            arguments = summarize_call_arguments(func, args, kwargs, self._max_argument_length)
+            arguments.pop("flags", None)
+            entry = {"bytes": size, "flags": flags, "arguments": arguments}
+
+        with self._lock:
+            sizes = self._sizes.setdefault(method_name, {})
+            histogram = sizes.get(flags)
+            if histogram is None:
+                histogram = sizes[flags] = LatencyHistogram()
+            histogram.record(size)
+
+            if entry is not None and self._is_largest(method_name, size):
+                largest = self._largest.setdefault(method_name, [])
+                item = (size, next(self._sequence), entry)
+                if len(largest) < self._top_n:
+                    heapq.heappush(largest, item)
+                else:
+                    heapq.heapreplace(largest, item)
@@ -0,0 +1,248 @@
+"""
+``senzing_core.szslowcalllog.SzSlowCallLog`` logs SDK calls taking longer than a threshold, with a summary of their
+arguments, to find the entities and search attributes behind latency spikes.
+
+Slow calls are queued by the calling thread and written by a background thread to a JSON lines file, rotated when it
+reaches a maximum size. Calls under the threshold only cost a comparison.
+
+Example:
+
+.. code-block:: python
+
+    from senzing_core import SzAbstractFactoryCore, SzSlowCallLog
+
+    sz_abstract_factory = SzAbstractFactoryCore(instance_name, settings)
+    sz_engine = sz_abstract_factory.create_engine()
+
+    with SzSlowCallLog("slow_calls.jsonl", threshold_ms=500, method_thresholds_ms={"SzEngineCore.add_record": 100}):
+        sz_engine.search_by_attributes(attributes)
+"""
+
+from __future__ import annotations
+
+import os
+import queue
+import threading
+import time
+from typing import IO, Any, Callable, Dict, Optional, Tuple
+
+from senzing import SzSdkError
+
+from ._helpers import as_str
+from ._observers import (
+    add_call_observer,
+    remove_call_observer,
+    summarize_call_arguments,
+)
+
+# Metadata
+
+__all__ = ["SzSlowCallLog"]
+__updated__ = "2025-10-20"
+
+DEFAULT_BACKUP_COUNT = 5
+DEFAULT_MAX_ARGUMENT_LENGTH = 256
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_MAX_PENDING = 10_000
+DEFAULT_STOP_TIMEOUT = 10.0
+DEFAULT_THRESHOLD_MS = 1_000.0
+
+NS_PER_MS = 1_000_000
+
+
+# -----------------------------------------------------------------------------
+# SzSlowCallLog class
+# -----------------------------------------------------------------------------
+
+
+class SzSlowCallLog:
+    """
+    Log calls to the methods of SzEngineCore, SzConfigManagerCore, SzDiagnosticCore and SzProductCore made anywhere in
+    the process that take longer than a threshold, while started. Each line of the log is a JSON document, e.g.
+    {"time": 1760947200.1, "method": "SzEngineCore.search_by_attributes", "duration_ms": 1520.3, "thread": "worker-3",
+    "arguments": {"attributes": "{\\"NAME_FULL\\": ...", "flags": 3, "search_profile": ""}, "error_type": null}.
+
+    Args:
+        path (str): The file to append to, created if it doesn't exist.
+        threshold_ms (float, optional): Log calls taking longer than this. Defaults to 1,000.
+        method_thresholds_ms (Optional[Dict[str, float]], optional): Thresholds for specific methods, by qualified
+            name, e.g. {"SzEngineCore.add_record": 100}. Defaults to None, threshold_ms for every method.
+        max_argument_length (int, optional): Truncate the text of each argument to this many characters. Defaults to
+            256.
+        max_bytes (int, optional): Rotate the file when it reaches this size. Defaults to 10 MiB.
+        backup_count (int, optional): The number of rotated files to keep, path.1 being the most recent. Defaults to 5,
+            with 0 the file is truncated when it reaches max_bytes.
+        max_pending (int, optional): The number of slow calls waiting to be written above which further slow calls are
+            dropped, rather than slowing the calling threads. Defaults to 10,000.
+
+    Raises:
+        SzSdkError: A threshold is negative or max_argument_length, max_bytes, backup_count or max_pending is out of
+            range.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        path: str,
+        threshold_ms: float = DEFAULT_THRESHOLD_MS,
+        method_thresholds_ms: Optional[Dict[str, float]] = None,
+        *,
+        max_argument_length: int = DEFAULT_MAX_ARGUMENT_LENGTH,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backup_count: int = DEFAULT_BACKUP_COUNT,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ) -> None:
+        method_thresholds_ms = method_thresholds_ms or {}
+        if min([threshold_ms, *method_thresholds_ms.values()]) < 0:
+            raise SzSdkError(f"thresholds must be 0 or more, received {threshold_ms} and {method_thresholds_ms}")
+        if max_argument_length < 1 or max_bytes < 1 or max_pending < 1:
+            raise SzSdkError("max_argument_length, max_bytes and max_pending must be 1 or more")
+        if backup_count < 0:
+            raise SzSdkError(f"backup_count must be 0 or more, received {backup_count}")
+
+        self._backup_count = backup_count
+        self._lock = threading.Lock()
+        self._max_argument_length = max_argument_length
+        self._max_bytes = max_bytes
+        self._method_thresholds_ns = {name: int(ms * NS_PER_MS) for name, ms in method_thresholds_ms.items()}
+        self._path = path
+        self._queue: queue.Queue[Optional[Dict[str, Any]]] = queue.Queue(maxsize=max_pending)
+        self._stats = {"dropped": 0, "errors": 0, "logged": 0}
+        self._thread: Optional[threading.Thread] = None
+        self._threshold_ns = int(threshold_ms * NS_PER_MS)
+
+    def __enter__(self) -> SzSlowCallLog:
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """
+        Open the file and start logging slow calls.
+
+        Raises:
+            SzSdkError: The log is already started.
+        """
+        with self._lock:
+            if self._thread is not None:
+                raise SzSdkError("the SzSlowCallLog is already started, stop it first")
+            file = open(self._path, "a", encoding="utf-8")  # pylint: disable=R1732
+            self._thread = threading.Thread(target=self._write, args=(file,), name="SzSlowCallLog", daemon=True)
+            self._thread.start()
+            add_call_observer(self._observe)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return the number of slow calls logged, dropped because too many were waiting to be written or stop() timed out,
+        and the number of errors writing, flushing and rotating the file.
+
+        Returns:
+            Dict[str, int]: For example {"dropped": 0, "errors": 0, "logged": 12}
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def stop(self, timeout: Optional[float] = DEFAULT_STOP_TIMEOUT) -> None:
+        """
+        Stop logging slow calls, write those waiting and close the file.
+
+        Args:
+            timeout (Optional[float], optional): Seconds to wait for the slow calls waiting to be written, those not
+                written by then are dropped. None to wait until they're written. Defaults to 10.
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+            if thread is None:
+                return
+            remove_call_observer(self._observe)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            self._drop_pending()
+        thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+
+    # -------------------------------------------------------------------------
+    # Non-public SzSlowCallLog methods
+    # -------------------------------------------------------------------------
+
+    def _observe(
+        self,
+        func: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        elapsed_ns: int,
+        _result: Any,
+        error: Optional[BaseException],
+    ) -> None:
+        method_name = func.__qualname__
+        if elapsed_ns <= self._method_thresholds_ns.get(method_name, self._threshold_ns):
+            return
+
+        entry = {
+            "time": time.time() - elapsed_ns / 1e9,
+            "method": method_name,
+            "duration_ms": elapsed_ns / NS_PER_MS,
+            "thread": threading.current_thread().name,
+            "arguments": summarize_call_arguments(func, args, kwargs, self._max_argument_length),
+            "error_type": type(error).__name__ if error is not None else None,
+        }
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self._count("dropped")
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+    def _drop_pending(self) -> None:
+        """Drop the slow calls waiting to be written until there's room to tell the writer thread to stop."""
+        while True:
+            try:
+                self._queue.put_nowait(None)
+                return
+            except queue.Full:
+                pass
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                continue
+            self._count("dropped")
+
+    def _rotate(self, file: IO[str]) -> IO[str]:
+        file.close()
+        if self._backup_count > 0:
+            for index in range(self._backup_count - 1, 0, -1):
+                if os.path.exists(f"{self._path}.{index}"):
+                    os.replace(f"{self._path}.{index}", f"{self._path}.{index + 1}")
+            os.replace(self._path, f"{self._path}.1")
+            return open(self._path, "a", encoding="utf-8")
+        return open(self._path, "w", encoding="utf-8")
+
+    def _write(self, file: IO[str]) -> None:
+        # NOTE - Errors are counted rather than ending the thread, a failed rotation leaves the file closed to reopen
+        while True:
+            entry = self._queue.get()
+            if entry is None:
+                break
+            try:
+                if file.closed:
+                    file = open(self._path, "a", encoding="utf-8")  # pylint: disable=R1732
+                file.write(as_str(entry) + "\n")
+            except (OSError, TypeError, ValueError):
+                self._count("errors")
+                continue
+            self._count("logged")
+            try:
+                if file.tell() >= self._max_bytes:
+                    file = self._rotate(file)
+                elif self._queue.empty():
+                    file.flush()
+            except OSError:
+                self._count("errors")
+        try:
+            file.close()
+        except OSError:
+            self._count("errors")
@@ -0,0 +1,292 @@
+"""
+``senzing_core.szstatssampler.SzStatsSampler`` samples SzEngine.get_stats() on an interval and keeps the recent
+samples to query throughput and its trend, e.g. to spot a slowdown during a long load.
+
+get_stats() returns and resets the Senzing engine's workload counters, so each sample holds the counts for the interval
+since the previous one. Counters are flattened to dotted names, e.g. "addedRecords", "lockWaits.countRefreshLocks",
+"redoTriggers" (the total of the redoTriggers list) and "cacheHit.NAME" (one entry of the cacheHit list). The thread
+state and system resources are gauges, e.g. "threadState.active", and are kept as sampled.
+
+Example:
+
+.. code-block:: python
+
+    from senzing_core import SzAbstractFactoryCore, SzStatsSampler
+
+    sz_abstract_factory = SzAbstractFactoryCore(instance_name, settings)
+    sz_engine = sz_abstract_factory.create_engine()
+
+    with SzStatsSampler(sz_engine, interval=60) as sz_stats_sampler:
+        ...
+        print(sz_stats_sampler.rate("addedRecords", last=5))
+        print(sz_stats_sampler.trend("addedRecords", last=5))
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from senzing import SzEngine, SzSdkError
+
+from ._helpers import _json_loads
+
+# Metadata
+
+__all__ = ["SzStatsSampler"]
+__updated__ = "2025-10-20"
+
+DEFAULT_CAPACITY = 1_440
+DEFAULT_INTERVAL = 60.0
+
+# Workload sections holding point in time values rather than counts since the previous sample
+_GAUGE_SECTIONS = ("systemResources", "threadState")
+
+# Workload values that aren't counts, e.g. loadedRecords is -1 unless the engine tracks it
+_IGNORED = ("apiVersion", "loadedRecords")
+
+
+# -----------------------------------------------------------------------------
+# Helpers
+# -----------------------------------------------------------------------------
+
+
+def _flatten(value: Any, name: str, result: Dict[str, float], list_totals: bool) -> None:
+    """
+    Add the numbers in a get_stats() value to result, by dotted name. Lists of single entry objects, e.g.
+    [{"NAME": 6}, {"DOB": 4}], add an entry per name and, if list_totals, their total under the list's name.
+    """
+    if isinstance(value, bool):
+        return
+    if isinstance(value, (int, float)):
+        result[name] = result.get(name, 0) + value
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            _flatten(item, f"{name}.{key}" if name else key, result, list_totals)
+    elif isinstance(value, list):
+        total: float = 0
+        for item in value:
+            if isinstance(item, dict):
+                for key, item_value in item.items():
+                    _flatten(item_value, f"{name}.{key}", result, list_totals)
+                    if isinstance(item_value, (int, float)) and not isinstance(item_value, bool):
+                        total += item_value
+        if list_totals:
+            result[name] = total
+
+
+def _parse_stats(stats: str) -> Dict[str, Dict[str, float]]:
+    """
+    Flatten the workload in a get_stats() response to counters and gauges by dotted name.
+
+    Args:
+        stats (str): A get_stats() response.
+
+    Returns:
+        Dict[str, Dict[str, float]]: {"counters": {"addedRecords": 10, ...}, "gauges": {"threadState.active": 2, ...}}
+    """
+    workload = _json_loads(stats).get("workload", {})
+    counters: Dict[str, float] = {}
+    gauges: Dict[str, float] = {}
+    for key, value in workload.items():
+        if key in _IGNORED:
+            continue
+        if key in _GAUGE_SECTIONS:
+            _flatten(value, key, gauges, list_totals=False)
+        else:
+            _flatten(value, key, counters, list_totals=True)
+    return {"counters": counters, "gauges": gauges}
+
+
+# -----------------------------------------------------------------------------
+# SzStatsSampler class
+# -----------------------------------------------------------------------------
+
+
+class SzStatsSampler:
+    """
+    Sample SzEngine.get_stats() every interval seconds from a background thread while started, keeping the most recent
+    samples. Other callers of get_stats() in the process reset the same counters, so the sampler should be its only
+    caller.
+
+    Args:
+        sz_engine (SzEngine): The engine to sample.
+        interval (float, optional): Seconds between samples. Defaults to 60.
+        capacity (int, optional): The number of samples to keep, older samples are discarded. Defaults to 1,440, a day
+            of samples at the default interval.
+
+    Raises:
+        SzSdkError: interval isn't greater than 0 or capacity is less than 1.
+    """
+
+    def __init__(
+        self,
+        sz_engine: SzEngine,
+        interval: float = DEFAULT_INTERVAL,
+        capacity: int = DEFAULT_CAPACITY,
+    ) -> None:
+        if interval <= 0:
+            raise SzSdkError(f"interval must be greater than 0, received {interval}")
+        if capacity < 1:
+            raise SzSdkError(f"capacity must be 1 or more, received {capacity}")
+
+        self._errors = 0
+        self._interval = interval
+        self._last_error: Optional[Exception] = None
+        self._last_sampled: Optional[float] = None
+        self._lock = threading.Lock()
+        self._samples: Deque[Dict[str, Any]] = deque(maxlen=capacity)
+        self._stop_event = threading.Event()
+        self._sz_engine = sz_engine
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> SzStatsSampler:
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    @property
+    def errors(self) -> int:
+        """Return the number of errors raised sampling in the background."""
+        with self._lock:
+            return self._errors
+
+    @property
+    def last_error(self) -> Optional[Exception]:
+        """Return the last error raised sampling in the background, or None."""
+        with self._lock:
+            return self._last_error
+
+    def rate(self, name: str, last: Optional[int] = None) -> float:
+        """
+        Return the rate per second of a counter over the most recent samples.
+
+        Args:
+            name (str): The counter, e.g. "addedRecords", "redoTriggers" or "libFeatCacheHit".
+            last (Optional[int], optional): The number of samples to include. Defaults to None, all samples kept.
+
+        Returns:
+            float: The counter's total over the samples divided by the seconds they cover, 0.0 if there are none.
+        """
+        return self._rate(self.samples(last), name)
+
+    def sample(self) -> Optional[Dict[str, Any]]:
+        """
+        Call get_stats() once and keep the sample. Called every interval once started, can also be called directly.
+        The first call only resets the engine's counters, as the time they were counted from isn't known.
+
+        Returns:
+            Optional[Dict[str, Any]]: The sample, None for the first call. For example {"time": 1760947200.0,
+            "interval_seconds": 60.0, "counters": {"addedRecords": 1200, ...}, "gauges": {"threadState.active": 4,
+            ...}}
+
+        Raises:
+            SzError: get_stats() failed.
+        """
+        # NOTE - Not holding the lock, get_stats() can take a while and reading the samples shouldn't wait for it
+        stats = self._sz_engine.get_stats()
+        with self._lock:
+            now = time.monotonic()
+            last_sampled, self._last_sampled = self._last_sampled, now
+            if last_sampled is None:
+                return None
+
+            result: Dict[str, Any] = {"time": time.time(), "interval_seconds": now - last_sampled}
+            result.update(_parse_stats(stats))
+            self._samples.append(result)
+            return result
+
+    def samples(self, last: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Return the samples kept, oldest first.
+
+        Args:
+            last (Optional[int], optional): Return only the most recent samples. Defaults to None, all samples.
+
+        Returns:
+            List[Dict[str, Any]]: The samples, as returned by sample().
+        """
+        with self._lock:
+            samples = list(self._samples)
+        if last is None:
+            return samples
+        return samples[-last:] if last > 0 else []
+
+    def start(self) -> None:
+        """
+        Start sampling every interval seconds, with a first sample straight away.
+
+        Raises:
+            SzSdkError: The sampler is already started.
+        """
+        with self._lock:
+            if self._thread is not None:
+                raise SzSdkError("the SzStatsSampler is already started, stop it first")
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name="SzStatsSampler", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling. Samples already kept are kept."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            self._stop_event.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def trend(self, name: str, last: int) -> Dict[str, float]:
+        """
+        Compare the rate of a counter over the most recent samples with its rate over the same number of samples
+        before them.
+
+        Args:
+            name (str): The counter, e.g. "addedRecords".
+            last (int): The number of samples in each window.
+
+        Returns:
+            Dict[str, float]: {"current": 150.0, "previous": 200.0, "change": -0.25}, the rates per second and the
+            relative change from previous to current. change is 0.0 if the previous rate is 0.
+
+        Raises:
+            SzSdkError: last is less than 1.
+        """
+        if last < 1:
+            raise SzSdkError(f"last must be 1 or more, received {last}")
+
+        samples = self.samples(2 * last)
+        current = self._rate(samples[-last:], name)
+        previous = self._rate(samples[:-last], name)
+        return {
+            "current": current,
+            "previous": previous,
+            "change": (current - previous) / previous if previous else 0.0,
+        }
+
+    # -------------------------------------------------------------------------
+    # Non-public SzStatsSampler methods
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _rate(samples: List[Dict[str, Any]], name: str) -> float:
+        seconds = sum(sample["interval_seconds"] for sample in samples)
+        if not seconds:
+            return 0.0
+        return sum(sample["counters"].get(name, 0) for sample in samples) / seconds
+
+    def _run(self) -> None:
+        self._sample_in_background()
+        while not self._stop_event.wait(self._interval):
+            self._sample_in_background()
+
+    def _sample_in_background(self) -> None:
+        # NOTE - Any exception is kept rather than ending the thread, e.g. a get_stats() response that isn't JSON
+        try:
+            self.sample()
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            with self._lock:
+                self._errors += 1
+                self._last_error = err
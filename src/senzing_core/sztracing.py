@@ -0,0 +1,315 @@
+"""
+``senzing_core.sztracing`` opens a span for calls to the methods of SzEngineCore, SzConfigManagerCore,
+SzDiagnosticCore and SzProductCore and delivers it to an exporter, a callable taking an SzSpan.
+
+A span carries the method name, its start time and duration, the data source and flags it was called with, the size
+of its response and the error it raised, if any, plus attributes set with attributes(), e.g. the id of the API request
+being served, to correlate slow requests with the engine calls behind them. Tracing is off until enable() is called and
+costs nothing while it's off. Spans can be sampled and limited to slow or failed calls.
+
+Example:
+
+.. code-block:: python
+
+    from senzing_core import SzAbstractFactoryCore, sztracing
+
+    exporter = sztracing.InMemorySpanExporter()
+    sztracing.enable(exporter, sample_rate=0.1, min_duration_ms=50)
+    sz_abstract_factory = SzAbstractFactoryCore(instance_name, settings)
+    sz_engine = sz_abstract_factory.create_engine()
+    with sztracing.attributes(request_id="3f9c1"):
+        result = sz_engine.get_entity_by_entity_id(1)
+    print(exporter.spans())
+"""
+
+from __future__ import annotations
+
+import random
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypedDict,
+)
+
+from senzing import SzSdkError
+
+from ._helpers import as_str
+from ._observers import add_call_observer, call_argument, remove_call_observer
+
+# Metadata
+
+__all__ = [
+    "InMemorySpanExporter",
+    "JsonlSpanExporter",
+    "SzSpan",
+    "SzSpanExporter",
+    "attributes",
+    "disable",
+    "enable",
+    "is_enabled",
+]
+__updated__ = "2025-10-20"
+
+DEFAULT_MAX_SPANS = 10_000
+
+# NOTE - Senzing error messages start with their code, e.g. "SENZ0033|Unknown record: ..."
+_ERROR_CODE_PATTERN = re.compile(r"SENZ(\d+)")
+
+_attributes: ContextVar[Dict[str, Any]] = ContextVar("sztracing_attributes", default={})
+
+
+# -----------------------------------------------------------------------------
+# SzSpan class
+# -----------------------------------------------------------------------------
+
+
+class SzSpan(TypedDict):
+    """
+    A call to an SDK method.
+
+    - name: Qualified method name, e.g. "SzEngineCore.add_record".
+    - start_time_ns: When the call started, in nanoseconds since the epoch.
+    - duration_ns: How long the call took, in nanoseconds.
+    - thread: Name of the thread that made the call.
+    - data_source_code: The data_source_code argument, if the method has one.
+    - flags: The flags argument, if the method has one.
+    - response_size: Length of the response in characters, if the method returned one.
+    - error_code: Senzing error code of the error raised, if it has one.
+    - error_type: Type name of the error raised, if any.
+    - attributes: Attributes set with sztracing.attributes() where the call was made.
+    """
+
+    name: str
+    start_time_ns: int
+    duration_ns: int
+    thread: str
+    data_source_code: Optional[str]
+    flags: Optional[int]
+    response_size: Optional[int]
+    error_code: Optional[int]
+    error_type: Optional[str]
+    attributes: Dict[str, Any]
+
+
+SzSpanExporter = Callable[[SzSpan], None]
+
+
+# -----------------------------------------------------------------------------
+# Exporters
+# -----------------------------------------------------------------------------
+
+
+class InMemorySpanExporter:
+    """
+    Keep the most recent spans in memory, e.g. for tests or to inspect from a debug endpoint.
+
+    Args:
+        max_spans (int, optional): The number of spans to keep, older spans are discarded. Defaults to 10,000.
+    """
+
+    def __init__(self, max_spans: int = DEFAULT_MAX_SPANS) -> None:
+        self._lock = threading.Lock()
+        self._spans: Deque[SzSpan] = deque(maxlen=max_spans)
+
+    def __call__(self, span: SzSpan) -> None:
+        with self._lock:
+            self._spans.append(span)
+
+    def clear(self) -> None:
+        """Discard the spans kept."""
+        with self._lock:
+            self._spans.clear()
+
+    def spans(self) -> List[SzSpan]:
+        """Return the spans kept, oldest first."""
+        with self._lock:
+            return list(self._spans)
+
+
+class JsonlSpanExporter:
+    """
+    Append spans to a file, one JSON document per line.
+
+    Args:
+        path (str): The file to append to, created if it doesn't exist.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._file: Optional[IO[str]] = open(path, "a", encoding="utf-8")  # pylint: disable=R1732
+        self._lock = threading.Lock()
+
+    def __call__(self, span: SzSpan) -> None:
+        line = as_str(span)  # type: ignore[arg-type]
+        with self._lock:
+            if self._file is not None:
+                self._file.write(line + "\n")
+                self._file.flush()
+
+    def __enter__(self) -> JsonlSpanExporter:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the file, later spans are discarded."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+# -----------------------------------------------------------------------------
+# Helpers
+# -----------------------------------------------------------------------------
+
+
+def _error_code(error: BaseException) -> Optional[int]:
+    match = _ERROR_CODE_PATTERN.match(str(error.args[0])) if error.args else None
+    return int(match.group(1)) if match else None
+
+
+# -----------------------------------------------------------------------------
+# Tracer
+# -----------------------------------------------------------------------------
+
+
+class _Tracer:  # pylint: disable=R0903
+    """Call observer building spans for sampled calls and passing them to the exporter"""
+
+    def __init__(
+        self,
+        exporter: SzSpanExporter,
+        sample_rate: float,
+        min_duration_ms: float,
+        always_export_errors: bool,
+    ) -> None:
+        self.always_export_errors = always_export_errors
+        self.exporter = exporter
+        self.min_duration_ns = int(min_duration_ms * 1_000_000)
+        self.sample_rate = sample_rate
+
+    def observe(
+        self,
+        func: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        elapsed_ns: int,
+        result: Any,
+        error: Optional[BaseException],
+    ) -> None:
+        """Call observer, export a span for the call if it's sampled."""
+        if error is None or not self.always_export_errors:
+            if elapsed_ns < self.min_duration_ns:
+                return
+            if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+                return
+
+        flags = call_argument(func, args, kwargs, "flags")
+        span: SzSpan = {
+            "name": func.__qualname__,
+            "start_time_ns": time.time_ns() - elapsed_ns,
+            "duration_ns": elapsed_ns,
+            "thread": threading.current_thread().name,
+            "data_source_code": call_argument(func, args, kwargs, "data_source_code"),
+            "flags": int(flags) if isinstance(flags, int) else None,
+            "response_size": len(result) if isinstance(result, str) else None,
+            "error_code": _error_code(error) if error is not None else None,
+            "error_type": type(error).__name__ if error is not None else None,
+            "attributes": _attributes.get(),
+        }
+
+        # NOTE - The call has completed, a failing exporter mustn't make it appear to have failed
+        try:
+            self.exporter(span)
+        except Exception:  # pylint: disable=broad-exception-caught
+            pass
+
+
+_tracer: Optional[_Tracer] = None  # pylint: disable=C0103
+_tracer_lock = threading.Lock()
+
+
+# -----------------------------------------------------------------------------
+# Functions
+# -----------------------------------------------------------------------------
+
+
+@contextmanager
+def attributes(**span_attributes: Any) -> Iterator[None]:
+    """
+    Add attributes to the spans of calls made in the with block, including calls from other coroutines or threads
+    started with a copy of the context. Nested blocks add to, and can override, the attributes of outer blocks.
+
+    Example:
+
+    .. code-block:: python
+
+        with sztracing.attributes(request_id=request.id, route="/entities"):
+            handle(request)
+    """
+    token = _attributes.set({**_attributes.get(), **span_attributes})
+    try:
+        yield
+    finally:
+        _attributes.reset(token)
+
+
+def disable() -> None:
+    """Stop tracing."""
+    global _tracer  # pylint: disable=global-statement
+    with _tracer_lock:
+        if _tracer is not None:
+            remove_call_observer(_tracer.observe)
+            _tracer = None
+
+
+def enable(
+    exporter: SzSpanExporter,
+    sample_rate: float = 1.0,
+    min_duration_ms: float = 0.0,
+    always_export_errors: bool = True,
+) -> None:
+    """
+    Start tracing, replacing any exporter and sampling already enabled.
+
+    Args:
+        exporter (SzSpanExporter): Called with the span of each sampled call, on the thread that made the call.
+        sample_rate (float, optional): Fraction of calls, 0 to 1, to export spans for. Defaults to 1.0, every call.
+        min_duration_ms (float, optional): Only export spans for calls taking at least this long. Defaults to 0.0.
+        always_export_errors (bool, optional): Export spans for calls raising an error regardless of sample_rate and
+            min_duration_ms. Defaults to True.
+
+    Raises:
+        SzSdkError: sample_rate isn't between 0 and 1 or min_duration_ms is negative.
+    """
+    global _tracer  # pylint: disable=global-statement
+    if not 0.0 <= sample_rate <= 1.0:
+        raise SzSdkError(f"sample_rate must be between 0 and 1, received {sample_rate}")
+    if min_duration_ms < 0:
+        raise SzSdkError(f"min_duration_ms must be 0 or more, received {min_duration_ms}")
+
+    tracer = _Tracer(exporter, sample_rate, min_duration_ms, always_export_errors)
+    with _tracer_lock:
+        if _tracer is not None:
+            remove_call_observer(_tracer.observe)
+        add_call_observer(tracer.observe)
+        _tracer = tracer
+
+
+def is_enabled() -> bool:
+    """Return True if tracing is enabled."""
+    return _tracer is not None
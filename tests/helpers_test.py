@@ -1,4 +1,15 @@
 import json
+from array import array
+from ctypes import (
+    CDLL,
+    POINTER,
+    Structure,
+    c_char,
+    c_longlong,
+    cast,
+    create_string_buffer,
+)
+from typing import Any, List
 
 import pytest
 from pytest_schema import schema
@@ -11,10 +22,13 @@ from senzing_core._helpers import (
     build_dsrc_code_json,
     build_entities_json,
     build_records_json,
+    catch_sdk_exceptions,
     escape_json_str,
+    get_sz_library,
     is_senzing_binary_version_supported,
     load_sz_library,
     normalize_semantic_version,
+    response_as_str,
 )
 
 # -----------------------------------------------------------------------------
@@ -89,6 +103,12 @@ def test_build_data_sources_json_bad_element_type() -> None:
         build_data_sources_json(["TEST", 1, 2])  # type: ignore[list-item]
 
 
+def test_build_data_sources_json_generator() -> None:
+    """Test build_data_sources_json() with a generator."""
+    actual = build_data_sources_json(data_source for data_source in ("TESTONE", "TESTTWO"))
+    assert json.loads(actual) == {"DATA_SOURCES": ["TESTONE", "TESTTWO"]}
+
+
 def test_build_entities_json() -> None:
     """Test build_entities_json()."""
     actual = build_entities_json([1, 100002])
@@ -104,6 +124,36 @@ def test_build_entities_json_empty_list() -> None:
     assert len(actual) == 0
 
 
+def test_build_entities_json_generator() -> None:
+    """Test build_entities_json() with a generator and a tuple."""
+    expected = {"ENTITIES": [{"ENTITY_ID": 1}, {"ENTITY_ID": 100002}]}
+    assert json.loads(build_entities_json(entity_id for entity_id in [1, 100002])) == expected
+    assert json.loads(build_entities_json((1, 100002))) == expected
+    assert build_entities_json(iter([])) == ""
+
+
+def test_build_entities_json_integer_buffers() -> None:
+    """Test build_entities_json() with array, memoryview and index-able integer types."""
+    expected = {"ENTITIES": [{"ENTITY_ID": 1}, {"ENTITY_ID": 100002}]}
+    for entity_ids in (array("q", [1, 100002]), array("L", [1, 100002]), memoryview(array("i", [1, 100002]))):
+        assert json.loads(build_entities_json(entity_ids)) == expected  # type: ignore[arg-type]
+    assert build_entities_json(array("q")) == ""
+
+
+def test_build_entities_json_numpy() -> None:
+    """Test build_entities_json() with a NumPy array and NumPy integers."""
+    numpy = pytest.importorskip("numpy")
+    expected = {"ENTITIES": [{"ENTITY_ID": 1}, {"ENTITY_ID": 100002}]}
+    assert json.loads(build_entities_json(numpy.array([1, 100002], dtype=numpy.int64))) == expected
+    assert json.loads(build_entities_json(list(numpy.array([1, 100002], dtype=numpy.int32)))) == expected
+
+
+def test_build_entities_json_bad_buffer_type() -> None:
+    """Test build_entities_json() with a buffer of floats."""
+    with pytest.raises(TypeError):
+        build_entities_json(array("d", [1.0, 2.0]))  # type: ignore[arg-type]
+
+
 def test_build_entities_json_bad_type() -> None:
     """Test build_entities_json()."""
     with pytest.raises(TypeError):
@@ -131,6 +181,18 @@ def test_build_records_json_empty_list() -> None:
     assert len(actual) == 0
 
 
+def test_build_records_json_generator() -> None:
+    """Test build_records_json() with a generator, skipping empty record keys."""
+    record_keys = [("CUSTOMERS", "1001"), (), ("WATCHLIST", "1007")]
+    actual = build_records_json(record_key for record_key in record_keys)  # type: ignore[misc]
+    assert json.loads(actual) == {
+        "RECORDS": [
+            {"DATA_SOURCE": "CUSTOMERS", "RECORD_ID": "1001"},
+            {"DATA_SOURCE": "WATCHLIST", "RECORD_ID": "1007"},
+        ]
+    }
+
+
 def test_build_records_json_bad_type() -> None:
     """Test build_records_json()."""
     with pytest.raises(TypeError):
@@ -205,6 +267,43 @@ def test_escape_json_str_bad_type() -> None:
         escape_json_str(1234)  # type: ignore[arg-type]
 
 
+def test_catch_sdk_exceptions() -> None:
+    """Test catch_sdk_exceptions() appends the method signature and doesn't change the method annotations."""
+
+    @catch_sdk_exceptions
+    def add(value_1: int, value_2: int) -> int:
+        return value_1 + value_2
+
+    for _ in range(2):
+        with pytest.raises(SzSdkError) as err:
+            add(1, "2")  # type: ignore[arg-type]
+        assert str(err.value).endswith(f" - expected: {__name__}.add(value_1: int, value_2: int)")
+    assert add.__annotations__ == {"value_1": int, "value_2": int, "return": int}
+
+
+def test_catch_sdk_exceptions_no_args() -> None:
+    """Test catch_sdk_exceptions() with an exception raised without arguments."""
+
+    @catch_sdk_exceptions
+    def raise_value_error() -> None:
+        raise ValueError()
+
+    with pytest.raises(SzSdkError, match=f"calling {__name__}.raise_value_error"):
+        raise_value_error()
+
+
+def test_get_sz_library() -> None:
+    """Test get_sz_library() returns one handle and declares function signatures once."""
+    declared: List[CDLL] = []
+
+    def declare_function_signatures(library_handle: CDLL) -> None:
+        declared.append(library_handle)
+
+    actual = get_sz_library(declare_function_signatures)
+    assert get_sz_library(declare_function_signatures) is actual
+    assert declared == [actual]
+
+
 def test_load_sz_library_missing_lib() -> None:
     """Test load_sz_library()."""
     lib_file = "non_exist_file"
@@ -252,6 +351,50 @@ def test_is_senzing_binary_version_supported_exceptions() -> None:
             is_senzing_binary_version_supported(test)
 
 
+def test_response_as_str() -> None:
+    """Test response_as_str() returns the response and frees it."""
+    freed: List[Any] = []
+    response = create_string_buffer(b'{"ENTITY_ID": 1}')
+    result = ResponseReturnCodeResult(cast(response, POINTER(c_char)), 0)
+    actual = response_as_str(freed.append, lambda _: None, result)
+    assert actual == '{"ENTITY_ID": 1}'
+    assert len(freed) == 1
+
+
+def test_response_as_str_null_response() -> None:
+    """Test response_as_str() with a NULL response."""
+    result = ResponseReturnCodeResult(None, 0)
+    actual = response_as_str(lambda _: None, lambda _: None, result)
+    assert actual == ""
+
+
+def test_response_as_str_error() -> None:
+    """Test response_as_str() frees the response when the return code is an error."""
+    freed: List[Any] = []
+
+    def check_result(return_code: int) -> None:
+        raise SzError(f"return code {return_code}")
+
+    result = ResponseReturnCodeResult(cast(create_string_buffer(b"error"), POINTER(c_char)), -1)
+    with pytest.raises(SzError):
+        response_as_str(freed.append, check_result, result)
+    assert len(freed) == 1
+
+
+# -----------------------------------------------------------------------------
+# Utilities
+# -----------------------------------------------------------------------------
+
+
+class ResponseReturnCodeResult(Structure):  # pylint: disable=R0903
+    """Response, return_code structure as returned by the Senzing library helper functions"""
+
+    _fields_ = [
+        ("response", POINTER(c_char)),
+        ("return_code", c_longlong),
+    ]
+
+
 # -----------------------------------------------------------------------------
 # _helpers schemas
 # -----------------------------------------------------------------------------
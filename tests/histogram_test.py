@@ -0,0 +1,68 @@
+#! /usr/bin/env python3
+
+"""
+histogram_test.py
+"""
+
+from senzing_core._histogram import (
+    LatencyHistogram,
+    bucket_index,
+    bucket_upper_bound,
+)
+
+# -----------------------------------------------------------------------------
+# Test cases
+# -----------------------------------------------------------------------------
+
+
+def test_bucket_bounds() -> None:
+    """Test values are counted in a bucket whose upper bound is within ~3% of the value."""
+    for value in [0, 1, 63, 64, 65, 127, 128, 1_000, 123_456, 10**9, 10**12]:
+        upper_bound = bucket_upper_bound(bucket_index(value))
+        assert value <= upper_bound <= value * 1.04 + 1
+
+
+def test_bucket_index_increases() -> None:
+    """Test larger values never map to a lower bucket."""
+    indexes = [bucket_index(value) for value in range(0, 100_000, 7)]
+    assert indexes == sorted(indexes)
+
+
+def test_percentile() -> None:
+    """Test LatencyHistogram.percentile()."""
+    histogram = LatencyHistogram()
+    for value in range(1, 1001):
+        histogram.record(value * 1_000)
+    assert abs(histogram.percentile(50) - 500_000) <= 500_000 * 0.04
+    assert abs(histogram.percentile(99) - 990_000) <= 990_000 * 0.04
+    assert histogram.percentile(100) == 1_000_000
+
+
+def test_percentile_empty() -> None:
+    """Test LatencyHistogram.percentile() with no values recorded."""
+    assert LatencyHistogram().percentile(99) == 0
+
+
+def test_merge() -> None:
+    """Test LatencyHistogram.merge()."""
+    histogram_1 = LatencyHistogram()
+    histogram_2 = LatencyHistogram()
+    histogram_1.record(10)
+    histogram_2.record(1_000_000)
+    histogram_2.record(5)
+    histogram_1.merge(histogram_2)
+    assert histogram_1.count == 3
+    assert histogram_1.min == 5
+    assert histogram_1.max == 1_000_000
+    assert histogram_1.total == 1_000_015
+
+
+def test_summary() -> None:
+    """Test LatencyHistogram.summary()."""
+    histogram = LatencyHistogram()
+    histogram.record(2_000_000)
+    actual = histogram.summary()
+    assert actual["count"] == 1
+    assert actual["max_ms"] == 2.0
+    assert actual["mean_ms"] == 2.0
+    assert actual["p50_ms"] == 2.0
@@ -12,6 +12,7 @@ from senzing import (
     SzConfigManager,
     SzDiagnostic,
     SzEngine,
+    SzError,
     SzProduct,
     SzSdkError,
 )
@@ -54,6 +55,13 @@ def test_create_configmanager(sz_abstractfactory: SzAbstractFactory) -> None:
     assert isinstance(actual, SzConfigManager)
 
 
+def test_create_configmanager_config_cache(sz_abstractfactory: SzAbstractFactoryCore) -> None:
+    """Test SzAbstractFactoryCore.create_configmanager() with a config cache."""
+    actual = sz_abstractfactory.create_configmanager(config_cache_max_bytes=1_000_000)
+    assert isinstance(actual, SzConfigManagerCore)
+    assert actual.config_cache_stats()["max_bytes"] == 1_000_000
+
+
 def test_create_diagnostic(sz_abstractfactory: SzAbstractFactory) -> None:
     """Test SzAbstractFactory.create_diagnostic()."""
     actual = sz_abstractfactory.create_diagnostic()
@@ -66,6 +74,37 @@ def test_create_engine(sz_abstractfactory: SzAbstractFactory) -> None:
     assert isinstance(actual, SzEngine)
 
 
+def test_create_engine_warm_up(sz_abstractfactory: SzAbstractFactoryCore) -> None:
+    """Test SzAbstractFactory.create_engine() with a background warm-up."""
+    assert sz_abstractfactory.warm_up_future is None
+    actual = sz_abstractfactory.create_engine(
+        warm_up=True,
+        warm_up_searches=['{"NAME_FULL": "BOB SMITH"}', {"EMAIL_ADDRESS": "bsmith@work.com"}],
+    )
+    assert isinstance(actual, SzEngine)
+    warm_up_future = sz_abstractfactory.warm_up_future
+    assert warm_up_future is not None
+    assert warm_up_future.result(timeout=300) is None
+    assert warm_up_future.done()
+
+
+def test_create_engine_warm_up_once(sz_abstractfactory: SzAbstractFactoryCore) -> None:
+    """Test SzAbstractFactory.create_engine() only warms up once per factory."""
+    sz_abstractfactory.create_engine(warm_up=True)
+    warm_up_future = sz_abstractfactory.warm_up_future
+    sz_abstractfactory.create_engine(warm_up=True)
+    assert sz_abstractfactory.warm_up_future is warm_up_future
+
+
+def test_create_engine_warm_up_bad_search(sz_abstractfactory: SzAbstractFactoryCore) -> None:
+    """Test SzAbstractFactory.create_engine() with a bad warm-up search reports the error through the future."""
+    sz_abstractfactory.create_engine(warm_up=True, warm_up_searches=["{bad json"])
+    warm_up_future = sz_abstractfactory.warm_up_future
+    assert warm_up_future is not None
+    with pytest.raises(SzError):
+        warm_up_future.result(timeout=300)
+
+
 def test_create_product(sz_abstractfactory: SzAbstractFactory) -> None:
     """Test SzAbstractFactory.create_product()."""
     actual = sz_abstractfactory.create_product()
@@ -2,13 +2,13 @@
 
 
 import json
-from typing import Any, Dict
+from typing import Any, Dict, Union
 
 import pytest
 from pytest_schema import Optional, Or, schema
 from senzing import SzConfig, SzError, SzSdkError
 
-from senzing_core import SzConfigCore
+from senzing_core import SzConfigCore, szconfig
 
 # -----------------------------------------------------------------------------
 # Test cases
@@ -133,6 +133,155 @@ def test_destroy(engine_vars: Dict[Any, Any]) -> None:
     actual._destroy()  # pylint: disable=W0212
 
 
+def test_import_template_cached(sz_config: SzConfigCore, engine_vars: Dict[Any, Any]) -> None:
+    """Test SzConfigCore.import_template() caches the default template by RESOURCEPATH."""
+    resource_path = engine_vars["SETTINGS_DICT"]["PIPELINE"]["RESOURCEPATH"]
+    template = sz_config.export()
+    assert SzConfigCore._template_cache[resource_path] == template  # pylint: disable=W0212
+    sz_config.register_data_source("NOT_IN_TEMPLATE")
+    sz_config.import_template()
+    assert sz_config.export() == template
+    SzConfigCore.clear_template_cache()
+    assert not SzConfigCore._template_cache  # pylint: disable=W0212
+    sz_config.import_template()
+    assert json.loads(sz_config.export()) == json.loads(template)
+
+
+@pytest.mark.parametrize(
+    "settings, expected",
+    [
+        ('{"PIPELINE": {"RESOURCEPATH": "/opt/senzing/er/resources"}}', "/opt/senzing/er/resources"),
+        ({"PIPELINE": {"RESOURCEPATH": "/opt/senzing/er/resources"}}, "/opt/senzing/er/resources"),
+        ('{"PIPELINE": {}}', None),
+        ('{"PIPELINE": {"RESOURCEPATH": 1}}', None),
+        ("[]", None),
+        ("not JSON", None),
+    ],
+)
+def test_resource_path(settings: Union[str, Dict[Any, Any]], expected: Union[str, None]) -> None:
+    """Test the RESOURCEPATH used to key the template cache."""
+    assert szconfig._resource_path(settings) == expected  # pylint: disable=W0212
+
+
+def test_register_data_sources(sz_config: SzConfigCore) -> None:
+    """Test SzConfigCore.register_data_sources()."""
+    actual = sz_config.register_data_sources(["BULK_1", "TEST", "BULK_2", "BULK_1"])
+    assert list(actual) == ["BULK_1", "TEST", "BULK_2"]
+    for response in actual.values():
+        assert schema(register_data_source_schema) == json.loads(response)
+    data_source_ids = {
+        data_source["DSRC_CODE"]: data_source["DSRC_ID"]
+        for data_source in json.loads(sz_config.get_data_source_registry())["DATA_SOURCES"]
+    }
+    for data_source_code, response in actual.items():
+        assert json.loads(response)["DSRC_ID"] == data_source_ids[data_source_code]
+
+
+def test_register_data_sources_bad_data_source_code(sz_config: SzConfigCore) -> None:
+    """Test SzConfigCore.register_data_sources() keeps none of the changes if a registration fails."""
+    config_definition = sz_config.export()
+    with pytest.raises(SzError):
+        sz_config.register_data_sources(["BULK_1", ""])
+    with pytest.raises(SzSdkError):
+        sz_config.register_data_sources(["BULK_1", 0])  # type: ignore[list-item]
+    assert sz_config.export() == config_definition
+
+
+@pytest.mark.parametrize("bad_data_source_codes", ["CUSTOMERS", b"CUSTOMERS"])
+def test_bulk_data_sources_bad_data_source_codes_type(sz_config: SzConfigCore, bad_data_source_codes: Any) -> None:
+    """Test register_data_sources() and unregister_data_sources() reject a single code rather than iterating it."""
+    config_definition = sz_config.export()
+    with pytest.raises(SzSdkError):
+        sz_config.register_data_sources(bad_data_source_codes)
+    with pytest.raises(SzSdkError):
+        sz_config.unregister_data_sources(bad_data_source_codes)
+    assert sz_config.export() == config_definition
+
+
+def test_unregister_data_sources(sz_config: SzConfigCore) -> None:
+    """Test SzConfigCore.unregister_data_sources()."""
+    sz_config.register_data_sources(["BULK_1", "BULK_2"])
+    actual = sz_config.unregister_data_sources(("BULK_1", "NOT_REGISTERED", "BULK_2", "BULK_1"))
+    assert actual == {"BULK_1": True, "NOT_REGISTERED": False, "BULK_2": True}
+    data_source_codes = [
+        data_source["DSRC_CODE"] for data_source in json.loads(sz_config.get_data_source_registry())["DATA_SOURCES"]
+    ]
+    assert "BULK_1" not in data_source_codes
+    assert "BULK_2" not in data_source_codes
+
+
+def test_verify_config_definition(sz_config: SzConfigCore) -> None:
+    """Test SzConfigCore.verify_config_definition()."""
+    sz_config.verify_config_definition(sz_config.export())
+    with pytest.raises(SzError):
+        sz_config.verify_config_definition("}{")
+    with pytest.raises(SzSdkError):
+        sz_config.verify_config_definition(0)  # type: ignore[arg-type]
+
+
+def test_verified_config_cache(sz_config: SzConfigCore) -> None:
+    """Test SzConfigCore.enable_verified_config_cache() caches only configurations that pass verification."""
+    config_definition = sz_config.export()
+    SzConfigCore.enable_verified_config_cache(2)
+    try:
+        sz_config.verify_config_definition(config_definition)
+        sz_config.verify_config_definition(config_definition)
+        with pytest.raises(SzError):
+            sz_config.verify_config_definition("}{")
+        with pytest.raises(SzError):
+            sz_config.verify_config_definition("}{")
+        assert len(SzConfigCore._verified_config_hashes) == 1  # pylint: disable=W0212
+        sz_config.register_data_source("VERIFIED_1")
+        sz_config.verify_config_definition(sz_config.export())
+        sz_config.register_data_source("VERIFIED_2")
+        sz_config.verify_config_definition(sz_config.export())
+        assert len(SzConfigCore._verified_config_hashes) == 2  # pylint: disable=W0212
+    finally:
+        SzConfigCore.disable_verified_config_cache()
+    assert not SzConfigCore._verified_config_hashes  # pylint: disable=W0212
+    with pytest.raises(SzSdkError):
+        SzConfigCore.enable_verified_config_cache(0)
+
+
+def test_session(sz_config: SzConfigCore) -> None:
+    """Test SzConfigCore.session() exports the changes once, when the session ends."""
+    config_definition = sz_config.export()
+    with sz_config.session():
+        sz_config.register_data_source("SESSION_1")
+        sz_config.register_data_source("SESSION_2")
+        sz_config.unregister_data_source("SESSION_1")
+        assert sz_config.config_definition == config_definition
+        assert "SESSION_2" in sz_config.export()
+    data_source_codes = [
+        data_source["DSRC_CODE"] for data_source in json.loads(sz_config.get_data_source_registry())["DATA_SOURCES"]
+    ]
+    assert "SESSION_1" not in data_source_codes
+    assert "SESSION_2" in data_source_codes
+
+
+def test_session_exception(sz_config: SzConfigCore) -> None:
+    """Test SzConfigCore.session() discards the changes if an exception is raised."""
+    config_definition = sz_config.export()
+    with pytest.raises(SzError):
+        with sz_config.session():
+            sz_config.register_data_source("SESSION_1")
+            sz_config.register_data_source("")
+    assert sz_config.export() == config_definition
+    assert sz_config._session_handle is None  # pylint: disable=W0212
+
+
+def test_session_nested(sz_config: SzConfigCore) -> None:
+    """Test SzConfigCore.session() can't be nested or import a configuration."""
+    with sz_config.session():
+        with pytest.raises(SzSdkError):
+            with sz_config.session():
+                pass
+        with pytest.raises(SzSdkError):
+            sz_config.import_template()
+        with pytest.raises(SzSdkError):
+            sz_config.import_config_definition("{}")
+
+
 def test_exception(sz_config: SzConfigCore) -> None:
     """Test exceptions."""
     with pytest.raises(Exception):
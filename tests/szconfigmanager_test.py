@@ -15,7 +15,7 @@ from senzing import (
     SzSdkError,
 )
 
-from senzing_core import SzConfigManagerCore
+from senzing_core import SzConfigManagerCore, szconfigmanager
 
 # -----------------------------------------------------------------------------
 # Test cases
@@ -279,6 +279,59 @@ def test_destroy(engine_vars: Dict[Any, Any]) -> None:
     actual._destroy()  # pylint: disable=W0212
 
 
+def test_config_cache(sz_configmanager: SzConfigManagerCore) -> None:
+    """Test SzConfigManagerCore.enable_config_cache() serves repeated config IDs from the cache."""
+    assert not sz_configmanager.config_cache_stats()
+    config_id = sz_configmanager.get_default_config_id()
+    sz_configmanager.enable_config_cache(100_000_000)
+    first = sz_configmanager.create_config_from_config_id(config_id).export()
+    second = sz_configmanager.create_config_from_config_id(config_id).export()
+    assert first == second
+    stats = sz_configmanager.config_cache_stats()
+    assert stats["entries"] == 1
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    sz_configmanager.disable_config_cache()
+    assert not sz_configmanager.config_cache_stats()
+
+
+def test_config_definition_cache_eviction() -> None:
+    """Test the least recently used configurations are evicted to stay within max_bytes."""
+    config_cache = szconfigmanager._ConfigDefinitionCache(10)  # pylint: disable=W0212
+    config_cache.put(1, "aaaa")
+    config_cache.put(2, "bbbb")
+    assert config_cache.get(1) == "aaaa"
+    config_cache.put(3, "cccc")
+    assert config_cache.get(2) is None
+    assert config_cache.get(1) == "aaaa"
+    assert config_cache.get(3) == "cccc"
+    config_cache.put(4, "d" * 11)
+    assert config_cache.get(4) is None
+    assert config_cache.stats() == {
+        "bytes": 8,
+        "entries": 2,
+        "evictions": 1,
+        "hits": 3,
+        "max_bytes": 10,
+        "misses": 2,
+    }
+
+
+def test_config_definition_cache_utf8_size() -> None:
+    """Test configurations are sized in UTF-8 bytes."""
+    config_cache = szconfigmanager._ConfigDefinitionCache(4)  # pylint: disable=W0212
+    config_cache.put(1, "ééé")
+    assert config_cache.get(1) is None
+    config_cache.put(2, "éé")
+    assert config_cache.get(2) == "éé"
+
+
+def test_config_definition_cache_bad_max_bytes() -> None:
+    """Test the cache needs a positive max_bytes."""
+    with pytest.raises(SzSdkError):
+        szconfigmanager._ConfigDefinitionCache(0)  # pylint: disable=W0212
+
+
 def test_exception(sz_configmanager: SzConfigManagerCore) -> None:
     """Test exceptions."""
     with pytest.raises(Exception):
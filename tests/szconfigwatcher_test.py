@@ -0,0 +1,299 @@
+#! /usr/bin/env python3
+
+"""
+szconfigwatcher_test.py
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+import pytest
+from senzing import SzAbstractFactory, SzConfigurationError, SzSdkError
+
+from senzing_core import (
+    SzAbstractFactoryCore,
+    SzConfigWatcher,
+    SzEngineCore,
+    _observers,
+)
+from senzing_core._helpers import ReaderWriterGate, gated_sdk_method
+
+# -----------------------------------------------------------------------------
+# Test cases
+# -----------------------------------------------------------------------------
+
+
+def test_check(sz_abstractfactory: SzAbstractFactory) -> None:
+    """Test SzConfigWatcher.check() with the active configuration as the default."""
+    sz_config_watcher = SzConfigWatcher(sz_abstractfactory)
+    assert not sz_config_watcher.check()
+    assert sz_config_watcher.stats()["checks"] == 1
+
+
+def test_check_reinitializes() -> None:
+    """Test SzConfigWatcher.check() reinitializes with the new default configuration."""
+    stand_in_factory = StandInFactory()
+    sz_config_watcher = SzConfigWatcher(stand_in_factory)  # type: ignore[arg-type]
+    assert not sz_config_watcher.check()
+    stand_in_factory.default_config_id = 2
+    assert sz_config_watcher.check()
+    assert stand_in_factory.reinitialized == [2]
+    assert not sz_config_watcher.check()
+    stats = sz_config_watcher.stats()
+    assert stats["checks"] == 3
+    assert stats["reinitializations"] == 1
+    assert stats["pause"]["count"] == 1
+
+
+def test_check_drains_in_flight_calls() -> None:
+    """Test reinitializing waits for SzEngineCore calls in progress and holds back new ones until done."""
+    stand_in_factory = StandInFactory()
+    gated_engine = GatedEngine()
+    with SzConfigWatcher(stand_in_factory, poll_interval=60) as sz_config_watcher:  # type: ignore[arg-type]
+        in_flight = threading.Thread(target=gated_engine.call, args=("in_flight",))
+        in_flight.start()
+        assert gated_engine.started.wait(5)
+
+        stand_in_factory.default_config_id = 2
+        check = threading.Thread(target=sz_config_watcher.check)
+        check.start()
+        time.sleep(0.1)
+        assert not stand_in_factory.reinitialized
+
+        held_back = threading.Thread(target=gated_engine.call, args=("held_back",), kwargs={"block": False})
+        held_back.start()
+        time.sleep(0.1)
+        gated_engine.released.set()
+        for thread in (in_flight, check, held_back):
+            thread.join(5)
+
+    assert stand_in_factory.events == ["in_flight", "reinitialize", "held_back"]
+    assert SzEngineCore._call_gate is None  # pylint: disable=W0212
+
+
+def test_check_reinitializes_engine() -> None:
+    """Test SzConfigWatcher.check() reinitializes through SzEngineCore under the gate's writer without deadlocking."""
+    stand_in_factory = EngineFactory()
+    with SzConfigWatcher(stand_in_factory, poll_interval=60) as sz_config_watcher:  # type: ignore[arg-type]
+        stand_in_factory.default_config_id = 2
+        check = threading.Thread(target=sz_config_watcher.check, daemon=True)
+        check.start()
+        check.join(5)
+        assert not check.is_alive()
+    assert stand_in_factory.library.reinitialized == [2]
+    assert sz_config_watcher.stats()["reinitializations"] == 1
+
+
+@pytest.mark.parametrize(
+    "method_name", ["count_redo_records", "get_active_config_id", "get_redo_record", "get_stats", "prime_engine"]
+)
+def test_engine_methods_gated(method_name: str) -> None:
+    """Test SzEngineCore methods are held back while reinitializing."""
+    sz_engine = StandInEngine()
+    gate = ReaderWriterGate()
+    SzEngineCore._call_gate = gate  # pylint: disable=W0212
+    try:
+        with gate.writer():
+            call = threading.Thread(target=getattr(sz_engine, method_name), daemon=True)
+            call.start()
+            time.sleep(0.05)
+            assert call.is_alive()
+        call.join(5)
+        assert not call.is_alive()
+    finally:
+        SzEngineCore._call_gate = None  # pylint: disable=W0212
+
+
+def test_start_twice() -> None:
+    """Test only one SzConfigWatcher can be started at a time."""
+    with SzConfigWatcher(StandInFactory(), poll_interval=60):  # type: ignore[arg-type]
+        with pytest.raises(SzSdkError):
+            SzConfigWatcher(StandInFactory(), poll_interval=60).start()  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    "error", [SzConfigurationError("no default configuration"), RuntimeError("unexpected")], ids=["sz", "other"]
+)
+def test_background_errors(error: Exception) -> None:
+    """Test errors checking in the background are counted and kept and polling continues."""
+    stand_in_factory = StandInFactory()
+    stand_in_factory.error = error
+    with SzConfigWatcher(stand_in_factory, poll_interval=0.01) as sz_config_watcher:  # type: ignore[arg-type]
+        deadline = time.monotonic() + 5
+        while sz_config_watcher.stats()["errors"] < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert sz_config_watcher.stats()["errors"] >= 2
+        assert sz_config_watcher.last_error is error
+
+        stand_in_factory.error = None
+        stand_in_factory.default_config_id = 2
+        while not stand_in_factory.reinitialized and time.monotonic() < deadline:
+            time.sleep(0.01)
+    assert stand_in_factory.reinitialized == [2]
+
+
+def test_observers_called_after_reader_released() -> None:
+    """Test call observers of gated methods are notified once the reader is released."""
+    gated_engine = GatedEngine()
+    gate = ReaderWriterGate()
+    readers: List[int] = []
+
+    def observer(*args: Any) -> None:
+        _ = args
+        readers.append(gate._readers)  # pylint: disable=W0212
+
+    SzEngineCore._call_gate = gate  # pylint: disable=W0212
+    _observers.add_call_observer(observer)
+    try:
+        gated_engine.call("observed", block=False)
+    finally:
+        _observers.remove_call_observer(observer)
+        SzEngineCore._call_gate = None  # pylint: disable=W0212
+    assert readers == [0]
+    assert GatedEngine.events[-1] == "observed"
+
+
+def test_bad_poll_interval() -> None:
+    """Test SzConfigWatcher() with a poll_interval that isn't greater than 0."""
+    with pytest.raises(SzSdkError):
+        SzConfigWatcher(StandInFactory(), poll_interval=0)  # type: ignore[arg-type]
+
+
+# -----------------------------------------------------------------------------
+# Utilities
+# -----------------------------------------------------------------------------
+
+
+class StandInFactory:
+    """An SzAbstractFactory stand-in, its SzConfigManager and SzEngine report the config IDs it holds."""
+
+    def __init__(self) -> None:
+        self.active_config_id = 1
+        self.default_config_id = 1
+        self.error: Optional[Exception] = None
+        self.events: List[str] = []
+        self.reinitialized: List[int] = []
+        GatedEngine.events = self.events
+
+    def create_configmanager(self) -> Any:
+        """Return self, standing in for an SzConfigManager."""
+        return self
+
+    def create_engine(self) -> Any:
+        """Return self, standing in for an SzEngine."""
+        return self
+
+    def get_active_config_id(self) -> int:
+        """Stand-in SzEngine.get_active_config_id()."""
+        return self.active_config_id
+
+    def get_default_config_id(self) -> int:
+        """Stand-in SzConfigManager.get_default_config_id()."""
+        if self.error is not None:
+            raise self.error
+        return self.default_config_id
+
+    def reinitialize(self, config_id: int) -> None:
+        """Stand-in SzAbstractFactory.reinitialize()."""
+        self.events.append("reinitialize")
+        self.reinitialized.append(config_id)
+        self.active_config_id = config_id
+
+
+class StandInLibrary:
+    """A Senzing library stand-in for the SzEngineCore functions used by reinitializing and gated methods."""
+
+    def __init__(self) -> None:
+        self.active_config_id = 1
+        self.reinitialized: List[int] = []
+
+    def Sz_countRedoRecords(self) -> int:  # pylint: disable=C0103
+        """Stand-in Sz_countRedoRecords()."""
+        return 0
+
+    def Sz_getActiveConfigID_helper(self) -> Any:  # pylint: disable=C0103
+        """Stand-in Sz_getActiveConfigID_helper()."""
+        return SimpleNamespace(return_code=0, response=self.active_config_id)
+
+    def Sz_getRedoRecord_helper(self) -> Any:  # pylint: disable=C0103
+        """Stand-in Sz_getRedoRecord_helper()."""
+        return SimpleNamespace(return_code=0, response=None)
+
+    def Sz_primeEngine(self) -> int:  # pylint: disable=C0103
+        """Stand-in Sz_primeEngine()."""
+        return 0
+
+    def Sz_reinit(self, config_id: int) -> int:  # pylint: disable=C0103
+        """Stand-in Sz_reinit()."""
+        self.reinitialized.append(config_id)
+        self.active_config_id = config_id
+        return 0
+
+    def Sz_stats_helper(self) -> Any:  # pylint: disable=C0103
+        """Stand-in Sz_stats_helper()."""
+        return SimpleNamespace(return_code=0, response=None)
+
+
+class StandInEngine(SzEngineCore):
+    """An SzEngineCore using StandInLibrary, doesn't load the Senzing library."""
+
+    def __init__(self, library: Optional[StandInLibrary] = None, **kwargs: Any) -> None:  # pylint: disable=W0231
+        _ = kwargs
+        self._is_destroyed = False
+        self._library_handle = library or StandInLibrary()  # type: ignore[assignment]
+        self._check_result = lambda return_code: None  # type: ignore[assignment]
+        self._response_as_str = lambda result: ""  # type: ignore[assignment]
+
+
+class EngineFactory(StandInFactory):
+    """A StandInFactory reinitializing a StandInEngine as SzAbstractFactoryCore.reinitialize() does."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.library = StandInLibrary()
+
+    def create_engine(self) -> Any:
+        """Return a StandInEngine."""
+        return StandInEngine(self.library)
+
+    def reinitialize(self, config_id: int) -> None:
+        """SzAbstractFactoryCore.reinitialize() for the SzEngineCore."""
+        sz_engine = StandInEngine(self.library)
+        if sz_engine._internal_is_initialized():  # pylint: disable=W0212
+            sz_engine._reinitialize(config_id=config_id)  # pylint: disable=W0212
+
+
+class GatedEngine(SzEngineCore):
+    """An SzEngineCore with a gated method that blocks until released, doesn't load the Senzing library."""
+
+    events: List[str] = []
+
+    def __init__(self, **kwargs: Any) -> None:  # pylint: disable=W0231
+        _ = kwargs
+        self._is_destroyed = False
+        self.released = threading.Event()
+        self.started = threading.Event()
+
+    @gated_sdk_method
+    def call(self, name: str, block: bool = True) -> None:
+        """Stand-in SzEngineCore method."""
+        self.started.set()
+        if block:
+            self.released.wait(5)
+        self.events.append(name)
+
+
+# -----------------------------------------------------------------------------
+# Fixtures
+# -----------------------------------------------------------------------------
+
+
+@pytest.fixture(name="sz_abstractfactory", scope="function")
+def szabstractfactory_fixture(engine_vars: Dict[Any, Any]) -> SzAbstractFactory:
+    """
+    SzAbstractFactory object to use for all tests.
+    """
+    result = SzAbstractFactoryCore(instance_name="Example", settings=engine_vars.get("SETTINGS_DICT", {}))
+    return result
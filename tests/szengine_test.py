@@ -150,6 +150,16 @@ def test_add_record_bad_record_id_type(sz_engine: SzEngine) -> None:
         sz_engine.add_record(data_source_code, bad_record_id, record_definition)  # type: ignore[arg-type]
 
 
+@pytest.mark.parametrize("bad_flags", ["16", 1.5])
+def test_add_record_bad_flags_type(sz_engine: SzEngine, bad_flags: Any) -> None:
+    """Test SzEngine.add_record() with flags that aren't an int."""
+    data_source_code = "TEST"
+    record_id = "1"
+    record_definition = RECORD_STR
+    with pytest.raises(SzSdkError):
+        sz_engine.add_record(data_source_code, record_id, record_definition, bad_flags)
+
+
 def test_add_record_data_source_code_empty(sz_engine: SzEngine) -> None:
     """Test SzEngine.add_record() with empty data source code."""
     bad_data_source_code = ""
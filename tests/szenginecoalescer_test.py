@@ -0,0 +1,182 @@
+#! /usr/bin/env python3
+
+"""
+szenginecoalescer_test.py
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+import pytest
+from senzing import SzEngine, SzEngineFlags, SzNotFoundError, SzSdkError
+
+from senzing_core import SzEngineCoalescer, SzEngineCore
+
+# -----------------------------------------------------------------------------
+# Test cases
+# -----------------------------------------------------------------------------
+
+
+def test_coalesce_concurrent_identical_calls() -> None:
+    """Test concurrent identical calls share a single call to the SzEngine."""
+    slow_engine = SlowEngine(delay=0.2)
+    sz_engine = SzEngineCoalescer(slow_engine)  # type: ignore[arg-type]
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        results = list(executor.map(lambda _: sz_engine.get_entity_by_entity_id(1), range(10)))
+    assert all(result == results[0] for result in results)
+    assert slow_engine.calls == 1
+    assert sz_engine.coalesced_count == 9
+    assert sz_engine.stats()["get_entity_by_entity_id"] == {"calls": 10, "coalesced": 9}
+
+
+def test_coalesce_positional_and_keyword_flags() -> None:
+    """Test calls with defaulted and explicit flags are identical calls."""
+    slow_engine = SlowEngine(delay=0.2)
+    sz_engine = SzEngineCoalescer(slow_engine)  # type: ignore[arg-type]
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        future_1 = executor.submit(sz_engine.get_entity_by_entity_id, 1)
+        future_2 = executor.submit(sz_engine.get_entity_by_entity_id, 1, SzEngineFlags.SZ_ENTITY_DEFAULT_FLAGS)
+        assert future_1.result() == future_2.result()
+    assert slow_engine.calls == 1
+
+
+def test_coalesce_different_arguments_not_coalesced() -> None:
+    """Test calls with different arguments aren't coalesced."""
+    slow_engine = SlowEngine(delay=0.1)
+    sz_engine = SzEngineCoalescer(slow_engine)  # type: ignore[arg-type]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(sz_engine.get_entity_by_entity_id, [1, 2, 3, 4]))
+    assert len(set(results)) == 4
+    assert slow_engine.calls == 4
+    assert sz_engine.coalesced_count == 0
+
+
+def test_coalesce_list_arguments() -> None:
+    """Test calls with list arguments, which aren't hashable, are coalesced."""
+    slow_engine = SlowEngine(delay=0.2)
+    sz_engine = SzEngineCoalescer(slow_engine)  # type: ignore[arg-type]
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        list(executor.map(lambda _: sz_engine.find_network_by_entity_id([1, 2], 1, 0, 0), range(5)))
+    assert slow_engine.calls == 1
+    assert sz_engine.stats()["find_network_by_entity_id"]["coalesced"] == 4
+
+
+def test_coalesce_exception_shared() -> None:
+    """Test all coalesced callers receive the exception raised by the in-flight call."""
+    slow_engine = SlowEngine(delay=0.2)
+    sz_engine = SzEngineCoalescer(slow_engine)  # type: ignore[arg-type]
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(sz_engine.get_entity_by_entity_id, -1) for _ in range(3)]
+        for future in futures:
+            with pytest.raises(SzNotFoundError):
+                future.result()
+    assert slow_engine.calls == 1
+
+
+def test_coalesce_sequential_calls_not_coalesced() -> None:
+    """Test a call made after an identical call completed isn't coalesced."""
+    slow_engine = SlowEngine(delay=0.0)
+    sz_engine = SzEngineCoalescer(slow_engine)  # type: ignore[arg-type]
+    sz_engine.get_entity_by_entity_id(1)
+    sz_engine.get_entity_by_entity_id(1)
+    assert slow_engine.calls == 2
+    assert sz_engine.coalesced_count == 0
+
+
+def test_reset_stats() -> None:
+    """Test SzEngineCoalescer.reset_stats()."""
+    sz_engine = SzEngineCoalescer(SlowEngine(delay=0.0))  # type: ignore[arg-type]
+    sz_engine.get_entity_by_entity_id(1)
+    sz_engine.reset_stats()
+    assert sz_engine.stats()["get_entity_by_entity_id"] == {"calls": 0, "coalesced": 0}
+
+
+def test_passthrough_method(sz_engine: SzEngine) -> None:
+    """Test methods not coalesced are passed to the SzEngine."""
+    coalescer = SzEngineCoalescer(sz_engine)
+    actual = coalescer.get_active_config_id()
+    assert isinstance(actual, int)
+    assert coalescer.sz_engine is sz_engine
+
+
+def test_search_by_attributes(sz_engine: SzEngine) -> None:
+    """Test SzEngineCoalescer.search_by_attributes()."""
+    coalescer = SzEngineCoalescer(sz_engine)
+    attributes = json.dumps({"NAME_FULL": "BOB SMITH", "EMAIL_ADDRESS": "bsmith@work.com"})
+    actual = coalescer.search_by_attributes(attributes)
+    assert actual == sz_engine.search_by_attributes(attributes)
+
+
+def test_get_entity_by_entity_id_bad_entity_id_type(sz_engine: SzEngine) -> None:
+    """Test SzEngineCoalescer.get_entity_by_entity_id() with a bad entity_id datatype."""
+    coalescer = SzEngineCoalescer(sz_engine)
+    with pytest.raises(SzSdkError):
+        coalescer.get_entity_by_entity_id("1")  # type: ignore[arg-type]
+
+
+# -----------------------------------------------------------------------------
+# Utilities
+# -----------------------------------------------------------------------------
+
+
+class SlowEngine:
+    """An SzEngine stand-in with slow read methods, used to hold calls in-flight."""
+
+    def __init__(self, delay: float) -> None:
+        self.calls = 0
+        self.delay = delay
+        self.lock = threading.Lock()
+
+    def _call(self, response: Dict[str, Any]) -> str:
+        with self.lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return json.dumps(response)
+
+    def find_network_by_entity_id(
+        self,
+        entity_ids: List[int],
+        max_degrees: int,
+        build_out_degrees: int,
+        build_out_max_entities: int,
+        flags: int = SzEngineFlags.SZ_FIND_NETWORK_DEFAULT_FLAGS,
+    ) -> str:
+        """Stand-in SzEngine.find_network_by_entity_id()"""
+        return self._call(
+            {
+                "ENTITIES": entity_ids,
+                "MAX_DEGREES": max_degrees,
+                "BUILD_OUT_DEGREES": build_out_degrees,
+                "BUILD_OUT_MAX_ENTITIES": build_out_max_entities,
+                "FLAGS": int(flags),
+            }
+        )
+
+    def get_entity_by_entity_id(self, entity_id: int, flags: int = SzEngineFlags.SZ_ENTITY_DEFAULT_FLAGS) -> str:
+        """Stand-in SzEngine.get_entity_by_entity_id()"""
+        if entity_id < 0:
+            self._call({})
+            raise SzNotFoundError(f"entity {entity_id} not found")
+        return self._call({"ENTITY_ID": entity_id, "FLAGS": int(flags)})
+
+
+# -----------------------------------------------------------------------------
+# Fixtures
+# -----------------------------------------------------------------------------
+
+
+@pytest.fixture(name="sz_engine", scope="function")
+def szengine_fixture(engine_vars: Dict[Any, Any]) -> SzEngine:
+    """
+    SzEngine object to use for all tests.
+    engine_vars is returned from conftest.py.
+    """
+    result = SzEngineCore()
+    result._initialize(  # pylint: disable=W0212
+        engine_vars["INSTANCE_NAME"],
+        engine_vars["SETTINGS"],
+    )
+    return result
@@ -0,0 +1,228 @@
+#! /usr/bin/env python3
+
+"""
+szengineprocesspool_test.py
+"""
+
+import threading
+import time
+from typing import Any, Dict, Iterator, List
+
+import pytest
+from senzing import SzEngineFlags, SzNotFoundError, SzSdkError
+
+from senzing_core import (
+    SzAbstractFactoryParametersCore,
+    SzEngineProcessPool,
+    SzEngineTimeoutError,
+    szengineprocesspool,
+)
+
+# -----------------------------------------------------------------------------
+# Test cases
+# -----------------------------------------------------------------------------
+
+
+def test_call(sz_engine_process_pool: SzEngineProcessPool) -> None:
+    """Test SzEngineProcessPool.call()."""
+    actual = sz_engine_process_pool.call("get_active_config_id")
+    assert isinstance(actual, int)
+    assert sz_engine_process_pool.stats()["calls"] == 1
+
+
+def test_call_error(sz_engine_process_pool: SzEngineProcessPool) -> None:
+    """Test SzEngineProcessPool.call() raises the error raised in the worker process."""
+    with pytest.raises(SzNotFoundError):
+        sz_engine_process_pool.call("how_entity_by_entity_id", 0, SzEngineFlags.SZ_HOW_ENTITY_DEFAULT_FLAGS)
+    assert sz_engine_process_pool.stats()["errors"] == 1
+
+
+def test_call_bad_argument_type(sz_engine_process_pool: SzEngineProcessPool) -> None:
+    """Test SzEngineProcessPool.call() with a bad argument datatype."""
+    with pytest.raises(SzSdkError):
+        sz_engine_process_pool.call("get_entity_by_entity_id", "1")
+
+
+def test_call_timeout(sz_engine_process_pool: SzEngineProcessPool) -> None:
+    """Test a call exceeding its deadline raises SzEngineTimeoutError and its worker is replaced."""
+    with pytest.raises(SzEngineTimeoutError):
+        sz_engine_process_pool.call("get_stats", timeout=0)
+    with pytest.raises(TimeoutError):
+        sz_engine_process_pool.call("find_network_by_entity_id", [1, 2], 10, 10, 10000, timeout=0)
+    assert sz_engine_process_pool.stats()["replaced"] == 2
+    assert sz_engine_process_pool.stats()["timeouts"] == 2
+
+    # Replacement worker processes are usable
+    actual = sz_engine_process_pool.call("get_active_config_id")
+    assert isinstance(actual, int)
+
+
+def test_call_timeout_waiting_for_replacement(engine_vars: Dict[Any, Any]) -> None:
+    """Test the deadline of a call includes waiting for a replacement worker process to create its SzEngine."""
+    with SzEngineProcessPool(factory_parameters(engine_vars), processes=1) as pool:
+        with pytest.raises(SzEngineTimeoutError):
+            pool.call("get_stats", timeout=0)
+        start = time.monotonic()
+        with pytest.raises(SzEngineTimeoutError):
+            pool.call("get_active_config_id", timeout=0.01)
+        assert time.monotonic() - start < 1
+        assert pool.stats()["replaced"] == 1
+
+        # The replacement worker process was left to start for later calls
+        actual = pool.call("get_active_config_id")
+        assert isinstance(actual, int)
+
+
+def test_call_interrupted(engine_vars: Dict[Any, Any], monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a worker process interrupted with a call in flight is replaced, not given to the next caller."""
+    with SzEngineProcessPool(factory_parameters(engine_vars), processes=1) as pool:
+        connection = pool._workers[0].connection  # pylint: disable=W0212
+        monkeypatch.setattr(connection, "recv", interrupt)
+        with pytest.raises(KeyboardInterrupt):
+            pool.call("get_active_config_id")
+        assert pool.stats()["replaced"] == 1
+        assert isinstance(pool.call("get_active_config_id"), int)
+
+
+def test_replace_start_failure(engine_vars: Dict[Any, Any], monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a worker process is dropped if its replacement can't start and started again by a later call."""
+    with SzEngineProcessPool(factory_parameters(engine_vars), processes=1) as pool:
+        with monkeypatch.context() as patch:
+            patch.setattr(szengineprocesspool, "_Worker", start_failure)
+            with pytest.raises(SzEngineTimeoutError):
+                pool.call("get_stats", timeout=0)
+        assert pool.processes == 0
+        assert pool.stats()["dropped"] == 1
+        assert isinstance(pool.call("get_active_config_id"), int)
+        assert pool.processes == 1
+
+
+def test_close_waits_for_calls(engine_vars: Dict[Any, Any]) -> None:
+    """Test close() lets calls in progress complete and doesn't replace worker processes once closed."""
+    pool = SzEngineProcessPool(factory_parameters(engine_vars), processes=1)
+    results: List[Any] = []
+    call = threading.Thread(target=lambda: results.append(pool.call("get_active_config_id")))
+    call.start()
+    time.sleep(0.1)
+    pool.close()
+    call.join(5)
+    assert len(results) == 1
+    assert pool.stats()["replaced"] == 0
+    with pytest.raises(SzSdkError):
+        pool.call("get_active_config_id")
+
+
+def test_close_timeout(engine_vars: Dict[Any, Any]) -> None:
+    """Test close() kills worker processes still running a call after its timeout."""
+    pool = SzEngineProcessPool(factory_parameters(engine_vars), processes=1)
+    errors: List[Exception] = []
+
+    def call() -> None:
+        try:
+            pool.call("find_network_by_entity_id", [1, 2], 10, 10, 10000)
+        except SzSdkError as err:
+            errors.append(err)
+
+    thread = threading.Thread(target=call)
+    thread.start()
+    time.sleep(0.1)
+    pool.close(timeout=0)
+    thread.join(5)
+    assert not thread.is_alive()
+    assert pool.stats()["replaced"] == 0
+
+
+def test_call_after_close(engine_vars: Dict[Any, Any]) -> None:
+    """Test SzEngineProcessPool.call() after close()."""
+    pool = SzEngineProcessPool(factory_parameters(engine_vars), processes=1)
+    pool.close()
+    with pytest.raises(SzSdkError):
+        pool.call("get_active_config_id")
+
+
+def test_recycle_after_calls(engine_vars: Dict[Any, Any]) -> None:
+    """Test worker processes are recycled after max_calls_per_worker calls, without losing the calls' results."""
+    with SzEngineProcessPool(factory_parameters(engine_vars), processes=1, max_calls_per_worker=2) as pool:
+        actual = [pool.call("get_active_config_id") for _ in range(5)]
+        assert all(isinstance(config_id, int) for config_id in actual)
+        assert pool.stats()["recycled"] == 2
+        assert pool.stats()["replaced"] == 0
+
+
+def test_recycle_after_rss_growth(engine_vars: Dict[Any, Any]) -> None:
+    """Test worker processes are recycled once their RSS has grown by max_rss_growth_bytes."""
+    with SzEngineProcessPool(factory_parameters(engine_vars), processes=1, max_rss_growth_bytes=1) as pool:
+        for _ in range(3):
+            pool.call("get_stats")
+        assert pool.processes == 1
+        assert pool.stats()["calls"] == 3
+        assert pool.stats()["recycled"] > 0
+
+
+def test_recycle_start_failure(engine_vars: Dict[Any, Any], monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a worn out worker process is kept, and the call's result returned, if its replacement can't start."""
+    with SzEngineProcessPool(factory_parameters(engine_vars), processes=1, max_calls_per_worker=1) as pool:
+        monkeypatch.setattr(szengineprocesspool, "_Worker", start_failure)
+        assert isinstance(pool.call("get_active_config_id"), int)
+        assert isinstance(pool.call("get_active_config_id"), int)
+        assert pool.stats()["recycled"] == 0
+        assert pool.stats()["replaced"] == 0
+
+
+@pytest.mark.parametrize("kwargs", [{"max_calls_per_worker": 0}, {"max_rss_growth_bytes": 0}])
+def test_bad_recycling(engine_vars: Dict[Any, Any], kwargs: Dict[str, Any]) -> None:
+    """Test SzEngineProcessPool with bad recycling limits."""
+    with pytest.raises(SzSdkError):
+        SzEngineProcessPool(factory_parameters(engine_vars), processes=1, **kwargs)
+
+
+def test_bad_processes(engine_vars: Dict[Any, Any]) -> None:
+    """Test SzEngineProcessPool with bad processes."""
+    with pytest.raises(SzSdkError):
+        SzEngineProcessPool(factory_parameters(engine_vars), processes=0)
+
+
+def test_bad_settings() -> None:
+    """Test SzEngineProcessPool with settings the worker processes can't create an SzEngine from."""
+    with pytest.raises(SzSdkError):
+        SzEngineProcessPool({"instance_name": "Example", "settings": {"SQL": {}}}, processes=1)
+
+
+def test_property_processes(sz_engine_process_pool: SzEngineProcessPool) -> None:
+    """Test SzEngineProcessPool.processes."""
+    assert sz_engine_process_pool.processes == 2
+
+
+# -----------------------------------------------------------------------------
+# Utilities
+# -----------------------------------------------------------------------------
+
+
+def factory_parameters(engine_vars: Dict[Any, Any]) -> SzAbstractFactoryParametersCore:
+    """Arguments for the SzAbstractFactoryCore in each worker process."""
+    return {"instance_name": "Example", "settings": engine_vars.get("SETTINGS_DICT", {})}
+
+
+def interrupt(*args: Any) -> None:
+    """A Connection.recv() stand-in interrupted by Ctrl-C."""
+    raise KeyboardInterrupt(f"interrupted with {len(args)} arguments")
+
+
+def start_failure(*args: Any) -> None:
+    """A _Worker stand-in whose process can't be started."""
+    raise OSError(f"can't start a worker process with {len(args)} arguments")
+
+
+# -----------------------------------------------------------------------------
+# Fixtures
+# -----------------------------------------------------------------------------
+
+
+@pytest.fixture(name="sz_engine_process_pool", scope="function")
+def szengineprocesspool_fixture(engine_vars: Dict[Any, Any]) -> Iterator[SzEngineProcessPool]:
+    """
+    SzEngineProcessPool object to use for all tests.
+    engine_vars is returned from conftest.py.
+    """
+    with SzEngineProcessPool(factory_parameters(engine_vars), processes=2) as result:
+        yield result
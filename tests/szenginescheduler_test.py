@@ -0,0 +1,170 @@
+#! /usr/bin/env python3
+
+"""
+szenginescheduler_test.py
+"""
+
+import threading
+from typing import Any, Dict, List
+
+import pytest
+from senzing import SzEngine, SzNotFoundError, SzSdkError
+
+from senzing_core import SzEngineCore, SzEngineScheduler, SzPriority
+
+# -----------------------------------------------------------------------------
+# Test cases
+# -----------------------------------------------------------------------------
+
+
+def test_call(sz_engine: SzEngine) -> None:
+    """Test SzEngineScheduler.call()."""
+    with SzEngineScheduler(sz_engine, max_workers=2) as scheduler:
+        actual = scheduler.call(SzPriority.INTERACTIVE, "get_active_config_id")
+    assert isinstance(actual, int)
+
+
+def test_interactive_started_before_bulk() -> None:
+    """Test waiting interactive calls are started before waiting bulk calls."""
+    blocking_engine = BlockingEngine()
+    with SzEngineScheduler(blocking_engine, max_workers=1) as scheduler:  # type: ignore[arg-type]
+        first = scheduler.submit(SzPriority.BULK, "add_record", "first")
+        blocking_engine.started["first"].wait(5)
+        scheduler.submit(SzPriority.BULK, "add_record", "bulk")
+        scheduler.submit(SzPriority.REDO, "process_redo_record", "redo")
+        interactive = scheduler.submit(SzPriority.INTERACTIVE, "get_entity_by_entity_id", "interactive")
+        blocking_engine.release()
+        first.result(5)
+        interactive.result(5)
+    assert blocking_engine.order == ["first", "interactive", "bulk", "redo"]
+
+
+def test_concurrency_limit_leaves_slots_for_interactive() -> None:
+    """Test bulk calls can't occupy more workers than their concurrency limit."""
+    blocking_engine = BlockingEngine()
+    limits = {SzPriority.BULK: 1, SzPriority.REDO: 1}
+    with SzEngineScheduler(blocking_engine, max_workers=2, concurrency_limits=limits) as scheduler:  # type: ignore[arg-type]
+        scheduler.submit(SzPriority.BULK, "add_record", "bulk_1")
+        scheduler.submit(SzPriority.BULK, "add_record", "bulk_2")
+        blocking_engine.started["bulk_1"].wait(5)
+        assert scheduler.metrics()["BULK"]["running"] == 1
+        assert scheduler.metrics()["BULK"]["queued"] == 1
+        interactive = scheduler.submit(SzPriority.INTERACTIVE, "get_entity_by_entity_id", "interactive", block=False)
+        assert interactive.result(5) == "interactive"
+        blocking_engine.release()
+    assert blocking_engine.order == ["bulk_1", "interactive", "bulk_2"]
+
+
+def test_metrics() -> None:
+    """Test SzEngineScheduler.metrics()."""
+    blocking_engine = BlockingEngine()
+    blocking_engine.release()
+    with SzEngineScheduler(blocking_engine, max_workers=2) as scheduler:  # type: ignore[arg-type]
+        for name in ["a", "b", "c"]:
+            scheduler.call(SzPriority.INTERACTIVE, "get_entity_by_entity_id", name)
+        with pytest.raises(SzNotFoundError):
+            scheduler.call(SzPriority.REDO, "process_redo_record", "error")
+        actual = scheduler.metrics()
+    assert actual["INTERACTIVE"]["submitted"] == 3
+    assert actual["INTERACTIVE"]["completed"] == 3
+    assert actual["INTERACTIVE"]["errors"] == 0
+    assert actual["INTERACTIVE"]["run"]["count"] == 3
+    assert actual["INTERACTIVE"]["total"]["p99_ms"] >= actual["INTERACTIVE"]["total"]["p50_ms"]
+    assert actual["REDO"]["errors"] == 1
+    assert actual["BULK"]["submitted"] == 0
+
+
+def test_default_concurrency_limits() -> None:
+    """Test default concurrency limits scale with max_workers."""
+    with SzEngineScheduler(BlockingEngine(), max_workers=4) as scheduler:  # type: ignore[arg-type]
+        actual = scheduler.concurrency_limits
+    assert actual == {SzPriority.INTERACTIVE: 4, SzPriority.BULK: 2, SzPriority.REDO: 1}
+
+
+def test_bad_max_workers() -> None:
+    """Test SzEngineScheduler with bad max_workers."""
+    with pytest.raises(SzSdkError):
+        SzEngineScheduler(BlockingEngine(), max_workers=0)  # type: ignore[arg-type]
+
+
+def test_bad_concurrency_limit() -> None:
+    """Test SzEngineScheduler with a bad concurrency limit."""
+    with pytest.raises(SzSdkError):
+        SzEngineScheduler(BlockingEngine(), concurrency_limits={SzPriority.BULK: 0})  # type: ignore[arg-type]
+
+
+def test_submit_bad_method_name() -> None:
+    """Test SzEngineScheduler.submit() with a method name that isn't an SzEngine method."""
+    with SzEngineScheduler(BlockingEngine(), max_workers=1) as scheduler:  # type: ignore[arg-type]
+        with pytest.raises(SzSdkError):
+            scheduler.submit(SzPriority.INTERACTIVE, "no_such_method")
+
+
+def test_submit_after_shutdown() -> None:
+    """Test SzEngineScheduler.submit() after shutdown()."""
+    scheduler = SzEngineScheduler(BlockingEngine(), max_workers=1)  # type: ignore[arg-type]
+    scheduler.shutdown()
+    with pytest.raises(SzSdkError):
+        scheduler.submit(SzPriority.INTERACTIVE, "get_entity_by_entity_id", "after")
+
+
+# -----------------------------------------------------------------------------
+# Utilities
+# -----------------------------------------------------------------------------
+
+
+class BlockingEngine:
+    """An SzEngine stand-in whose methods block until released and record the order they ran in."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.order: List[str] = []
+        self.released = threading.Event()
+        self.started: Dict[str, threading.Event] = {}
+        for name in ["first", "bulk_1", "bulk_2", "bulk", "redo", "interactive"]:
+            self.started[name] = threading.Event()
+
+    def release(self) -> None:
+        """Let blocked and future calls complete."""
+        self.released.set()
+
+    def _call(self, name: str, block: bool = True) -> str:
+        with self.lock:
+            self.order.append(name)
+        self.started.setdefault(name, threading.Event()).set()
+        if name == "error":
+            raise SzNotFoundError(name)
+        if block:
+            self.released.wait(5)
+        return name
+
+    def add_record(self, name: str, block: bool = True) -> str:
+        """Stand-in bulk write."""
+        return self._call(name, block)
+
+    def get_entity_by_entity_id(self, name: str, block: bool = True) -> str:
+        """Stand-in interactive read."""
+        return self._call(name, block)
+
+    def process_redo_record(self, name: str, block: bool = True) -> str:
+        """Stand-in redo."""
+        return self._call(name, block)
+
+
+# -----------------------------------------------------------------------------
+# Fixtures
+# -----------------------------------------------------------------------------
+
+
+@pytest.fixture(name="sz_engine", scope="function")
+def szengine_fixture(engine_vars: Dict[Any, Any]) -> SzEngine:
+    """
+    SzEngine object to use for all tests.
+    engine_vars is returned from conftest.py.
+    """
+    result = SzEngineCore()
+    result._initialize(  # pylint: disable=W0212
+        engine_vars["INSTANCE_NAME"],
+        engine_vars["SETTINGS"],
+    )
+    return result
@@ -0,0 +1,216 @@
+#! /usr/bin/env python3
+
+"""
+szhandles_test.py
+"""
+
+import gc
+import time
+from ctypes import c_void_p, cast
+from types import SimpleNamespace
+from typing import Any, Iterator, List
+
+import pytest
+from senzing import SzSdkError
+
+from senzing_core import SzConfigCore, SzEngineCore, szhandles
+
+# -----------------------------------------------------------------------------
+# Test cases
+# -----------------------------------------------------------------------------
+
+
+def test_open_and_close() -> None:
+    """Test export handles are tracked from export_json_entity_report() until close_export_report()."""
+    stand_in = StandInEngine()
+    export_handle = stand_in.export_json_entity_report()
+    csv_export_handle = stand_in.export_csv_entity_report("*")
+    first, second = szhandles.open_handles()
+    assert first["kind"] == "export"
+    assert first["handle"] == export_handle
+    assert first["owner"] == "StandInEngine"
+    assert first["age_seconds"] >= second["age_seconds"] >= 0
+    assert any("test_open_and_close" in frame for frame in first["stack"])
+    assert second["handle"] == csv_export_handle
+
+    stand_in.close_export_report(export_handle)
+    assert [item["handle"] for item in szhandles.open_handles()] == [csv_export_handle]
+    assert szhandles.stats() == {"open": {"config": 0, "export": 1}, "opened": 2, "closed": 1, "auto_closed": 0}
+
+
+def test_config_handles() -> None:
+    """Test SzConfigCore's in-memory configuration handles are tracked, sessions included."""
+    stand_in = StandInConfig()
+    with stand_in.session():
+        (actual,) = szhandles.open_handles()
+        assert actual["kind"] == "config"
+        assert actual["owner"] == "StandInConfig"
+    assert not szhandles.open_handles()
+    assert szhandles.stats()["closed"] == 1
+
+
+def test_import_template_handle() -> None:
+    """Test the handle import_template() creates the template in is tracked as opened as well as closed."""
+    stand_in = StandInConfig()
+    stand_in.import_template()
+    assert not szhandles.open_handles()
+    assert szhandles.stats() == {"open": {"config": 0, "export": 0}, "opened": 1, "closed": 1, "auto_closed": 0}
+
+
+def test_min_age() -> None:
+    """Test open_handles() only returns handles open for at least min_age_seconds."""
+    stand_in = StandInEngine()
+    stand_in.export_json_entity_report()
+    time.sleep(0.05)
+    export_handle = stand_in.export_json_entity_report()
+    assert len(szhandles.open_handles(min_age_seconds=0.04)) == 1
+    assert export_handle not in [item["handle"] for item in szhandles.open_handles(min_age_seconds=0.04)]
+
+
+def test_without_stacks() -> None:
+    """Test stacks aren't recorded with stacks=False."""
+    szhandles.enable(stacks=False)
+    StandInEngine().export_json_entity_report()
+    assert szhandles.open_handles()[0]["stack"] == []
+
+
+def test_auto_close() -> None:
+    """Test handles still open when their owner is collected are closed with auto_close."""
+    szhandles.enable(auto_close=True)
+    stand_in = StandInEngine()
+    library = stand_in._library_handle  # pylint: disable=W0212
+    export_handle = stand_in.export_json_entity_report()
+    closed_handle = stand_in.export_json_entity_report()
+    stand_in.close_export_report(closed_handle)
+    del stand_in
+    gc.collect()
+    assert library.closed == [closed_handle, export_handle]
+    assert not szhandles.open_handles()
+    assert szhandles.stats()["auto_closed"] == 1
+
+
+def test_no_auto_close() -> None:
+    """Test handles aren't closed when their owner is collected without auto_close."""
+    stand_in = StandInEngine()
+    library = stand_in._library_handle  # pylint: disable=W0212
+    stand_in.export_json_entity_report()
+    del stand_in
+    gc.collect()
+    assert not library.closed
+    assert len(szhandles.open_handles()) == 1
+
+
+def test_bind() -> None:
+    """Test a handle bound to another object is closed when that object is collected."""
+    stand_in = StandInEngine()
+    export_handle = stand_in.export_json_entity_report()
+    owner = StandInOwner()
+    szhandles.bind(export_handle, owner)
+    del owner
+    gc.collect()
+    assert stand_in._library_handle.closed == [export_handle]  # pylint: disable=W0212
+    assert szhandles.stats()["auto_closed"] == 1
+    with pytest.raises(SzSdkError):
+        szhandles.bind(export_handle, StandInOwner())
+
+
+def test_disable() -> None:
+    """Test handles aren't tracked once disabled."""
+    szhandles.enable(auto_close=True)
+    stand_in = StandInEngine()
+    library = stand_in._library_handle  # pylint: disable=W0212
+    stand_in.export_json_entity_report()
+    szhandles.disable()
+    assert not szhandles.is_enabled()
+    stand_in.export_json_entity_report()
+    assert not szhandles.open_handles()
+    assert szhandles.stats()["opened"] == 0
+    del stand_in
+    gc.collect()
+    assert not library.closed
+    with pytest.raises(SzSdkError):
+        szhandles.bind(1, StandInOwner())
+
+
+# -----------------------------------------------------------------------------
+# Utilities
+# -----------------------------------------------------------------------------
+
+
+class StandInLibrary:
+    """A Senzing library stand-in, opens export and config handles and records those closed."""
+
+    def __init__(self) -> None:
+        self.closed: List[int] = []
+        self.next_handle = 100
+
+    def SzConfig_close_helper(self, config_handle: Any) -> int:  # pylint: disable=C0103
+        """Stand-in SzConfig_close_helper()."""
+        return self.Sz_closeExportReport_helper(config_handle)
+
+    def SzConfig_create_helper(self) -> Any:  # pylint: disable=C0103
+        """Stand-in SzConfig_create_helper()."""
+        return self.SzConfig_load_helper(None)
+
+    def SzConfig_export_helper(self, _config_handle: Any) -> str:  # pylint: disable=C0103
+        """Stand-in SzConfig_export_helper()."""
+        return "{}"
+
+    def SzConfig_load_helper(self, _config_definition: Any) -> Any:  # pylint: disable=C0103
+        """Stand-in SzConfig_load_helper()."""
+        self.next_handle += 1
+        return SimpleNamespace(return_code=0, response=self.next_handle)
+
+    def Sz_closeExportReport_helper(self, export_handle: Any) -> int:  # pylint: disable=C0103
+        """Stand-in Sz_closeExportReport_helper()."""
+        self.closed.append(cast(export_handle, c_void_p).value or 0)
+        return 0
+
+    def Sz_exportCSVEntityReport_helper(self, _csv_column_list: Any, _flags: int) -> Any:  # pylint: disable=C0103
+        """Stand-in Sz_exportCSVEntityReport_helper()."""
+        return self.Sz_exportJSONEntityReport_helper(_flags)
+
+    def Sz_exportJSONEntityReport_helper(self, _flags: int) -> Any:  # pylint: disable=C0103
+        """Stand-in Sz_exportJSONEntityReport_helper()."""
+        self.next_handle += 1
+        return SimpleNamespace(return_code=0, export_handle=self.next_handle)
+
+
+class StandInEngine(SzEngineCore):
+    """An SzEngineCore using StandInLibrary, doesn't load the Senzing library."""
+
+    def __init__(self, **kwargs: Any) -> None:  # pylint: disable=W0231
+        _ = kwargs
+        self._is_destroyed = False
+        self._library_handle = StandInLibrary()  # type: ignore[assignment]
+        self._check_result = lambda return_code: None  # type: ignore[assignment]
+
+
+class StandInConfig(SzConfigCore):
+    """An SzConfigCore using StandInLibrary, doesn't load the Senzing library."""
+
+    def __init__(self, **kwargs: Any) -> None:  # pylint: disable=W0231
+        _ = kwargs
+        self._library_handle = StandInLibrary()  # type: ignore[assignment]
+        self._check_result = lambda return_code: None  # type: ignore[assignment]
+        self._resource_path = None
+        self._response_as_str = lambda response: response  # type: ignore[assignment]
+        self._session_handle = None
+        self.config_definition = "{}"
+
+
+class StandInOwner:  # pylint: disable=R0903
+    """An object to bind handles to."""
+
+
+# -----------------------------------------------------------------------------
+# Fixtures
+# -----------------------------------------------------------------------------
+
+
+@pytest.fixture(name="handles", autouse=True)
+def handles_fixture() -> Iterator[None]:
+    """Track handles for each test."""
+    szhandles.enable()
+    yield
+    szhandles.disable()
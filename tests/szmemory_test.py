@@ -0,0 +1,184 @@
+#! /usr/bin/env python3
+
+"""
+szmemory_test.py
+"""
+
+import subprocess
+import sys
+import threading
+import time
+from typing import Iterator, List
+
+import pytest
+from senzing import SzSdkError
+
+from senzing_core import SzMemoryMonitor, szmemory
+from senzing_core._helpers import sdk_method
+from senzing_core.szmemory import rss_bytes
+
+# -----------------------------------------------------------------------------
+# Test cases
+# -----------------------------------------------------------------------------
+
+
+def test_rss_bytes() -> None:
+    """Test rss_bytes() for this process and a process that has exited."""
+    assert rss_bytes() > 0
+    process = subprocess.Popen([sys.executable, "-c", ""])  # pylint: disable=R1732
+    process.wait()
+    with pytest.raises(SzSdkError):
+        rss_bytes(process.pid)
+
+
+def test_sample(sz_memory_monitor: SzMemoryMonitor) -> None:
+    """Test samples hold the RSS and the calls made so far, by method."""
+    stand_in = StandInSdk()
+    stand_in.allocate(0)
+    stand_in.allocate(0)
+    stand_in.count()
+    sz_memory_monitor.sample()
+    first, second = sz_memory_monitor.samples()
+    assert first["calls"] == 0
+    assert second["rss_bytes"] > 0
+    assert second["calls"] == 3
+    assert second["method_calls"] == {"StandInSdk.allocate": 2, "StandInSdk.count": 1}
+    assert first["time"] <= second["time"]
+
+
+def test_growth(sz_memory_monitor: SzMemoryMonitor) -> None:
+    """Test growth() correlates RSS growth with the calls made."""
+    stand_in = StandInSdk()
+    for _ in range(4):
+        stand_in.allocate(MEBIBYTE * 16)
+        sz_memory_monitor.sample()
+    actual = sz_memory_monitor.growth()
+    assert actual["calls"] == 4
+    assert actual["rss_growth_bytes"] >= MEBIBYTE * 48
+    assert MEBIBYTE * 12 <= actual["bytes_per_call"] <= MEBIBYTE * 20
+    assert actual["bytes_per_second"] > 0
+    assert sz_memory_monitor.growth(last=1)["rss_growth_bytes"] == 0
+    assert sz_memory_monitor.growth(last=1)["bytes_per_call"] == 0.0
+
+
+def test_no_samples() -> None:
+    """Test growth() without samples."""
+    assert SzMemoryMonitor().growth() == {
+        "rss_bytes": 0,
+        "rss_growth_bytes": 0,
+        "calls": 0,
+        "bytes_per_call": 0,
+        "bytes_per_second": 0,
+    }
+
+
+def test_background_sampling() -> None:
+    """Test samples are taken every interval once started."""
+    with SzMemoryMonitor(interval=0.01, capacity=3) as sz_memory_monitor:
+        time.sleep(0.1)
+    assert len(sz_memory_monitor.samples()) == 3
+    assert sz_memory_monitor.errors == 0
+
+
+def test_start_and_stop() -> None:
+    """Test calls aren't counted once stopped and the monitor can't be started twice."""
+    stand_in = StandInSdk()
+    sz_memory_monitor = SzMemoryMonitor(interval=60)
+    sz_memory_monitor.start()
+    with pytest.raises(SzSdkError):
+        sz_memory_monitor.start()
+    stand_in.count()
+    sz_memory_monitor.stop()
+    sz_memory_monitor.stop()
+    stand_in.count()
+    assert sz_memory_monitor.sample()["calls"] == 1
+    assert len(sz_memory_monitor.samples(last=1)) == 1
+    assert not sz_memory_monitor.samples(last=0)
+
+
+def test_start_concurrently(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test only one of two concurrent start() calls starts the monitor while the first sample is taken."""
+    sampling = threading.Event()
+    release = threading.Event()
+
+    def slow_rss_bytes() -> int:
+        sampling.set()
+        release.wait(5)
+        return 1000
+
+    monkeypatch.setattr(szmemory, "rss_bytes", slow_rss_bytes)
+    sz_memory_monitor = SzMemoryMonitor(interval=60)
+    first = threading.Thread(target=sz_memory_monitor.start)
+    first.start()
+    assert sampling.wait(5)
+    with pytest.raises(SzSdkError):
+        sz_memory_monitor.start()
+    release.set()
+    first.join(5)
+    try:
+        assert sz_memory_monitor._thread is not None  # pylint: disable=W0212
+        assert sz_memory_monitor._thread.is_alive()  # pylint: disable=W0212
+    finally:
+        sz_memory_monitor.stop()
+
+
+def test_start_first_sample_fails(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the monitor can be started again after the first sample fails."""
+    sz_memory_monitor = SzMemoryMonitor(interval=60)
+    with monkeypatch.context() as patch:
+        patch.setattr(szmemory, "rss_bytes", unreadable_rss_bytes)
+        with pytest.raises(SzSdkError):
+            sz_memory_monitor.start()
+    with sz_memory_monitor:
+        assert len(sz_memory_monitor.samples()) == 1
+
+
+@pytest.mark.parametrize("interval, capacity", [(0, 10), (10, 0)])
+def test_bad_arguments(interval: float, capacity: int) -> None:
+    """Test SzMemoryMonitor() with arguments out of range."""
+    with pytest.raises(SzSdkError):
+        SzMemoryMonitor(interval=interval, capacity=capacity)
+
+
+# -----------------------------------------------------------------------------
+# Utilities
+# -----------------------------------------------------------------------------
+
+MEBIBYTE = 2**20
+
+
+class StandInSdk:
+    """An SDK class stand-in, its methods are decorated by sdk_method."""
+
+    _is_destroyed = False
+
+    def __init__(self) -> None:
+        self.allocated: List[bytes] = []
+
+    @sdk_method
+    def allocate(self, size: int) -> int:
+        """Stand-in SDK method holding on to size bytes, as a leak in the Senzing library would."""
+        self.allocated.append(b"x" * size)
+        return size
+
+    @sdk_method
+    def count(self) -> int:
+        """Stand-in SDK method."""
+        return 1
+
+
+def unreadable_rss_bytes() -> int:
+    """Stand-in rss_bytes() failing to read the RSS."""
+    raise SzSdkError("can't read the RSS")
+
+
+# -----------------------------------------------------------------------------
+# Fixtures
+# -----------------------------------------------------------------------------
+
+
+@pytest.fixture(name="sz_memory_monitor")
+def szmemorymonitor_fixture() -> Iterator[SzMemoryMonitor]:
+    """SzMemoryMonitor sampling only when sample() is called, for the test."""
+    with SzMemoryMonitor(interval=3600) as result:
+        yield result
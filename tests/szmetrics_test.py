@@ -0,0 +1,214 @@
+#! /usr/bin/env python3
+
+"""
+szmetrics_test.py
+"""
+
+import threading
+from ctypes import CDLL, c_long, c_longlong
+from ctypes.util import find_library
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, Type
+
+import pytest
+from senzing import SzEngine, SzError, SzNotFoundError, SzSdkError
+
+from senzing_core import (
+    SzConfigManagerCore,
+    SzDiagnosticCore,
+    SzEngineCore,
+    SzProductCore,
+    _helpers,
+    szmetrics,
+)
+from senzing_core._helpers import sdk_method
+
+# -----------------------------------------------------------------------------
+# Test cases
+# -----------------------------------------------------------------------------
+
+
+def test_snapshot(sz_engine: SzEngine) -> None:
+    """Test szmetrics.snapshot() records SzEngineCore calls."""
+    with pytest.raises(SzError):
+        sz_engine.get_entity_by_entity_id(0)
+    actual = szmetrics.snapshot()
+    assert actual["SzEngineCore.get_entity_by_entity_id"]["calls"] == 1
+    assert sum(actual["SzEngineCore.get_entity_by_entity_id"]["errors"].values()) == 1
+
+
+@pytest.mark.parametrize(
+    "sdk_class, method_name",
+    [
+        (SzConfigManagerCore, "get_config_registry"),
+        (SzConfigManagerCore, "get_default_config_id"),
+        (SzDiagnosticCore, "get_repository_info"),
+        (SzDiagnosticCore, "purge_repository"),
+        (SzEngineCore, "count_redo_records"),
+        (SzEngineCore, "get_active_config_id"),
+        (SzEngineCore, "get_redo_record"),
+        (SzEngineCore, "get_stats"),
+        (SzEngineCore, "prime_engine"),
+        (SzProductCore, "get_license"),
+        (SzProductCore, "get_version"),
+    ],
+)
+def test_methods_without_arguments(sdk_class: Type[Any], method_name: str) -> None:
+    """Test calls to SDK methods without arguments, e.g. the redo loop's get_redo_record(), are recorded."""
+    getattr(stand_in_sdk_object(sdk_class), method_name)()
+    assert szmetrics.snapshot()[f"{sdk_class.__name__}.{method_name}"]["calls"] == 1
+
+
+def test_calls_and_errors() -> None:
+    """Test calls are counted and errors are counted by type."""
+    stand_in = StandInSdk()
+    stand_in.method(1)
+    stand_in.method(2)
+    with pytest.raises(SzNotFoundError):
+        stand_in.method(-1)
+    with pytest.raises(SzSdkError):
+        stand_in.method("not an int")  # type: ignore[arg-type]
+    actual = szmetrics.snapshot()["StandInSdk.method"]
+    assert actual["calls"] == 4
+    assert actual["errors"] == {"SzNotFoundError": 1, "SzSdkError": 1}
+    assert actual["latency"]["count"] == 4
+    assert actual["latency"]["max_ms"] >= actual["latency"]["p50_ms"] >= actual["latency"]["min_ms"] >= 0
+
+
+def test_threads_merged() -> None:
+    """Test calls recorded on many threads are merged, including while they're recording."""
+    stand_in = StandInSdk()
+    snapshots = []
+
+    def call() -> None:
+        for i in range(1_000):
+            stand_in.method(i)
+        snapshots.append(szmetrics.snapshot())
+
+    threads = [threading.Thread(target=call) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert szmetrics.snapshot()["StandInSdk.method"]["calls"] == 8_000
+    assert len(snapshots) == 8
+
+
+def test_disable_and_reset() -> None:
+    """Test szmetrics.disable() stops recording and szmetrics.reset() discards what was recorded."""
+    stand_in = StandInSdk()
+    stand_in.method(1)
+    szmetrics.disable()
+    assert not szmetrics.is_enabled()
+    stand_in.method(1)
+    assert szmetrics.snapshot()["StandInSdk.method"]["calls"] == 1
+    szmetrics.reset()
+    assert not szmetrics.snapshot()
+    szmetrics.enable()
+    szmetrics.enable()
+    stand_in.method(1)
+    assert szmetrics.snapshot()["StandInSdk.method"]["calls"] == 1
+    szmetrics.reset()
+    stand_in.method(1)
+    assert szmetrics.snapshot()["StandInSdk.method"]["calls"] == 1
+
+
+def test_phases(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test szmetrics.enable(phases=True) times the library's functions, declared before or after enabling."""
+    libc = CDLL(find_library("c"))
+    libc.labs.argtypes = [c_long]
+    libc.labs.restype = c_long
+    labs = libc.labs
+    monkeypatch.setattr(_helpers._SzLibraryRegistry, "declared", set())  # pylint: disable=W0212
+    monkeypatch.setattr(_helpers._SzLibraryRegistry, "handle", libc)  # pylint: disable=W0212
+    szmetrics.enable(phases=True)
+    libc.llabs.argtypes = [c_longlong]
+    libc.llabs.restype = c_longlong
+    _helpers.get_sz_library(lambda _: None)
+    stand_in = StandInSdk(libc)
+    assert libc.labs is not labs
+    assert stand_in.native(-1) == 2
+    with pytest.raises(SzSdkError):
+        stand_in.native("not an int")  # type: ignore[arg-type]
+    actual = szmetrics.snapshot()["StandInSdk.native"]
+    assert set(actual["phases"]) == set(szmetrics.PHASES)
+    assert actual["phases"]["native"]["count"] == 2
+    assert actual["phases"]["native"]["max_ms"] > 0
+    assert actual["phases"]["exception"]["max_ms"] > 0
+    szmetrics.disable()
+    assert libc.labs is labs
+    assert stand_in.native(-1) == 2
+
+
+# -----------------------------------------------------------------------------
+# Utilities
+# -----------------------------------------------------------------------------
+
+
+class StandInLibrary:  # pylint: disable=R0903
+    """A Senzing library stand-in, its _helper functions return an empty response and other functions 0."""
+
+    def __getattr__(self, name: str) -> Any:
+        if name.endswith("_helper"):
+            return lambda *args: SimpleNamespace(return_code=0, response=None)
+        return lambda *args: 0
+
+
+def stand_in_sdk_object(sdk_class: Type[Any]) -> Any:
+    """Return an sdk_class object using StandInLibrary, without loading the Senzing library."""
+    result = object.__new__(sdk_class)
+    result._is_destroyed = False  # pylint: disable=W0212
+    result._library_handle = StandInLibrary()  # pylint: disable=W0212
+    result._check_result = lambda return_code: None  # pylint: disable=W0212
+    result._response_as_str = lambda response: ""  # pylint: disable=W0212
+    return result
+
+
+class StandInSdk:
+    """An SDK class stand-in, its methods are decorated by sdk_method."""
+
+    _is_destroyed = False
+
+    def __init__(self, library_handle: Any = None) -> None:
+        self._library_handle = library_handle
+
+    @sdk_method
+    def method(self, value: int) -> int:
+        """Stand-in SDK method, raises SzNotFoundError for negative values."""
+        if value < 0:
+            raise SzNotFoundError(value)
+        return value + 1
+
+    @sdk_method
+    def native(self, value: int) -> int:
+        """Stand-in SDK method calling the library's labs() and llabs()."""
+        return self._library_handle.labs(value) + self._library_handle.llabs(value)  # type: ignore[no-any-return]
+
+
+# -----------------------------------------------------------------------------
+# Fixtures
+# -----------------------------------------------------------------------------
+
+
+@pytest.fixture(name="metrics", autouse=True)
+def metrics_fixture() -> Iterator[None]:
+    """Record metrics for each test, from zero."""
+    szmetrics.reset()
+    szmetrics.enable()
+    yield
+    szmetrics.disable()
+    szmetrics.reset()
+
+
+@pytest.fixture(name="sz_engine", scope="function")
+def szengine_fixture(engine_vars: Dict[Any, Any]) -> SzEngine:
+    """
+    SzEngine object to use for all tests.
+    engine_vars is returned from conftest.py.
+    """
+    result = SzEngineCore()
+    result._initialize(  # pylint: disable=W0212
+        engine_vars["INSTANCE_NAME"],
+        engine_vars["SETTINGS"],
+    )
+    return result
@@ -0,0 +1,251 @@
+#! /usr/bin/env python3
+
+"""
+szprometheus_test.py
+"""
+
+import time
+import urllib.request
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List
+
+import pytest
+from senzing import SzAbstractFactory, SzError, SzNotFoundError, SzSdkError
+
+from senzing_core import SzAbstractFactoryCore, SzEngineCore, SzPrometheusExporter
+from senzing_core._helpers import sdk_method
+
+OPERATIONS = {
+    "StandInEngine.add_record": "add",
+    "StandInEngine.get_record": "get",
+}
+
+# -----------------------------------------------------------------------------
+# Test cases
+# -----------------------------------------------------------------------------
+
+
+def test_redo_queue_depth(sz_abstractfactory: SzAbstractFactory) -> None:
+    """Test the redo queue depth of an SzEngineCore is rendered."""
+    sz_engine = sz_abstractfactory.create_engine()
+    with SzPrometheusExporter(sz_engine) as sz_prometheus_exporter:
+        actual = sz_prometheus_exporter.render()
+    assert f"senzing_engine_redo_queue_depth {sz_engine.count_redo_records()}\n" in actual
+
+
+def test_render(sz_prometheus_exporter: SzPrometheusExporter) -> None:
+    """Test calls, errors and durations are rendered by operation and other methods aren't counted."""
+    stand_in = StandInEngine()
+    stand_in.add_record("1001")
+    stand_in.add_record("1002")
+    with pytest.raises(SzNotFoundError):
+        stand_in.get_record("")
+    stand_in.count_redo_records()
+    actual = sz_prometheus_exporter.render()
+    assert "# TYPE senzing_engine_calls_total counter\n" in actual
+    assert 'senzing_engine_calls_total{operation="add"} 2\n' in actual
+    assert 'senzing_engine_calls_total{operation="get"} 1\n' in actual
+    assert 'senzing_engine_errors_total{operation="get",error_type="SzNotFoundError"} 1\n' in actual
+    assert "# TYPE senzing_engine_call_duration_seconds histogram\n" in actual
+    assert 'senzing_engine_call_duration_seconds_bucket{operation="add",le="10.0"} 2\n' in actual
+    assert 'senzing_engine_call_duration_seconds_bucket{operation="add",le="+Inf"} 2\n' in actual
+    assert 'senzing_engine_call_duration_seconds_count{operation="add"} 2\n' in actual
+    assert 'senzing_engine_call_duration_seconds_sum{operation="add"} ' in actual
+    assert "count_redo_records" not in actual
+    assert "senzing_engine_redo_queue_depth" not in actual
+
+
+def test_default_operations_redo() -> None:
+    """Test SzEngineCore.get_redo_record() and process_redo_record() are counted as the redo operation by default."""
+    with SzPrometheusExporter() as sz_prometheus_exporter:
+        stand_in = RedoEngine()
+        redo_record = stand_in.get_redo_record()
+        stand_in.process_redo_record(redo_record)
+        actual = sz_prometheus_exporter.render()
+    assert 'senzing_engine_calls_total{operation="redo"} 2\n' in actual
+
+
+def test_render_buckets_cumulative() -> None:
+    """Test histogram buckets count the calls at or below their upper bound."""
+    with SzPrometheusExporter(operations=OPERATIONS, buckets=(0.01, 0.05)) as sz_prometheus_exporter:
+        stand_in = StandInEngine()
+        stand_in.add_record("1001")
+        stand_in.add_record("1002", delay=0.02)
+        stand_in.add_record("1003", delay=0.06)
+        actual = sz_prometheus_exporter.render()
+    assert 'senzing_engine_call_duration_seconds_bucket{operation="add",le="0.01"} 1\n' in actual
+    assert 'senzing_engine_call_duration_seconds_bucket{operation="add",le="0.05"} 2\n' in actual
+    assert 'senzing_engine_call_duration_seconds_bucket{operation="add",le="+Inf"} 3\n' in actual
+
+
+def test_redo_queue_depth_error() -> None:
+    """Test the redo queue depth is left out when counting the redo records fails."""
+    stand_in = StandInEngine()
+    sz_prometheus_exporter = SzPrometheusExporter(stand_in, operations=OPERATIONS)  # type: ignore[arg-type]
+    assert "senzing_engine_redo_queue_depth 5\n" in sz_prometheus_exporter.render()
+    stand_in.redo_error = True
+    assert "senzing_engine_redo_queue_depth" not in sz_prometheus_exporter.render()
+
+
+def test_stop(sz_prometheus_exporter: SzPrometheusExporter) -> None:
+    """Test calls aren't counted once stopped and counts already made are kept."""
+    stand_in = StandInEngine()
+    stand_in.add_record("1001")
+    sz_prometheus_exporter.stop()
+    stand_in.add_record("1002")
+    assert 'senzing_engine_calls_total{operation="add"} 1\n' in sz_prometheus_exporter.render()
+
+
+def test_serve_http(sz_prometheus_exporter: SzPrometheusExporter) -> None:
+    """Test the metrics are served over HTTP until stopped."""
+    StandInEngine().add_record("1001")
+    host, port = sz_prometheus_exporter.serve_http()
+    with pytest.raises(SzSdkError):
+        sz_prometheus_exporter.serve_http()
+    with urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=5) as response:
+        assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+        body = response.read().decode("utf-8")
+    assert 'senzing_engine_calls_total{operation="add"} 1\n' in body
+    sz_prometheus_exporter.stop()
+    with pytest.raises(OSError):
+        urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=5)  # pylint: disable=R1732
+
+
+def test_write_textfile(sz_prometheus_exporter: SzPrometheusExporter, tmp_path: Path) -> None:
+    """Test the metrics are written to a file once and on an interval until stopped."""
+    path = tmp_path / "senzing.prom"
+    sz_prometheus_exporter.write_textfile(str(path))
+    assert "senzing_engine_calls_total" in path.read_text(encoding="utf-8")
+
+    stand_in = StandInEngine()
+    sz_prometheus_exporter.start_textfile(str(path), interval=0.01)
+    stand_in.add_record("1001")
+    deadline = time.monotonic() + 5
+    while 'operation="add"} 1\n' not in path.read_text(encoding="utf-8") and time.monotonic() < deadline:
+        time.sleep(0.01)
+    sz_prometheus_exporter.stop()
+    assert 'senzing_engine_calls_total{operation="add"} 1\n' in path.read_text(encoding="utf-8")
+    assert [item.name for item in tmp_path.iterdir()] == ["senzing.prom"]
+
+
+def test_write_textfile_render_error(
+    sz_prometheus_exporter: SzPrometheusExporter, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the temporary file is removed when rendering the metrics fails."""
+
+    def render() -> str:
+        raise SzError("SENZ2207|Data manager failed")
+
+    monkeypatch.setattr(sz_prometheus_exporter, "render", render)
+    with pytest.raises(SzError):
+        sz_prometheus_exporter.write_textfile(str(tmp_path / "senzing.prom"))
+    assert not list(tmp_path.iterdir())
+
+
+def test_start_textfile_errors(sz_prometheus_exporter: SzPrometheusExporter, tmp_path: Path) -> None:
+    """Test errors writing the file in the background are counted and writing carries on once they clear."""
+    path = tmp_path / "missing" / "senzing.prom"
+    sz_prometheus_exporter.start_textfile(str(path), interval=0.01)
+    deadline = time.monotonic() + 5
+    while sz_prometheus_exporter.errors < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert sz_prometheus_exporter.errors >= 2
+    assert isinstance(sz_prometheus_exporter.last_error, OSError)
+    path.parent.mkdir()
+    while not path.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    sz_prometheus_exporter.stop()
+    assert "senzing_engine_calls_total" in path.read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize("buckets", [(), (0.5, 0.1), (0.1, 0.1)])
+def test_bad_buckets(buckets: List[float]) -> None:
+    """Test SzPrometheusExporter() with buckets that are empty or not in ascending order."""
+    with pytest.raises(SzSdkError):
+        SzPrometheusExporter(buckets=tuple(buckets))
+
+
+def test_bad_interval(sz_prometheus_exporter: SzPrometheusExporter, tmp_path: Path) -> None:
+    """Test start_textfile() with an interval that isn't greater than 0."""
+    with pytest.raises(SzSdkError):
+        sz_prometheus_exporter.start_textfile(str(tmp_path / "senzing.prom"), interval=0)
+
+
+# -----------------------------------------------------------------------------
+# Utilities
+# -----------------------------------------------------------------------------
+
+
+class StandInEngine:
+    """An SzEngine stand-in, its methods are decorated by sdk_method."""
+
+    _is_destroyed = False
+
+    def __init__(self) -> None:
+        self.redo_error = False
+
+    @sdk_method
+    def add_record(self, record_id: str, delay: float = 0.0) -> str:
+        """Stand-in SzEngine.add_record(), sleeps for delay seconds."""
+        time.sleep(delay)
+        return record_id
+
+    @sdk_method
+    def count_redo_records(self) -> int:
+        """Stand-in SzEngine.count_redo_records(), raises SzError if redo_error is set."""
+        if self.redo_error:
+            raise SzError("SENZ2207|Data manager failed")
+        return 5
+
+    @sdk_method
+    def get_record(self, record_id: str) -> str:
+        """Stand-in SzEngine.get_record(), raises SzNotFoundError for an empty record_id."""
+        if not record_id:
+            raise SzNotFoundError("SENZ0033|Unknown record")
+        return record_id
+
+
+class StandInLibrary:
+    """A Senzing library stand-in for the redo functions."""
+
+    def Sz_getRedoRecord_helper(self) -> Any:  # pylint: disable=C0103
+        """Stand-in Sz_getRedoRecord_helper()."""
+        return SimpleNamespace(return_code=0, response='{"REASON":"stand-in"}')
+
+    def Sz_processRedoRecord(self, _redo_record: Any) -> int:  # pylint: disable=C0103
+        """Stand-in Sz_processRedoRecord()."""
+        return 0
+
+
+class RedoEngine(SzEngineCore):
+    """An SzEngineCore using StandInLibrary, doesn't load the Senzing library."""
+
+    def __init__(self, **kwargs: Any) -> None:  # pylint: disable=W0231
+        _ = kwargs
+        self._is_destroyed = False
+        self._library_handle = StandInLibrary()  # type: ignore[assignment]
+        self._check_result = lambda return_code: None  # type: ignore[assignment]
+        self._response_as_str = lambda result: result.response  # type: ignore[assignment]
+        self._sdk_flags_mask = 0
+
+
+# -----------------------------------------------------------------------------
+# Fixtures
+# -----------------------------------------------------------------------------
+
+
+@pytest.fixture(name="sz_prometheus_exporter")
+def szprometheusexporter_fixture() -> Iterator[SzPrometheusExporter]:
+    """SzPrometheusExporter counting StandInEngine calls for the test."""
+    with SzPrometheusExporter(operations=OPERATIONS) as result:
+        yield result
+
+
+@pytest.fixture(name="sz_abstractfactory", scope="function")
+def szabstractfactory_fixture(engine_vars: Dict[Any, Any]) -> SzAbstractFactory:
+    """
+    SzAbstractFactory object to use for all tests.
+    """
+    result = SzAbstractFactoryCore(instance_name="Example", settings=engine_vars.get("SETTINGS_DICT", {}))
+    return result
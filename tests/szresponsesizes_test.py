@@ -0,0 +1,120 @@
+#! /usr/bin/env python3
+
+"""
+szresponsesizes_test.py
+"""
+
+from typing import Iterator
+
+import pytest
+from senzing import SzEngineFlags, SzSdkError
+
+from senzing_core import SzResponseSizeTracker
+from senzing_core._helpers import sdk_method
+
+# -----------------------------------------------------------------------------
+# Test cases
+# -----------------------------------------------------------------------------
+
+
+def test_sizes_by_flags(sz_response_size_tracker: SzResponseSizeTracker) -> None:
+    """Test response sizes are tracked by method and flags, in UTF-8 bytes."""
+    stand_in = StandInSdk()
+    stand_in.get_entity(1, 100)
+    stand_in.get_entity(2, 300)
+    stand_in.get_entity(3, 50, flags=SzEngineFlags.SZ_ENTITY_BRIEF_DEFAULT_FLAGS)
+    stand_in.get_version("é" * 10)
+    stand_in.count()
+    actual = sz_response_size_tracker.snapshot()
+    assert set(actual) == {"StandInSdk.get_entity", "StandInSdk.get_version"}
+    by_flags = actual["StandInSdk.get_entity"]["flags"]
+    assert set(by_flags) == {SzEngineFlags.SZ_ENTITY_DEFAULT_FLAGS, SzEngineFlags.SZ_ENTITY_BRIEF_DEFAULT_FLAGS}
+    default_flags = by_flags[SzEngineFlags.SZ_ENTITY_DEFAULT_FLAGS]
+    assert default_flags["count"] == 2
+    assert default_flags["total_bytes"] == 400
+    assert default_flags["min_bytes"] == 100
+    assert default_flags["mean_bytes"] == 200.0
+    assert default_flags["max_bytes"] == 300
+    assert by_flags[SzEngineFlags.SZ_ENTITY_BRIEF_DEFAULT_FLAGS]["count"] == 1
+    assert actual["StandInSdk.get_version"]["flags"][None]["max_bytes"] == 20
+
+
+def test_largest(sz_response_size_tracker: SzResponseSizeTracker) -> None:
+    """Test the top_n largest responses are kept with their arguments, largest first."""
+    stand_in = StandInSdk()
+    for entity_id, size in enumerate((10, 500, 30, 400, 20, 600)):
+        stand_in.get_entity(entity_id, size)
+    actual = sz_response_size_tracker.snapshot()["StandInSdk.get_entity"]["largest"]
+    assert actual == [
+        {"bytes": 600, "flags": SzEngineFlags.SZ_ENTITY_DEFAULT_FLAGS, "arguments": {"entity_id": 5, "size": 600}},
+        {"bytes": 500, "flags": SzEngineFlags.SZ_ENTITY_DEFAULT_FLAGS, "arguments": {"entity_id": 1, "size": 500}},
+        {"bytes": 400, "flags": SzEngineFlags.SZ_ENTITY_DEFAULT_FLAGS, "arguments": {"entity_id": 3, "size": 400}},
+    ]
+
+
+def test_top_n_zero() -> None:
+    """Test no responses are kept with a top_n of 0."""
+    with SzResponseSizeTracker(top_n=0) as sz_response_size_tracker:
+        StandInSdk().get_entity(1, 100)
+    actual = sz_response_size_tracker.snapshot()["StandInSdk.get_entity"]
+    assert actual["largest"] == []
+    assert actual["flags"][SzEngineFlags.SZ_ENTITY_DEFAULT_FLAGS]["count"] == 1
+
+
+def test_stop_and_reset(sz_response_size_tracker: SzResponseSizeTracker) -> None:
+    """Test sizes aren't tracked once stopped and reset() discards those tracked."""
+    stand_in = StandInSdk()
+    stand_in.get_entity(1, 100)
+    sz_response_size_tracker.stop()
+    sz_response_size_tracker.stop()
+    stand_in.get_entity(2, 100)
+    by_flags = sz_response_size_tracker.snapshot()["StandInSdk.get_entity"]["flags"]
+    assert by_flags[SzEngineFlags.SZ_ENTITY_DEFAULT_FLAGS]["count"] == 1
+    sz_response_size_tracker.reset()
+    assert not sz_response_size_tracker.snapshot()
+
+
+@pytest.mark.parametrize("top_n, max_argument_length", [(-1, 256), (10, 0)])
+def test_bad_arguments(top_n: int, max_argument_length: int) -> None:
+    """Test SzResponseSizeTracker() with arguments out of range."""
+    with pytest.raises(SzSdkError):
+        SzResponseSizeTracker(top_n=top_n, max_argument_length=max_argument_length)
+
+
+# -----------------------------------------------------------------------------
+# Utilities
+# -----------------------------------------------------------------------------
+
+
+class StandInSdk:
+    """An SDK class stand-in, its methods are decorated by sdk_method."""
+
+    _is_destroyed = False
+
+    @sdk_method
+    def count(self) -> int:
+        """Stand-in SDK method without a response."""
+        return 1
+
+    @sdk_method
+    def get_entity(self, entity_id: int, size: int, flags: int = SzEngineFlags.SZ_ENTITY_DEFAULT_FLAGS) -> str:
+        """Stand-in SDK method, returns a response of size characters."""
+        _ = entity_id, flags
+        return "x" * size
+
+    @sdk_method
+    def get_version(self, response: str) -> str:
+        """Stand-in SDK method without flags."""
+        return response
+
+
+# -----------------------------------------------------------------------------
+# Fixtures
+# -----------------------------------------------------------------------------
+
+
+@pytest.fixture(name="sz_response_size_tracker")
+def szresponsesizetracker_fixture() -> Iterator[SzResponseSizeTracker]:
+    """SzResponseSizeTracker keeping the 3 largest responses, for the test."""
+    with SzResponseSizeTracker(top_n=3) as result:
+        yield result
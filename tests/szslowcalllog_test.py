@@ -0,0 +1,195 @@
+#! /usr/bin/env python3
+
+"""
+szslowcalllog_test.py
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from senzing import SzEngineFlags, SzNotFoundError, SzSdkError
+
+from senzing_core import SzSlowCallLog
+from senzing_core._helpers import sdk_method
+
+# -----------------------------------------------------------------------------
+# Test cases
+# -----------------------------------------------------------------------------
+
+
+def test_slow_calls_logged(tmp_path: Path) -> None:
+    """Test calls over the threshold are logged with their arguments and errors, faster calls aren't."""
+    path = tmp_path / "slow_calls.jsonl"
+    stand_in = StandInSdk()
+    with SzSlowCallLog(str(path), threshold_ms=20) as sz_slow_call_log:
+        stand_in.search('{"NAME_FULL": "Robert Smith"}', delay=0.03)
+        stand_in.search('{"NAME_FULL": "Bob Smith"}')
+        with pytest.raises(SzNotFoundError):
+            stand_in.search("", delay=0.03, flags=SzEngineFlags.SZ_SEARCH_INCLUDE_STATS)
+    first, second = read_log(path)
+    assert first["method"] == "StandInSdk.search"
+    assert first["duration_ms"] >= 20
+    assert first["arguments"] == {
+        "attributes": '{"NAME_FULL": "Robert Smith"}',
+        "delay": 0.03,
+        "flags": SzEngineFlags.SZ_SEARCH_BY_ATTRIBUTES_DEFAULT_FLAGS,
+    }
+    assert first["error_type"] is None
+    assert first["time"] <= second["time"]
+    assert second["arguments"]["flags"] == SzEngineFlags.SZ_SEARCH_INCLUDE_STATS
+    assert second["error_type"] == "SzNotFoundError"
+    assert sz_slow_call_log.stats() == {"dropped": 0, "errors": 0, "logged": 2}
+
+
+def test_method_thresholds(tmp_path: Path) -> None:
+    """Test method thresholds override the threshold for their methods."""
+    path = tmp_path / "slow_calls.jsonl"
+    stand_in = StandInSdk()
+    with SzSlowCallLog(str(path), threshold_ms=60_000, method_thresholds_ms={"StandInSdk.add": 0}):
+        stand_in.add("1001")
+        stand_in.search("{}")
+    assert [entry["method"] for entry in read_log(path)] == ["StandInSdk.add"]
+
+
+def test_arguments_truncated(tmp_path: Path) -> None:
+    """Test long arguments are truncated to max_argument_length."""
+    path = tmp_path / "slow_calls.jsonl"
+    with SzSlowCallLog(str(path), threshold_ms=0, max_argument_length=10):
+        StandInSdk().search("x" * 25)
+    (entry,) = read_log(path)
+    assert entry["arguments"]["attributes"] == "xxxxxxxxxx...(+15 chars)"
+
+
+def test_arguments_summarized(tmp_path: Path) -> None:
+    """Test arguments that aren't strings are summarized by a bounded repr."""
+    path = tmp_path / "slow_calls.jsonl"
+    with SzSlowCallLog(str(path), threshold_ms=0, max_argument_length=30):
+        StandInSdk().add(list(range(1_000_000)))  # type: ignore[arg-type]
+    (entry,) = read_log(path)
+    assert entry["arguments"]["record_id"] == "[0, 1, 2, 3, 4, 5, ...]"
+
+
+def test_rotation(tmp_path: Path) -> None:
+    """Test the file is rotated at max_bytes, keeping backup_count files."""
+    path = tmp_path / "slow_calls.jsonl"
+    stand_in = StandInSdk()
+    with SzSlowCallLog(str(path), threshold_ms=0, max_bytes=1, backup_count=2):
+        for record_id in ("1", "2", "3", "4"):
+            stand_in.add(record_id)
+    assert sorted(item.name for item in tmp_path.iterdir()) == [
+        "slow_calls.jsonl",
+        "slow_calls.jsonl.1",
+        "slow_calls.jsonl.2",
+    ]
+    assert not read_log(path)
+    assert read_log(tmp_path / "slow_calls.jsonl.1")[0]["arguments"]["record_id"] == "4"
+    assert read_log(tmp_path / "slow_calls.jsonl.2")[0]["arguments"]["record_id"] == "3"
+
+
+def test_rotation_without_backups(tmp_path: Path) -> None:
+    """Test the file is truncated at max_bytes with a backup_count of 0."""
+    path = tmp_path / "slow_calls.jsonl"
+    with SzSlowCallLog(str(path), threshold_ms=0, max_bytes=1, backup_count=0):
+        StandInSdk().add("1")
+    assert [item.name for item in tmp_path.iterdir()] == ["slow_calls.jsonl"]
+    assert not read_log(path)
+
+
+def test_rotation_error(tmp_path: Path) -> None:
+    """Test errors rotating the file are counted and slow calls are still logged."""
+    path = tmp_path / "slow_calls.jsonl"
+    (tmp_path / "slow_calls.jsonl.1").mkdir()
+    (tmp_path / "slow_calls.jsonl.1" / "blocker").touch()
+    stand_in = StandInSdk()
+    with SzSlowCallLog(str(path), threshold_ms=0, max_bytes=1, backup_count=1) as sz_slow_call_log:
+        for record_id in ("1", "2", "3"):
+            stand_in.add(record_id)
+    assert [entry["arguments"]["record_id"] for entry in read_log(path)] == ["1", "2", "3"]
+    assert sz_slow_call_log.stats() == {"dropped": 0, "errors": 3, "logged": 3}
+
+
+def test_stop_timeout(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test stop() drops the slow calls waiting and returns after timeout when the writer thread is stuck."""
+    path = tmp_path / "slow_calls.jsonl"
+    stuck = threading.Event()
+    sz_slow_call_log = SzSlowCallLog(str(path), threshold_ms=0, max_pending=1)
+    monkeypatch.setattr(sz_slow_call_log, "_write", lambda file: (stuck.wait(), file.close()))
+    sz_slow_call_log.start()
+    StandInSdk().add("1")
+    start = time.monotonic()
+    sz_slow_call_log.stop(timeout=0.1)
+    assert time.monotonic() - start < 5
+    assert sz_slow_call_log.stats()["dropped"] == 1
+    stuck.set()
+
+
+def test_stop(tmp_path: Path) -> None:
+    """Test calls aren't logged once stopped, the log can be started again and appends."""
+    path = tmp_path / "slow_calls.jsonl"
+    stand_in = StandInSdk()
+    sz_slow_call_log = SzSlowCallLog(str(path), threshold_ms=0)
+    sz_slow_call_log.start()
+    with pytest.raises(SzSdkError):
+        sz_slow_call_log.start()
+    stand_in.add("1")
+    sz_slow_call_log.stop()
+    sz_slow_call_log.stop()
+    stand_in.add("2")
+    with sz_slow_call_log:
+        stand_in.add("3")
+    assert [entry["arguments"]["record_id"] for entry in read_log(path)] == ["1", "3"]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"threshold_ms": -1},
+        {"method_thresholds_ms": {"StandInSdk.add": -1}},
+        {"max_argument_length": 0},
+        {"max_bytes": 0},
+        {"max_pending": 0},
+        {"backup_count": -1},
+    ],
+)
+def test_bad_arguments(kwargs: Dict[str, Any], tmp_path: Path) -> None:
+    """Test SzSlowCallLog() with arguments out of range."""
+    with pytest.raises(SzSdkError):
+        SzSlowCallLog(str(tmp_path / "slow_calls.jsonl"), **kwargs)
+
+
+# -----------------------------------------------------------------------------
+# Utilities
+# -----------------------------------------------------------------------------
+
+
+def read_log(path: Path) -> List[Dict[str, Any]]:
+    """Return the entries of a slow call log."""
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+class StandInSdk:
+    """An SDK class stand-in, its methods are decorated by sdk_method."""
+
+    _is_destroyed = False
+
+    @sdk_method
+    def add(self, record_id: str) -> str:
+        """Stand-in SDK method."""
+        return record_id
+
+    @sdk_method
+    def search(
+        self,
+        attributes: str,
+        delay: float = 0.0,
+        flags: int = SzEngineFlags.SZ_SEARCH_BY_ATTRIBUTES_DEFAULT_FLAGS,
+    ) -> str:
+        """Stand-in SDK method, sleeps for delay seconds and raises SzNotFoundError for empty attributes."""
+        time.sleep(delay)
+        if not attributes:
+            raise SzNotFoundError("SENZ0033|Unknown record")
+        return f"{attributes}{flags}"
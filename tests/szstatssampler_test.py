@@ -0,0 +1,195 @@
+#! /usr/bin/env python3
+
+"""
+szstatssampler_test.py
+"""
+
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import pytest
+from senzing import SzEngine, SzError, SzSdkError
+
+from senzing_core import SzEngineCore, SzStatsSampler
+from senzing_core.szstatssampler import _parse_stats
+
+# -----------------------------------------------------------------------------
+# Test cases
+# -----------------------------------------------------------------------------
+
+
+def test_sample(sz_engine: SzEngine) -> None:
+    """Test SzStatsSampler.sample() with an SzEngineCore."""
+    sz_stats_sampler = SzStatsSampler(sz_engine)
+    assert sz_stats_sampler.sample() is None
+    actual = sz_stats_sampler.sample()
+    assert actual is not None
+    assert "addedRecords" in actual["counters"]
+
+
+def test_parse_stats() -> None:
+    """Test a get_stats() response is flattened to counters and gauges by dotted name."""
+    actual = _parse_stats(stats_json(addedRecords=10, redoTriggers=[{"NAME": 2}, {"DOB": 3}]))
+    assert actual["counters"]["addedRecords"] == 10
+    assert actual["counters"]["lockWaits.countRefreshLocks"] == 1
+    assert actual["counters"]["redoTriggers"] == 5
+    assert actual["counters"]["redoTriggers.DOB"] == 3
+    assert actual["counters"]["cacheHit"] == 0
+    assert "apiVersion" not in actual["counters"]
+    assert "loadedRecords" not in actual["counters"]
+    assert actual["gauges"]["threadState.active"] == 4
+    assert actual["gauges"]["systemResources.currResources.workerThreads"] == 8
+    assert actual["gauges"]["systemResources.currResources.systemLoad.cpuUser"] == 5.5
+    assert "systemResources.initResources.totalMemory" not in actual["gauges"]
+    assert not any(name.startswith("threadState") for name in actual["counters"])
+
+
+def test_rate_and_trend() -> None:
+    """Test rates and trends over the most recent samples."""
+    stand_in = StandInEngine([100, 200, 300, 150])
+    sz_stats_sampler = SzStatsSampler(stand_in)  # type: ignore[arg-type]
+    assert sz_stats_sampler.sample() is None
+    for _ in range(4):
+        sample = sz_stats_sampler.sample()
+        assert sample is not None
+        sample["interval_seconds"] = 10.0
+    assert [sample["counters"]["addedRecords"] for sample in sz_stats_sampler.samples()] == [100, 200, 300, 150]
+    assert sz_stats_sampler.rate("addedRecords") == 18.75
+    assert sz_stats_sampler.rate("addedRecords", last=2) == 22.5
+    assert sz_stats_sampler.rate("notACounter") == 0.0
+    assert sz_stats_sampler.trend("addedRecords", last=2) == {"current": 22.5, "previous": 15.0, "change": 0.5}
+    assert sz_stats_sampler.trend("addedRecords", last=1) == {"current": 15.0, "previous": 30.0, "change": -0.5}
+    assert sz_stats_sampler.trend("addedRecords", last=4) == {"current": 18.75, "previous": 0.0, "change": 0.0}
+    assert len(sz_stats_sampler.samples(last=3)) == 3
+    assert not sz_stats_sampler.samples(last=0)
+
+
+def test_capacity() -> None:
+    """Test only the most recent capacity samples are kept."""
+    sz_stats_sampler = SzStatsSampler(StandInEngine([1, 2, 3, 4]), capacity=2)  # type: ignore[arg-type]
+    for _ in range(5):
+        sz_stats_sampler.sample()
+    assert [sample["counters"]["addedRecords"] for sample in sz_stats_sampler.samples()] == [3, 4]
+
+
+def test_start_and_stop() -> None:
+    """Test samples are taken in the background until stopped."""
+    stand_in = StandInEngine([1] * 1_000)
+    with SzStatsSampler(stand_in, interval=0.01) as sz_stats_sampler:  # type: ignore[arg-type]
+        with pytest.raises(SzSdkError):
+            sz_stats_sampler.start()
+        deadline = time.monotonic() + 5
+        while len(sz_stats_sampler.samples()) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    count = len(sz_stats_sampler.samples())
+    assert count >= 2
+    assert sz_stats_sampler.rate("addedRecords") > 0
+    time.sleep(0.05)
+    assert len(sz_stats_sampler.samples()) == count
+
+
+@pytest.mark.parametrize("error", [SzError("SENZ2207|Data manager failed"), ValueError("not a get_stats() response")])
+def test_background_errors(error: Exception) -> None:
+    """Test errors sampling in the background are counted and kept."""
+    stand_in = StandInEngine([])
+    stand_in.error = error
+    with SzStatsSampler(stand_in, interval=0.01) as sz_stats_sampler:  # type: ignore[arg-type]
+        deadline = time.monotonic() + 5
+        while not sz_stats_sampler.errors and time.monotonic() < deadline:
+            time.sleep(0.01)
+    assert sz_stats_sampler.errors >= 1
+    assert sz_stats_sampler.last_error is stand_in.error
+
+
+def test_sample_outside_lock() -> None:
+    """Test get_stats() is called without holding the sampler's lock, so reading the samples doesn't wait for it."""
+    stand_in = StandInEngine([1])
+    sz_stats_sampler = SzStatsSampler(stand_in)  # type: ignore[arg-type]
+    readers: List[threading.Thread] = []
+
+    def read_samples() -> None:
+        reader = threading.Thread(target=sz_stats_sampler.samples, daemon=True)
+        reader.start()
+        reader.join(5)
+        readers.append(reader)
+
+    stand_in.on_get_stats = read_samples
+    sz_stats_sampler.sample()
+    assert sz_stats_sampler.sample() is not None
+    assert len(readers) == 2
+    assert not any(reader.is_alive() for reader in readers)
+
+
+@pytest.mark.parametrize("interval, capacity", [(0.0, 10), (-1.0, 10), (1.0, 0)])
+def test_bad_arguments(interval: float, capacity: int) -> None:
+    """Test SzStatsSampler() with an interval or capacity out of range."""
+    with pytest.raises(SzSdkError):
+        SzStatsSampler(StandInEngine([]), interval=interval, capacity=capacity)  # type: ignore[arg-type]
+
+
+def test_bad_trend_window() -> None:
+    """Test SzStatsSampler.trend() with a window of less than 1 sample."""
+    with pytest.raises(SzSdkError):
+        SzStatsSampler(StandInEngine([])).trend("addedRecords", last=0)  # type: ignore[arg-type]
+
+
+# -----------------------------------------------------------------------------
+# Utilities
+# -----------------------------------------------------------------------------
+
+
+def stats_json(**workload: Any) -> str:
+    """Return a get_stats() response, overriding workload values."""
+    result: Dict[str, Any] = {
+        "apiVersion": "4.0.0.25134",
+        "loadedRecords": -1,
+        "addedRecords": 0,
+        "lockWaits": {"maxRefreshLocksMS": 2, "totalRefreshLocksMS": 3, "countRefreshLocks": 1},
+        "cacheHit": [],
+        "redoTriggers": [],
+        "threadState": {"active": 4, "idle": 4},
+        "systemResources": {
+            "initResources": [{"physicalCores": 10}, {"totalMemory": "31.3GB"}],
+            "currResources": [{"workerThreads": 8}, {"systemLoad": [{"cpuUser": 5.5}, {"cpuIdle": 90.0}]}],
+        },
+    }
+    result.update(workload)
+    return json.dumps({"workload": result})
+
+
+class StandInEngine:  # pylint: disable=R0903
+    """An SzEngine stand-in, get_stats() reports the next number of added records, the first call resets."""
+
+    def __init__(self, added_records: List[int]) -> None:
+        self.added_records = [0, *added_records]
+        self.error: Optional[Exception] = None
+        self.on_get_stats: Optional[Callable[[], None]] = None
+
+    def get_stats(self) -> str:
+        """Stand-in SzEngine.get_stats()."""
+        if self.on_get_stats is not None:
+            self.on_get_stats()
+        if self.error is not None:
+            raise self.error
+        return stats_json(addedRecords=self.added_records.pop(0) if self.added_records else 0)
+
+
+# -----------------------------------------------------------------------------
+# Fixtures
+# -----------------------------------------------------------------------------
+
+
+@pytest.fixture(name="sz_engine", scope="function")
+def szengine_fixture(engine_vars: Dict[Any, Any]) -> SzEngine:
+    """
+    SzEngine object to use for all tests.
+    engine_vars is returned from conftest.py.
+    """
+    result = SzEngineCore()
+    result._initialize(  # pylint: disable=W0212
+        engine_vars["INSTANCE_NAME"],
+        engine_vars["SETTINGS"],
+    )
+    return result
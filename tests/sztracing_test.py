@@ -0,0 +1,245 @@
+#! /usr/bin/env python3
+
+"""
+sztracing_test.py
+"""
+
+import json
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator
+
+import pytest
+from senzing import SzEngine, SzEngineFlags, SzError, SzNotFoundError, SzSdkError
+
+from senzing_core import SzEngineCore, sztracing
+from senzing_core._helpers import sdk_method
+
+# -----------------------------------------------------------------------------
+# Test cases
+# -----------------------------------------------------------------------------
+
+
+def test_engine_span(sz_engine: SzEngine, exporter: sztracing.InMemorySpanExporter) -> None:
+    """Test a span is exported for SzEngineCore calls."""
+    with pytest.raises(SzError):
+        sz_engine.get_record("NOT-A-DATA-SOURCE", "1")
+    (span,) = exporter.spans()
+    assert span["name"] == "SzEngineCore.get_record"
+    assert span["data_source_code"] == "NOT-A-DATA-SOURCE"
+    assert span["flags"] == SzEngineFlags.SZ_RECORD_DEFAULT_FLAGS
+    assert span["error_code"] is not None
+
+
+def test_redo_span(exporter: sztracing.InMemorySpanExporter) -> None:
+    """Test a span is exported for SzEngineCore.get_redo_record(), the redo loop's call without arguments."""
+    StandInEngine().get_redo_record()
+    (span,) = exporter.spans()
+    assert span["name"] == "SzEngineCore.get_redo_record"
+    assert span["response_size"] == len(REDO_RECORD)
+    assert span["flags"] is None
+
+
+def test_span(exporter: sztracing.InMemorySpanExporter) -> None:
+    """Test the method name, arguments and response size of a call are in its span."""
+    stand_in = StandInSdk()
+    stand_in.get_record("CUSTOMERS", "1001")
+    stand_in.get_record("CUSTOMERS", record_id="1002", flags=SzEngineFlags.SZ_ENTITY_INCLUDE_RECORD_JSON_DATA)
+    stand_in.get_count()
+    first, second, third = exporter.spans()
+    assert first["name"] == "StandInSdk.get_record"
+    assert first["data_source_code"] == "CUSTOMERS"
+    assert first["flags"] == SzEngineFlags.SZ_RECORD_DEFAULT_FLAGS
+    assert first["response_size"] == len('{"RECORD_ID": "1001"}')
+    assert first["duration_ns"] >= 0
+    assert first["start_time_ns"] <= second["start_time_ns"]
+    assert first["thread"] == threading.current_thread().name
+    assert first["error_type"] is None
+    assert second["flags"] == SzEngineFlags.SZ_ENTITY_INCLUDE_RECORD_JSON_DATA
+    assert third["data_source_code"] is None
+    assert third["flags"] is None
+    assert third["response_size"] is None
+
+
+def test_error_span(exporter: sztracing.InMemorySpanExporter) -> None:
+    """Test the type and Senzing error code of an error are in its span."""
+    stand_in = StandInSdk()
+    with pytest.raises(SzNotFoundError):
+        stand_in.get_record("CUSTOMERS", "")
+    (span,) = exporter.spans()
+    assert span["error_type"] == "SzNotFoundError"
+    assert span["error_code"] == 33
+    assert span["response_size"] is None
+
+
+def test_attributes(exporter: sztracing.InMemorySpanExporter) -> None:
+    """Test attributes are added to the spans of calls made in the with block, nested blocks add to them."""
+    stand_in = StandInSdk()
+    with sztracing.attributes(request_id="1", route="/records"):
+        stand_in.get_count()
+        with sztracing.attributes(request_id="2"):
+            stand_in.get_count()
+    stand_in.get_count()
+    assert [span["attributes"] for span in exporter.spans()] == [
+        {"request_id": "1", "route": "/records"},
+        {"request_id": "2", "route": "/records"},
+        {},
+    ]
+
+
+def test_sampling(exporter: sztracing.InMemorySpanExporter) -> None:
+    """Test sample_rate and min_duration_ms skip calls, except those raising errors."""
+    stand_in = StandInSdk()
+    sztracing.enable(exporter, sample_rate=0.0)
+    stand_in.get_count()
+    with pytest.raises(SzNotFoundError):
+        stand_in.get_record("CUSTOMERS", "")
+    sztracing.enable(exporter, min_duration_ms=60_000)
+    stand_in.get_count()
+    sztracing.enable(exporter, sample_rate=0.0, always_export_errors=False)
+    with pytest.raises(SzNotFoundError):
+        stand_in.get_record("CUSTOMERS", "")
+    assert [span["name"] for span in exporter.spans()] == ["StandInSdk.get_record"]
+
+
+@pytest.mark.parametrize("sample_rate, min_duration_ms", [(-0.1, 0.0), (1.1, 0.0), (1.0, -1.0)])
+def test_bad_sampling(sample_rate: float, min_duration_ms: float) -> None:
+    """Test sztracing.enable() with a sample_rate or min_duration_ms out of range."""
+    with pytest.raises(SzSdkError):
+        sztracing.enable(sztracing.InMemorySpanExporter(), sample_rate=sample_rate, min_duration_ms=min_duration_ms)
+
+
+def test_disable(exporter: sztracing.InMemorySpanExporter) -> None:
+    """Test sztracing.disable() stops exporting spans."""
+    stand_in = StandInSdk()
+    sztracing.disable()
+    assert not sztracing.is_enabled()
+    stand_in.get_count()
+    sztracing.disable()
+    assert not exporter.spans()
+
+
+def test_failing_exporter() -> None:
+    """Test a failing exporter doesn't fail the call."""
+
+    def exporter(span: sztracing.SzSpan) -> None:
+        raise RuntimeError(span["name"])
+
+    sztracing.enable(exporter)
+    assert StandInSdk().get_count() == 1
+
+
+def test_in_memory_exporter() -> None:
+    """Test InMemorySpanExporter keeps the most recent max_spans spans."""
+    exporter = sztracing.InMemorySpanExporter(max_spans=2)
+    sztracing.enable(exporter)
+    stand_in = StandInSdk()
+    for record_id in ("1", "2", "3"):
+        stand_in.get_record("CUSTOMERS", record_id)
+    assert [span["response_size"] for span in exporter.spans()] == [len('{"RECORD_ID": "2"}')] * 2
+    exporter.clear()
+    assert not exporter.spans()
+
+
+def test_jsonl_exporter(tmp_path: Path) -> None:
+    """Test JsonlSpanExporter appends a JSON document per span and discards spans once closed."""
+    path = tmp_path / "spans.jsonl"
+    stand_in = StandInSdk()
+    with sztracing.JsonlSpanExporter(str(path)) as exporter:
+        sztracing.enable(exporter)
+        with sztracing.attributes(request_id="1"):
+            stand_in.get_record("CUSTOMERS", "1001")
+    stand_in.get_count()
+    with sztracing.JsonlSpanExporter(str(path)) as exporter:
+        sztracing.enable(exporter)
+        stand_in.get_count()
+    spans = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [span["name"] for span in spans] == ["StandInSdk.get_record", "StandInSdk.get_count"]
+    assert spans[0]["data_source_code"] == "CUSTOMERS"
+    assert spans[0]["attributes"] == {"request_id": "1"}
+
+
+# -----------------------------------------------------------------------------
+# Utilities
+# -----------------------------------------------------------------------------
+
+
+class StandInSdk:
+    """An SDK class stand-in, its methods are decorated by sdk_method."""
+
+    _is_destroyed = False
+
+    @sdk_method
+    def get_count(self) -> int:
+        """Stand-in SDK method without a data source or flags."""
+        return 1
+
+    @sdk_method
+    def get_record(
+        self,
+        data_source_code: str,
+        record_id: str,
+        flags: int = SzEngineFlags.SZ_RECORD_DEFAULT_FLAGS,
+    ) -> str:
+        """Stand-in SDK method, raises SzNotFoundError for an empty record_id."""
+        _ = data_source_code, flags
+        if not record_id:
+            raise SzNotFoundError("SENZ0033|Unknown record")
+        return f'{{"RECORD_ID": "{record_id}"}}'
+
+
+REDO_RECORD = '{"REASON":"LIB_FEAT_ID[1] of FTYPE_ID[1] went generic","ENTITY_TYPE":"GENERIC"}'
+
+
+class StandInLibrary:  # pylint: disable=R0903
+    """A Senzing library stand-in returning a redo record."""
+
+    def Sz_getRedoRecord_helper(self) -> Any:  # pylint: disable=C0103
+        """Stand-in Sz_getRedoRecord_helper()."""
+        return SimpleNamespace(return_code=0, response=REDO_RECORD)
+
+
+class StandInEngine(SzEngineCore):
+    """An SzEngineCore using StandInLibrary, doesn't load the Senzing library."""
+
+    def __init__(self, **kwargs: Any) -> None:  # pylint: disable=W0231
+        _ = kwargs
+        self._is_destroyed = False
+        self._library_handle = StandInLibrary()  # type: ignore[assignment]
+        self._response_as_str = lambda result: result.response  # type: ignore[assignment]
+
+
+# -----------------------------------------------------------------------------
+# Fixtures
+# -----------------------------------------------------------------------------
+
+
+@pytest.fixture(name="exporter")
+def exporter_fixture() -> Iterator[sztracing.InMemorySpanExporter]:
+    """Export spans in memory for the test."""
+    result = sztracing.InMemorySpanExporter()
+    sztracing.enable(result)
+    yield result
+    sztracing.disable()
+
+
+@pytest.fixture(name="tracing", autouse=True)
+def tracing_fixture() -> Iterator[None]:
+    """Stop tracing after each test."""
+    yield
+    sztracing.disable()
+
+
+@pytest.fixture(name="sz_engine", scope="function")
+def szengine_fixture(engine_vars: Dict[Any, Any]) -> SzEngine:
+    """
+    SzEngine object to use for all tests.
+    engine_vars is returned from conftest.py.
+    """
+    result = SzEngineCore()
+    result._initialize(  # pylint: disable=W0212
+        engine_vars["INSTANCE_NAME"],
+        engine_vars["SETTINGS"],
+    )
+    return result